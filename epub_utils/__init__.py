@@ -1,4 +1,15 @@
-from epub_utils.container import Container
-from epub_utils.doc import Document
-
 __all__ = ['Document', 'Container']
+
+
+def __getattr__(name):
+	# Resolve the public classes on first access so that importing a submodule
+	# (e.g. ``epub_utils.cli``) does not pull in lxml and the parsing stack.
+	if name == 'Document':
+		from epub_utils.doc import Document
+
+		return Document
+	if name == 'Container':
+		from epub_utils.container import Container
+
+		return Container
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,9 +1,8 @@
 import click
 
-from epub_utils.doc import Document
 from epub_utils.exceptions import (
 	EPUBError,
-	FileNotFoundError,
+	EPUBFileNotFoundError,
 )
 
 VERSION = '0.1.0a1'
@@ -19,6 +18,17 @@ def format_error_message(e: Exception) -> str:
 		return str(e)
 
 
+def _get_document(ctx):
+	"""Open the command's EPUB, deferring the parsing stack import until needed.
+
+	The document is registered with the click context so its archive is closed
+	when the command finishes.
+	"""
+	from epub_utils.doc import Document
+
+	return ctx.with_resource(Document(ctx.obj['path']))
+
+
 def print_version(ctx, param, value):
 	if not value or ctx.resilient_parsing:
 		return
@@ -71,13 +81,48 @@ def pretty_print_option():
 	)
 
 
+class EchoWriter:
+	"""
+	File-like object that forwards writes to ``click.echo`` in bounded chunks.
+
+	Writing through ``click.echo`` keeps its ANSI stripping for non-terminal
+	output, while buffering avoids a flush for every highlighted token.
+	"""
+
+	CHUNK_SIZE = 64 * 1024
+
+	def __init__(self):
+		self._parts = []
+		self._size = 0
+
+	def write(self, text: str) -> None:
+		self._parts.append(text)
+		self._size += len(text)
+		if self._size >= self.CHUNK_SIZE:
+			self.flush()
+
+	def flush(self) -> None:
+		if self._parts:
+			click.echo(''.join(self._parts), nl=False)
+			self._parts = []
+			self._size = 0
+
+
+def echo_xml(part, pretty_print=False):
+	"""Stream a part's highlighted XML to stdout followed by a newline."""
+	writer = EchoWriter()
+	part.to_xml_stream(writer, pretty_print=pretty_print)
+	writer.flush()
+	click.echo()
+
+
 def output_document_part(doc, part_name, format, pretty_print=False):
 	"""Helper function to output document parts in the specified format."""
 	part = getattr(doc, part_name)
 	if format == 'raw':
 		click.echo(part.to_str(pretty_print=pretty_print))
 	elif format == 'xml':
-		click.echo(part.to_xml(pretty_print=pretty_print))
+		echo_xml(part, pretty_print)
 	elif format == 'kv':
 		if hasattr(part, 'to_kv') and callable(getattr(part, 'to_kv')):
 			click.echo(part.to_kv())
@@ -153,7 +198,7 @@ def format_files_table(files_info: list) -> str:
 def container(ctx, format, pretty_print):
 	"""Outputs the container information of the EPUB file."""
 	try:
-		doc = Document(ctx.obj['path'])
+		doc = _get_document(ctx)
 		output_document_part(doc, 'container', format, pretty_print)
 	except EPUBError as e:
 		click.secho('EPUB Error:', fg='red', bold=True, err=True)
@@ -171,7 +216,7 @@ def container(ctx, format, pretty_print):
 @click.pass_context
 def package(ctx, format, pretty_print):
 	"""Outputs the package information of the EPUB file."""
-	doc = Document(ctx.obj['path'])
+	doc = _get_document(ctx)
 	output_document_part(doc, 'package', format, pretty_print)
 
 
@@ -193,7 +238,7 @@ def package(ctx, format, pretty_print):
 @click.pass_context
 def toc(ctx, format, pretty_print, ncx, nav):
 	"""Outputs the Table of Contents (TOC) of the EPUB file."""
-	doc = Document(ctx.obj['path'])
+	doc = _get_document(ctx)
 
 	if ncx and nav:
 		click.secho('Error: --ncx and --nav flags cannot be used together.', fg='red', err=True)
@@ -229,7 +274,7 @@ def toc(ctx, format, pretty_print, ncx, nav):
 @click.pass_context
 def metadata(ctx, format, pretty_print):
 	"""Outputs the metadata information from the package file."""
-	doc = Document(ctx.obj['path'])
+	doc = _get_document(ctx)
 	package = doc.package
 	output_document_part(package, 'metadata', format, pretty_print)
 
@@ -240,7 +285,7 @@ def metadata(ctx, format, pretty_print):
 @click.pass_context
 def manifest(ctx, format, pretty_print):
 	"""Outputs the manifest information from the package file."""
-	doc = Document(ctx.obj['path'])
+	doc = _get_document(ctx)
 	package = doc.package
 	output_document_part(package, 'manifest', format, pretty_print)
 
@@ -251,7 +296,7 @@ def manifest(ctx, format, pretty_print):
 @click.pass_context
 def spine(ctx, format, pretty_print):
 	"""Outputs the spine information from the package file."""
-	doc = Document(ctx.obj['path'])
+	doc = _get_document(ctx)
 	package = doc.package
 	output_document_part(package, 'spine', format, pretty_print)
 
@@ -263,14 +308,14 @@ def spine(ctx, format, pretty_print):
 @click.pass_context
 def content(ctx, item_id, format, pretty_print):
 	"""Outputs the content of a document by its manifest item ID."""
-	doc = Document(ctx.obj['path'])
+	doc = _get_document(ctx)
 
 	content = doc.find_content_by_id(item_id)
 	if format == 'raw':
 		click.echo(content.to_str())
 	elif format == 'xml':
-		if hasattr(content, 'to_xml'):
-			click.echo(content.to_xml(pretty_print=pretty_print))
+		if hasattr(content, 'to_xml_stream'):
+			echo_xml(content, pretty_print)
 		else:
 			click.echo(content.to_str())
 	elif format == 'plain':
@@ -296,7 +341,7 @@ def content(ctx, item_id, format, pretty_print):
 @click.pass_context
 def files(ctx, file_path, format, pretty_print):
 	"""List all files in the EPUB archive with their metadata, or output content of a specific file."""
-	doc = Document(ctx.obj['path'])
+	doc = _get_document(ctx)
 
 	# Set dynamic default based on whether file_path is provided
 	if format is None:
@@ -306,7 +351,7 @@ def files(ctx, file_path, format, pretty_print):
 		# Display content of specific file
 		try:
 			content = doc.get_file_by_path(file_path)
-		except FileNotFoundError as e:
+		except EPUBFileNotFoundError as e:
 			click.secho('FileNotFoundError:', fg='red', bold=True, err=True)
 			click.secho(format_error_message(e), fg='red', err=True)
 			ctx.exit(1)
@@ -317,8 +362,8 @@ def files(ctx, file_path, format, pretty_print):
 			if format == 'raw':
 				click.echo(content.to_str())
 			elif format == 'xml':
-				if hasattr(content, 'to_xml'):
-					click.echo(content.to_xml(pretty_print=pretty_print))
+				if hasattr(content, 'to_xml_stream'):
+					echo_xml(content, pretty_print)
 				else:
 					click.echo(content.to_str())
 			elif format == 'plain':
@@ -23,14 +23,120 @@ For more details on the structure and requirements of the `container.xml` file,
 EPUB specification: https://www.w3.org/TR/epub/#sec-ocf
 """
 
-try:
-	from lxml import etree
-except ImportError:
-	import xml.etree.ElementTree as etree
+from functools import lru_cache
+from typing import TYPE_CHECKING, Union
 
 from epub_utils.exceptions import InvalidEPUBError, ParseError
+from epub_utils.parser import get_parser
 from epub_utils.printers import XMLPrinter
 
+try:
+	from functools import cache
+except ImportError:  # Python 3.8
+	cache = lru_cache(maxsize=None)
+
+if TYPE_CHECKING:
+	from lxml import etree
+
+CONTAINER_NAMESPACE = 'urn:oasis:names:tc:opendocument:xmlns:container'
+ROOTFILE_XPATH = f'.//{{{CONTAINER_NAMESPACE}}}rootfile'
+
+
+@cache
+def _compiled_rootfile_xpath():
+	"""
+	Compile the rootfile lookup once per process.
+	"""
+	from lxml import etree
+
+	return etree.ETXPath(ROOTFILE_XPATH)
+
+
+def _find_rootfile_element(root: 'etree.Element') -> 'etree.Element':
+	"""
+	Finds the rootfile element in the container.xml data.
+
+	Args:
+	    root (etree.Element): The root element of the parsed XML.
+
+	Returns:
+	    etree.Element: The rootfile element.
+
+	Raises:
+	    InvalidEPUBError: If the rootfile element or its 'full-path' attribute is missing.
+	"""
+	rootfile_elements = _compiled_rootfile_xpath()(root)
+	rootfile_element = rootfile_elements[0] if rootfile_elements else None
+	if rootfile_element is None:
+		raise InvalidEPUBError(
+			'Invalid container.xml: Missing rootfile element',
+			suggestions=[
+				'Ensure the container.xml contains a rootfile element',
+				'Check that the container structure follows EPUB specifications',
+				'Verify the EPUB was created with compliant tools',
+			],
+		)
+
+	if 'full-path' not in rootfile_element.attrib:
+		raise InvalidEPUBError(
+			"Invalid container.xml: Missing 'full-path' attribute in rootfile element",
+			suggestions=[
+				"Ensure the rootfile element has a 'full-path' attribute",
+				'Check that the container.xml follows EPUB specifications',
+				'Verify the EPUB package structure is complete',
+			],
+		)
+
+	return rootfile_element
+
+
+@lru_cache(maxsize=256)
+def _parse_rootfile_path(xml_content: bytes) -> str:
+	"""
+	Parses the container.xml data to extract the rootfile path.
+
+	Results are cached by content, since most EPUBs ship the same boilerplate
+	container.xml. Errors are raised on every call and never cached.
+
+	Args:
+	    xml_content (bytes): The raw XML content of the container.xml file.
+
+	Returns:
+	    str: The rootfile path.
+
+	Raises:
+	    ParseError: If the XML is invalid or cannot be parsed.
+	    InvalidEPUBError: If the container.xml structure is invalid.
+	"""
+	from lxml import etree
+
+	try:
+		root = etree.fromstring(xml_content, get_parser())
+		rootfile_element = _find_rootfile_element(root)
+		rootfile_path = rootfile_element.attrib['full-path']
+
+		if not rootfile_path.strip():
+			raise InvalidEPUBError(
+				"Invalid container.xml: 'full-path' attribute is empty",
+				suggestions=[
+					"Ensure the rootfile element has a non-empty 'full-path' attribute",
+					'Check that the path points to a valid OPF file',
+					'Verify the EPUB package structure is complete',
+				],
+			)
+	except etree.ParseError as e:
+		raise ParseError(
+			f'Invalid XML in container.xml: {str(e)}',
+			suggestions=[
+				'Check that the container.xml file contains valid XML',
+				'Verify the file is not corrupted',
+				'Ensure all XML tags are properly closed',
+				'Check for invalid characters in the XML',
+			],
+		) from e
+
+	return rootfile_path
+
 
 class Container:
 	"""
@@ -38,26 +144,34 @@ class Container:
 
 	Attributes:
 	    xml_content (str): The raw XML content of the container.xml file.
+	        Raw bytes are accepted and only decoded when the text is needed.
 	    rootfile_path (str): The path to the rootfile specified in the container.
 	"""
 
-	NAMESPACE = 'urn:oasis:names:tc:opendocument:xmlns:container'
-	ROOTFILE_XPATH = f'.//{{{NAMESPACE}}}rootfile'
+	NAMESPACE = CONTAINER_NAMESPACE
+	ROOTFILE_XPATH = ROOTFILE_XPATH
 
-	def __init__(self, xml_content: str) -> None:
+	def __init__(self, xml_content: Union[str, bytes]) -> None:
 		"""
 		Initialize the Container by parsing the container.xml data.
 
 		Args:
-		    xml_content (str): The raw XML content of the container.xml file.
+		    xml_content (str | bytes): The raw XML content of the container.xml file.
 		"""
-		self.xml_content = xml_content
+		self._xml_content = xml_content
 		self.rootfile_path: str = None
 
 		self._parse(xml_content)
 
 		self._printer = XMLPrinter(self)
 
+	@property
+	def xml_content(self) -> str:
+		"""The raw XML content, decoded on first access when given as bytes."""
+		if isinstance(self._xml_content, bytes):
+			self._xml_content = self._xml_content.decode('utf-8')
+		return self._xml_content
+
 	def __str__(self) -> str:
 		return self.xml_content
 
@@ -67,76 +181,20 @@ class Container:
 	def to_xml(self, *args, **kwargs) -> str:
 		return self._printer.to_xml(*args, **kwargs)
 
-	def _find_rootfile_element(self, root: etree.Element) -> etree.Element:
-		"""
-		Finds the rootfile element in the container.xml data.
-
-		Args:
-		    root (etree.Element): The root element of the parsed XML.
-
-		Returns:
-		    etree.Element: The rootfile element.
-
-		Raises:
-		    InvalidEPUBError: If the rootfile element or its 'full-path' attribute is missing.
-		"""
-		rootfile_element = root.find(self.ROOTFILE_XPATH)
-		if rootfile_element is None:
-			raise InvalidEPUBError(
-				'Invalid container.xml: Missing rootfile element',
-				suggestions=[
-					'Ensure the container.xml contains a rootfile element',
-					'Check that the container structure follows EPUB specifications',
-					'Verify the EPUB was created with compliant tools',
-				],
-			)
-
-		if 'full-path' not in rootfile_element.attrib:
-			raise InvalidEPUBError(
-				"Invalid container.xml: Missing 'full-path' attribute in rootfile element",
-				suggestions=[
-					"Ensure the rootfile element has a 'full-path' attribute",
-					'Check that the container.xml follows EPUB specifications',
-					'Verify the EPUB package structure is complete',
-				],
-			)
-
-		return rootfile_element
+	def to_xml_stream(self, out, *args, **kwargs) -> None:
+		self._printer.to_xml_stream(out, *args, **kwargs)
 
-	def _parse(self, xml_content: str) -> None:
+	def _parse(self, xml_content: Union[str, bytes]) -> None:
 		"""
 		Parses the container.xml data to extract the rootfile path.
 
 		Args:
-		    xml_content (str): The raw XML content of the container.xml file.
+		    xml_content (str | bytes): The raw XML content of the container.xml file.
 
 		Raises:
 		    ParseError: If the XML is invalid or cannot be parsed.
 		    InvalidEPUBError: If the container.xml structure is invalid.
 		"""
-		try:
-			if isinstance(xml_content, str):
-				xml_content = xml_content.encode('utf-8')
-			root = etree.fromstring(xml_content)
-			rootfile_element = self._find_rootfile_element(root)
-			self.rootfile_path = rootfile_element.attrib['full-path']
-
-			if not self.rootfile_path.strip():
-				raise InvalidEPUBError(
-					"Invalid container.xml: 'full-path' attribute is empty",
-					suggestions=[
-						"Ensure the rootfile element has a non-empty 'full-path' attribute",
-						'Check that the path points to a valid OPF file',
-						'Verify the EPUB package structure is complete',
-					],
-				)
-		except etree.ParseError as e:
-			raise ParseError(
-				f'Invalid XML in container.xml: {str(e)}',
-				suggestions=[
-					'Check that the container.xml file contains valid XML',
-					'Verify the file is not corrupted',
-					'Ensure all XML tags are properly closed',
-					'Check for invalid characters in the XML',
-				],
-			) from e
+		if isinstance(xml_content, str):
+			xml_content = xml_content.encode('utf-8')
+		self.rootfile_path = _parse_rootfile_path(xml_content)
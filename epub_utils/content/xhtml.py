@@ -1,11 +1,38 @@
-import re
-
-from lxml import etree
+from functools import cached_property
+from typing import Iterable, Union
 
 from epub_utils.content.base import Content
 from epub_utils.exceptions import ParseError, UnsupportedFormatError
+from epub_utils.parser import get_parser
 from epub_utils.printers import XMLPrinter
 
+# body in any namespace or none, matching by local name like local-name()="body"
+_BODY_TAG = '{*}body'
+
+
+def _collapse_whitespace(chunks: Iterable[str]) -> str:
+	"""
+	Join text chunks, collapsing whitespace runs to single spaces and stripping the ends.
+
+	Each chunk is split on its own, so no intermediate string of the whole text
+	is built before normalization.
+	"""
+	parts = []
+	pending_space = False
+
+	for chunk in chunks:
+		words = chunk.split()
+		if not words:
+			pending_space = pending_space or bool(chunk)
+			continue
+
+		if parts and (pending_space or chunk[0].isspace()):
+			parts.append(' ')
+		parts.append(' '.join(words))
+		pending_space = chunk[-1].isspace()
+
+	return ''.join(parts)
+
 
 class XHTMLContent(Content):
 	"""
@@ -14,8 +41,8 @@ class XHTMLContent(Content):
 
 	MEDIA_TYPES = ['application/xhtml+xml', 'text/html']
 
-	def __init__(self, xml_content: str, media_type: str, href: str) -> None:
-		self.xml_content = xml_content
+	def __init__(self, xml_content: Union[str, bytes], media_type: str, href: str) -> None:
+		self._xml_content = xml_content
 
 		self._tree = None
 
@@ -34,6 +61,13 @@ class XHTMLContent(Content):
 
 		self._printer = XMLPrinter(self)
 
+	@property
+	def xml_content(self) -> str:
+		"""The raw XML content, decoded on first access when given as bytes."""
+		if isinstance(self._xml_content, bytes):
+			self._xml_content = self._xml_content.decode('utf-8')
+		return self._xml_content
+
 	def __str__(self) -> str:
 		return self.xml_content
 
@@ -43,12 +77,19 @@ class XHTMLContent(Content):
 	def to_xml(self, *args, **kwargs) -> str:
 		return self._printer.to_xml(*args, **kwargs)
 
+	def to_xml_stream(self, out, *args, **kwargs) -> None:
+		self._printer.to_xml_stream(out, *args, **kwargs)
+
 	def to_plain(self) -> str:
 		return self.inner_text
 
-	def _parse(self, xml_content: str) -> None:
+	def _parse(self, xml_content: Union[str, bytes]) -> None:
+		from lxml import etree
+
 		try:
-			self._tree = etree.fromstring(xml_content.encode('utf-8'))
+			if isinstance(xml_content, str):
+				xml_content = xml_content.encode('utf-8')
+			self._tree = etree.fromstring(xml_content, parser=get_parser())
 		except etree.ParseError as e:
 			raise ParseError(
 				f'Invalid XML in XHTML content file: {str(e)}',
@@ -62,23 +103,15 @@ class XHTMLContent(Content):
 
 	@property
 	def tree(self):
-		"""Lazily parse and cache the XHTML tree."""
-		if self._tree is None:
-			self._parse(self.xml_content)
+		"""The parsed XHTML tree, built when the content is constructed."""
 		return self._tree
 
-	@property
+	@cached_property
 	def inner_text(self) -> str:
 		tree = self.tree
 
-		body_elements = tree.xpath('//*[local-name()="body"]')
-
-		if body_elements:
-			inner_text = ''.join(body_elements[0].itertext())
-		else:
-			inner_text = ''.join(tree.itertext())
-
-		# Normalize whitespace
-		inner_text = re.sub(r'\s+', ' ', inner_text).strip()
+		# Stops at the first body instead of testing the local name of every element
+		body = next(tree.iter(_BODY_TAG), None)
+		root = body if body is not None else tree
 
-		return inner_text
+		return _collapse_whitespace(root.itertext())
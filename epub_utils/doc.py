@@ -1,14 +1,12 @@
-import os
+import posixpath
 import zipfile
-from datetime import datetime
 from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import IO, Dict, Iterator, List, Optional, Union
 
 from epub_utils.container import Container
 from epub_utils.content import XHTMLContent
-from epub_utils.exceptions import FileNotFoundError as EPUBFileNotFoundError
-from epub_utils.exceptions import InvalidEPUBError
+from epub_utils.exceptions import EPUBError, EPUBFileNotFoundError, InvalidEPUBError
 from epub_utils.navigation import EPUBNavDocNavigation, Navigation, NCXNavigation
 from epub_utils.package import Package
 
@@ -21,10 +19,11 @@ class Document:
 	    path (Path): The path to the EPUB file.
 	    _container (Container): The parsed container document.
 	    _package (Package): The parsed package document.
-	    _toc (TableOfContents): The parsed table of contents document.
+	    toc (Navigation): The parsed table of contents document, cached on first access.
 	"""
 
 	CONTAINER_FILE_PATH = 'META-INF/container.xml'
+	ZIP_LOCAL_FILE_SIGNATURE = b'PK\x03\x04'
 
 	def __init__(self, path: Union[str, Path]) -> None:
 		"""
@@ -48,23 +47,121 @@ class Document:
 				file_path=str(self.path),
 			)
 
-		if not zipfile.is_zipfile(self.path):
-			raise InvalidEPUBError(
-				f'File is not a valid ZIP archive: {self.path}',
-				suggestions=[
-					'Ensure the file is a valid EPUB (which is a ZIP archive)',
-					'Check that the file is not corrupted',
-					'Verify the file extension is .epub',
-				],
-				file_path=str(self.path),
-			)
+		if not self._has_zip_signature():
+			raise self._invalid_zip_error()
 
 		self._container: Container = None
 		self._package: Package = None
 
-		self._toc: Navigation = None
-		self._ncx: NCXNavigation = None
-		self._nav: EPUBNavDocNavigation = None
+	def _has_zip_signature(self) -> bool:
+		"""
+		Check whether the file looks like a ZIP archive.
+
+		EPUBs start with a local file header for the mimetype entry, so reading
+		four bytes settles the common case. Anything else falls back to the full
+		end-of-central-directory scan of ``zipfile.is_zipfile``.
+		"""
+		try:
+			with open(self.path, 'rb') as f:
+				if f.read(4) == self.ZIP_LOCAL_FILE_SIGNATURE:
+					return True
+		except OSError:
+			return False
+
+		return zipfile.is_zipfile(self.path)
+
+	def _invalid_zip_error(self) -> InvalidEPUBError:
+		return InvalidEPUBError(
+			f'File is not a valid ZIP archive: {self.path}',
+			suggestions=[
+				'Ensure the file is a valid EPUB (which is a ZIP archive)',
+				'Check that the file is not corrupted',
+				'Verify the file extension is .epub',
+			],
+			file_path=str(self.path),
+		)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> None:
+		self.close()
+
+	def close(self) -> None:
+		"""Close the underlying EPUB archive if it has been opened."""
+		epub_zip = self.__dict__.pop('_zip', None)
+		if epub_zip is not None:
+			epub_zip.close()
+
+	@cached_property
+	def _zip(self) -> zipfile.ZipFile:
+		"""The EPUB archive, opened once and kept open for the Document lifetime."""
+		try:
+			return zipfile.ZipFile(self.path, 'r')
+		except zipfile.BadZipFile as e:
+			# The signature check passed but the central directory is unusable
+			raise self._invalid_zip_error() from e
+
+	@cached_property
+	def _norm_namelist(self) -> Dict[str, str]:
+		"""Map normalized archive paths to their stored member names."""
+		return {posixpath.normpath(name): name for name in self._zip.namelist()}
+
+	def _get_zip_info(self, file_path: str) -> zipfile.ZipInfo:
+		"""
+		Resolve a path to its member in the EPUB archive.
+
+		Args:
+		    file_path (str): Path to the file within the EPUB archive.
+
+		Returns:
+		    zipfile.ZipInfo: The archive member for the path.
+
+		Raises:
+		    EPUBFileNotFoundError: If the file is missing from the EPUB archive.
+		"""
+		epub_zip = self._zip
+		zip_info = epub_zip.NameToInfo.get(file_path)
+
+		if zip_info is None:
+			norm_namelist = self._norm_namelist
+			norm_path = posixpath.normpath(file_path)
+
+			if norm_path in norm_namelist:
+				zip_info = epub_zip.NameToInfo[norm_namelist[norm_path]]
+
+		if zip_info is None:
+			available_files = sorted(norm_namelist.keys())[:10]  # Show first 10 files
+			suggestions = [
+				'Check that the file path is correct',
+				'Verify the EPUB file structure is complete',
+			]
+			if available_files:
+				file_list = ', '.join(available_files)
+				if len(norm_namelist) > 10:
+					file_list += f' (and {len(norm_namelist) - 10} more)'
+				suggestions.append(f'Available files include: {file_list}')
+
+			raise EPUBFileNotFoundError(
+				file_path, epub_path=str(self.path), suggestions=suggestions
+			)
+
+		return zip_info
+
+	def _read_bytes_from_epub(self, file_path: str) -> bytes:
+		"""
+		Read the raw bytes of a file from the EPUB archive.
+
+		Args:
+		    file_path (str): Path to the file within the EPUB archive.
+
+		Returns:
+		    bytes: Undecoded contents of the file.
+
+		Raises:
+		    EPUBFileNotFoundError: If the file is missing from the EPUB archive.
+		"""
+		return self._zip.read(self._get_zip_info(file_path))
 
 	def _read_file_from_epub(self, file_path: str) -> str:
 		"""
@@ -79,101 +176,79 @@ class Document:
 		Raises:
 		    EPUBFileNotFoundError: If the file is missing from the EPUB archive.
 		"""
-		with zipfile.ZipFile(self.path, 'r') as epub_zip:
-			norm_namelist = {os.path.normpath(name): name for name in epub_zip.namelist()}
-			norm_path = os.path.normpath(file_path)
+		file_content = self._read_bytes_from_epub(file_path)
 
-			if norm_path not in norm_namelist:
-				available_files = sorted(norm_namelist.keys())[:10]  # Show first 10 files
-				suggestions = [
-					'Check that the file path is correct',
-					'Verify the EPUB file structure is complete',
-				]
-				if available_files:
-					file_list = ', '.join(available_files)
-					if len(norm_namelist) > 10:
-						file_list += f' (and {len(norm_namelist) - 10} more)'
-					suggestions.append(f'Available files include: {file_list}')
-
-				raise EPUBFileNotFoundError(
-					file_path, epub_path=str(self.path), suggestions=suggestions
-				)
-
-			try:
-				return epub_zip.read(norm_namelist[norm_path]).decode('utf-8')
-			except UnicodeDecodeError as e:
-				raise InvalidEPUBError(
-					f"Cannot decode file '{file_path}' as UTF-8",
-					suggestions=[
-						'Check that the file contains valid UTF-8 text',
-						'Verify the EPUB file is not corrupted',
-						'Ensure the file is a text-based format (XML, HTML, etc.)',
-					],
-					file_path=str(self.path),
-				) from e
+		try:
+			return file_content.decode('utf-8')
+		except UnicodeDecodeError as e:
+			raise InvalidEPUBError(
+				f"Cannot decode file '{file_path}' as UTF-8",
+				suggestions=[
+					'Check that the file contains valid UTF-8 text',
+					'Verify the EPUB file is not corrupted',
+					'Ensure the file is a text-based format (XML, HTML, etc.)',
+				],
+				file_path=str(self.path),
+			) from e
 
 	@property
 	def container(self) -> Container:
 		if self._container is None:
-			container_xml_content = self._read_file_from_epub(self.CONTAINER_FILE_PATH)
+			container_xml_content = self._read_bytes_from_epub(self.CONTAINER_FILE_PATH)
 			self._container = Container(container_xml_content)
 		return self._container
 
 	@property
 	def package(self) -> Package:
 		if self._package is None:
-			package_xml_content = self._read_file_from_epub(self.container.rootfile_path)
+			package_xml_content = self._read_bytes_from_epub(self.container.rootfile_path)
 			self._package = Package(package_xml_content)
 		return self._package
 
 	@cached_property
 	def package_href(self):
-		return os.path.dirname(self.container.rootfile_path)
+		return posixpath.dirname(self.container.rootfile_path)
 
-	@property
-	def toc(self) -> Optional[Navigation]:
-		if self._toc is None:
-			if self.nav is not None:
-				# Default to newer EPUB3 Navigation Document when available
-				self._toc = self.nav
-			elif self.ncx is not None:
-				self._toc = self.ncx
+	@cached_property
+	def _manifest_items_by_path(self) -> Dict[str, dict]:
+		"""Manifest items keyed by their normalized path within the archive."""
+		items_by_path = {}
+		for item in self.package.manifest.items:
+			item_path = posixpath.normpath(posixpath.join(self.package_href, item['href']))
+			items_by_path.setdefault(item_path, item)
+		return items_by_path
 
-		return self._toc
+	@cached_property
+	def toc(self) -> Optional[Navigation]:
+		# The package resolves nav_href for EPUB 3 and toc_href otherwise, so the
+		# version alone picks the navigation class.
+		if self.package.version.major == 3:
+			return self.nav
+		return self.ncx
 
-	@property
+	@cached_property
 	def ncx(self) -> Optional[NCXNavigation]:
 		"""Access the Navigation Control eXtended (EPUB 2)"""
-		if self._ncx is None:
-			package = self.package
-
-			if not package.toc_href:
-				return None
+		toc_href = self.package.toc_href
+		if not toc_href:
+			return None
 
-			toc_href = package.toc_href
-			toc_path = os.path.join(self.package_href, toc_href)
-			toc_xml_content = self._read_file_from_epub(toc_path)
+		toc_path = posixpath.join(self.package_href, toc_href)
+		toc_xml_content = self._read_bytes_from_epub(toc_path)
 
-			self._ncx = NCXNavigation(toc_xml_content)
+		return NCXNavigation(toc_xml_content)
 
-		return self._ncx
-
-	@property
+	@cached_property
 	def nav(self) -> Optional[EPUBNavDocNavigation]:
 		"""Access the Navigation Document (EPUB 3)."""
-		if self._nav is None:
-			package = self.package
+		nav_href = self.package.nav_href
+		if not nav_href:
+			return None
 
-			if not package.nav_href:
-				return None
+		nav_path = posixpath.join(self.package_href, nav_href)
+		nav_xml_content = self._read_bytes_from_epub(nav_path)
 
-			nav_href = package.nav_href
-			nav_path = os.path.join(self.package_href, nav_href)
-			nav_xml_content = self._read_file_from_epub(nav_path)
-
-			self._nav = EPUBNavDocNavigation(nav_xml_content)
-
-		return self._nav
+		return EPUBNavDocNavigation(nav_xml_content)
 
 	def find_content_by_id(self, item_id: str) -> str:
 		"""
@@ -190,9 +265,7 @@ class Document:
 		"""
 		spine_item = self.package.spine.find_by_idref(item_id)
 		if not spine_item:
-			spine_ids = [
-				item.get('idref') for item in self.package.spine.itemrefs if item.get('idref')
-			]
+			spine_ids = self.package.spine.idrefs()
 			suggestions = [
 				'Check that the item ID is correct',
 				'Verify the item is included in the spine',
@@ -209,9 +282,7 @@ class Document:
 
 		manifest_item = self.package.manifest.find_by_id(item_id)
 		if not manifest_item:
-			manifest_ids = [
-				item.get('id') for item in self.package.manifest.items if item.get('id')
-			]
+			manifest_ids = self.package.manifest.ids()
 			suggestions = [
 				'Check that the item ID is correct',
 				'Verify the item is declared in the manifest',
@@ -226,8 +297,8 @@ class Document:
 				f"manifest item '{item_id}'", epub_path=str(self.path), suggestions=suggestions
 			)
 
-		content_path = os.path.join(self.package_href, manifest_item['href'])
-		xml_content = self._read_file_from_epub(content_path)
+		content_path = posixpath.join(self.package_href, manifest_item['href'])
+		xml_content = self._read_bytes_from_epub(content_path)
 
 		content = XHTMLContent(xml_content, manifest_item['media_type'], manifest_item['href'])
 
@@ -248,9 +319,7 @@ class Document:
 		"""
 		manifest_item = self.package.manifest.find_by_id(item_id)
 		if not manifest_item:
-			manifest_ids = [
-				item.get('id') for item in self.package.manifest.items if item.get('id')
-			]
+			manifest_ids = self.package.manifest.ids()
 			suggestions = [
 				'Check that the item ID is correct',
 				'Verify the item is declared in the manifest',
@@ -265,13 +334,31 @@ class Document:
 				f"manifest item '{item_id}'", epub_path=str(self.path), suggestions=suggestions
 			)
 
-		content_path = os.path.join(self.package_href, manifest_item['href'])
-		xml_content = self._read_file_from_epub(content_path)
+		content_path = posixpath.join(self.package_href, manifest_item['href'])
+		xml_content = self._read_bytes_from_epub(content_path)
 
 		content = XHTMLContent(xml_content, manifest_item['media_type'], manifest_item['href'])
 
 		return content
 
+	def iter_files(self) -> Iterator[Dict[str, str]]:
+		"""
+		Iterate over all files in the EPUB archive.
+
+		Yields:
+		    Dict[str, str]: The same file information as ``list_files``, one entry at a time.
+		"""
+		from datetime import datetime
+
+		for zip_info in self._zip.infolist():
+			yield {
+				'filename': zip_info.filename,
+				'file_size': zip_info.file_size,
+				'compress_size': zip_info.compress_size,
+				'file_mode': zip_info.external_attr >> 16,
+				'last_modified': datetime(*zip_info.date_time),
+			}
+
 	def list_files(self) -> List[Dict[str, str]]:
 		"""
 		List all files in the EPUB archive.
@@ -279,46 +366,73 @@ class Document:
 		Returns:
 		    List[Dict[str, str]]: A list of dictionaries containing file information.
 		"""
-		with zipfile.ZipFile(self.path, 'r') as epub_zip:
-			file_list = []
-			for zip_info in epub_zip.infolist():
-				file_info = {
-					'filename': zip_info.filename,
-					'file_size': zip_info.file_size,
-					'compress_size': zip_info.compress_size,
-					'file_mode': zip_info.external_attr >> 16,
-					'last_modified': datetime(*zip_info.date_time),
-				}
-				file_list.append(file_info)
-			return file_list
-
-	def get_files_info(self) -> List[Dict[str, Union[str, int]]]:
+		return list(self.iter_files())
+
+	def get_file_names(self) -> List[str]:
+		"""
+		Get the names of all entries in the EPUB archive, in archive order.
+
+		Cheaper than ``list_files`` when only the paths are needed.
+
+		Returns:
+		    List[str]: The archive member names.
+		"""
+		return self._zip.namelist()
+
+	def iter_files_info(self) -> Iterator[Dict[str, Union[str, int]]]:
+		"""
+		Iterate over information about the files in the EPUB archive.
+
+		Entries are yielded in archive order and directory entries are skipped.
+
+		Yields:
+		    Dict: File information with 'path', 'size', 'compressed_size', 'modified'.
+		"""
+		for zip_info in self._zip.infolist():
+			if zip_info.filename.endswith('/'):
+				continue
+
+			yield {
+				'path': zip_info.filename,
+				'size': zip_info.file_size,
+				'compressed_size': zip_info.compress_size,
+				'modified': '{:04d}-{:02d}-{:02d} {:02d}:{:02d}:{:02d}'.format(*zip_info.date_time),
+			}
+
+	def get_files_info(self, sort: bool = False) -> List[Dict[str, Union[str, int]]]:
 		"""
 		Get information about all files in the EPUB archive.
 
+		Args:
+		    sort (bool): Sort the entries by path instead of keeping archive order.
+
 		Returns:
 		    List[Dict]: A list of dictionaries containing file information.
 		        Each dictionary contains: 'path', 'size', 'compressed_size', 'modified'.
 		"""
-		files_info = []
+		files_info = list(self.iter_files_info())
+
+		if sort:
+			files_info.sort(key=lambda x: x['path'])
+		return files_info
+
+	def open_file(self, file_path: str) -> IO[bytes]:
+		"""
+		Open a file from the EPUB archive as a binary stream.
 
-		with zipfile.ZipFile(self.path, 'r') as epub_zip:
-			for zip_info in epub_zip.infolist():
-				if zip_info.filename.endswith('/'):
-					continue
+		The file is decompressed as it is read, so large items can be processed
+		in chunks instead of being loaded into memory at once.
 
-				modified_time = datetime(*zip_info.date_time).strftime('%Y-%m-%d %H:%M:%S')
+		Args:
+		    file_path (str): Path to the file within the EPUB archive.
 
-				file_info = {
-					'path': zip_info.filename,
-					'size': zip_info.file_size,
-					'compressed_size': zip_info.compress_size,
-					'modified': modified_time,
-				}
-				files_info.append(file_info)
+		Returns:
+		    IO[bytes]: Readable binary stream for the file.
 
-		files_info.sort(key=lambda x: x['path'])
-		return files_info
+		Raises:
+		    EPUBFileNotFoundError: If the file is missing from the EPUB archive.
+		"""
+		return self._zip.open(self._get_zip_info(file_path))
 
 	def get_file_by_path(self, file_path: str):
 		"""
@@ -334,20 +448,19 @@ class Document:
 		Raises:
 		    ValueError: If the file is missing from the EPUB archive.
 		"""
-		file_content = self._read_file_from_epub(file_path)
-
 		if file_path.lower().endswith(('.xhtml', '.html', '.htm')):
+			file_content = self._read_bytes_from_epub(file_path)
 			media_type = 'application/xhtml+xml'
 
 			try:
-				for item in self.package.manifest.items:
-					manifest_path = os.path.join(self._Documentpackage_href, item['href'])
-					if os.path.normpath(manifest_path) == os.path.normpath(file_path):
-						media_type = item.get('media_type', 'application/xhtml+xml')
-						break
-			except:
-				pass
+				manifest_item = self._manifest_items_by_path.get(posixpath.normpath(file_path))
+			except EPUBError:
+				# Keep the default media type when the package cannot be parsed
+				manifest_item = None
+
+			if manifest_item is not None:
+				media_type = manifest_item['media_type']
 
 			return XHTMLContent(file_content, media_type, file_path)
 		else:
-			return file_content
+			return self._read_file_from_epub(file_path)
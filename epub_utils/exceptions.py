@@ -6,9 +6,51 @@ more descriptive error messages to help users understand what went wrong and
 how to fix it.
 """
 
-
-class EPUBError(Exception):
-	"""Base exception for all epub-utils errors."""
+import warnings
+
+# Default suggestions, shared by every instance that does not pass its own.
+_PARSE_SUGGESTIONS = (
+	'Verify the EPUB file is not corrupted',
+	'Check that the XML is well-formed',
+	'Ensure all required elements are present',
+)
+
+_INVALID_EPUB_SUGGESTIONS = (
+	'Verify the file is a valid EPUB archive',
+	'Check that all required EPUB files are present',
+	'Ensure the EPUB was created with a compliant tool',
+)
+
+_UNSUPPORTED_FORMAT_SUGGESTIONS = (
+	'Try using an EPUB file with a compatible version',
+	'Check the EPUB specification for version requirements',
+)
+
+_NOT_IMPLEMENTED_SUGGESTIONS = (
+	'Check the documentation for supported features',
+	'Consider contributing this feature to the project',
+	'Use an alternative approach if available',
+)
+
+_FILE_NOT_FOUND_SUGGESTIONS = (
+	'Verify the file path is correct',
+	'Check that the EPUB file is complete and not corrupted',
+	'Ensure the file was included when the EPUB was created',
+)
+
+_VALIDATION_SUGGESTIONS = (
+	'Fix the validation errors listed above',
+	'Use an EPUB validator to check for additional issues',
+	'Consult the EPUB specification for requirements',
+)
+
+
+class EPUBError(ValueError):
+	"""
+	Base exception for all epub-utils errors.
+
+	Subclasses ValueError so callers catching ValueError keep working.
+	"""
 
 	def __init__(self, message: str, suggestions: list = None, file_path: str = None):
 		"""
@@ -20,11 +62,15 @@ class EPUBError(Exception):
 			file_path: Optional path to the file where the error occurred
 		"""
 		super().__init__(message)
-		self.suggestions = suggestions or []
+		self.suggestions = suggestions if suggestions is not None else ()
 		self.file_path = file_path
 
+	def _format_message(self) -> str:
+		"""Build the main error message. Subclasses add their details here."""
+		return super().__str__()
+
 	def __str__(self):
-		error_parts = [super().__str__()]
+		error_parts = [self._format_message()]
 
 		if self.file_path:
 			error_parts.append(f'File: {self.file_path}')
@@ -37,7 +83,7 @@ class EPUBError(Exception):
 		return '\n'.join(error_parts)
 
 
-class ParseError(EPUBError, ValueError):
+class ParseError(EPUBError):
 	"""An error when parsing EPUB content due to invalid formatting."""
 
 	def __init__(
@@ -58,22 +104,24 @@ class ParseError(EPUBError, ValueError):
 			suggestions: List of suggestions for fixing the error
 			file_path: Path to the file with the parsing error
 		"""
-		if element_name:
-			message = f'Error parsing {element_name}: {message}'
-		if line_number:
-			message = f'{message} (line {line_number})'
+		self.element_name = element_name
+		self.line_number = line_number
 
 		if not suggestions:
-			suggestions = [
-				'Verify the EPUB file is not corrupted',
-				'Check that the XML is well-formed',
-				'Ensure all required elements are present',
-			]
+			suggestions = _PARSE_SUGGESTIONS
 
 		super().__init__(message, suggestions, file_path)
 
+	def _format_message(self) -> str:
+		message = super()._format_message()
+		if self.element_name:
+			message = f'Error parsing {self.element_name}: {message}'
+		if self.line_number:
+			message = f'{message} (line {self.line_number})'
+		return message
+
 
-class InvalidEPUBError(EPUBError, ValueError):
+class InvalidEPUBError(EPUBError):
 	"""An error when the EPUB file structure or content is invalid."""
 
 	def __init__(
@@ -92,21 +140,22 @@ class InvalidEPUBError(EPUBError, ValueError):
 			suggestions: List of suggestions for fixing the error
 			file_path: Path to the invalid EPUB file
 		"""
-		if missing_files:
-			file_list = ', '.join(missing_files)
-			message = f'{message}. Missing required files: {file_list}'
+		self.missing_files = missing_files
 
 		if not suggestions:
-			suggestions = [
-				'Verify the file is a valid EPUB archive',
-				'Check that all required EPUB files are present',
-				'Ensure the EPUB was created with a compliant tool',
-			]
+			suggestions = _INVALID_EPUB_SUGGESTIONS
 
 		super().__init__(message, suggestions, file_path)
 
+	def _format_message(self) -> str:
+		message = super()._format_message()
+		if self.missing_files:
+			file_list = ', '.join(self.missing_files)
+			message = f'{message}. Missing required files: {file_list}'
+		return message
+
 
-class UnsupportedFormatError(EPUBError, ValueError):
+class UnsupportedFormatError(EPUBError):
 	"""An error when attempting operations not supported for the EPUB version/format."""
 
 	def __init__(
@@ -127,23 +176,31 @@ class UnsupportedFormatError(EPUBError, ValueError):
 			suggestions: List of suggestions for fixing the error
 			file_path: Path to the EPUB file
 		"""
-		if epub_version and required_version:
-			message = f'{message} (EPUB {epub_version} detected, requires EPUB {required_version})'
-		elif epub_version:
-			message = f'{message} (EPUB {epub_version} format)'
+		self.epub_version = epub_version
+		self.required_version = required_version
 
 		if not suggestions:
-			suggestions = [
-				'Try using an EPUB file with a compatible version',
-				'Check the EPUB specification for version requirements',
-			]
+			suggestions = _UNSUPPORTED_FORMAT_SUGGESTIONS
 			if required_version:
-				suggestions.insert(0, f'Convert the EPUB to version {required_version} or higher')
+				suggestions = (
+					f'Convert the EPUB to version {required_version} or higher',
+				) + suggestions
 
 		super().__init__(message, suggestions, file_path)
 
+	def _format_message(self) -> str:
+		message = super()._format_message()
+		if self.epub_version and self.required_version:
+			message = (
+				f'{message} (EPUB {self.epub_version} detected, '
+				f'requires EPUB {self.required_version})'
+			)
+		elif self.epub_version:
+			message = f'{message} (EPUB {self.epub_version} format)'
+		return message
 
-class NotImplementedError(EPUBError):
+
+class EPUBNotImplementedError(EPUBError):
 	"""An error when attempting to use functionality not yet implemented."""
 
 	def __init__(
@@ -154,7 +211,7 @@ class NotImplementedError(EPUBError):
 		file_path: str = None,
 	):
 		"""
-		Initialize the NotImplementedError.
+		Initialize the EPUBNotImplementedError.
 
 		Args:
 			message: The error message
@@ -162,25 +219,26 @@ class NotImplementedError(EPUBError):
 			suggestions: List of suggestions for fixing the error
 			file_path: Path to the file (if applicable)
 		"""
-		if feature_name:
-			message = f"Feature '{feature_name}' is not yet implemented: {message}"
+		self.feature_name = feature_name
 
 		if not suggestions:
-			suggestions = [
-				'Check the documentation for supported features',
-				'Consider contributing this feature to the project',
-				'Use an alternative approach if available',
-			]
+			suggestions = _NOT_IMPLEMENTED_SUGGESTIONS
 
 		super().__init__(message, suggestions, file_path)
 
+	def _format_message(self) -> str:
+		message = super()._format_message()
+		if self.feature_name:
+			message = f"Feature '{self.feature_name}' is not yet implemented: {message}"
+		return message
+
 
-class FileNotFoundError(EPUBError, ValueError):
+class EPUBFileNotFoundError(EPUBError):
 	"""An error when a required file is not found in the EPUB archive."""
 
 	def __init__(self, file_path: str, epub_path: str = None, suggestions: list = None):
 		"""
-		Initialize the FileNotFoundError.
+		Initialize the EPUBFileNotFoundError.
 
 		Args:
 			file_path: Path to the missing file within the EPUB
@@ -190,16 +248,12 @@ class FileNotFoundError(EPUBError, ValueError):
 		message = f"Missing '{file_path}' in EPUB archive"
 
 		if not suggestions:
-			suggestions = [
-				'Verify the file path is correct',
-				'Check that the EPUB file is complete and not corrupted',
-				'Ensure the file was included when the EPUB was created',
-			]
+			suggestions = _FILE_NOT_FOUND_SUGGESTIONS
 
 		super().__init__(message, suggestions, epub_path)
 
 
-class ValidationError(EPUBError, ValueError):
+class ValidationError(EPUBError):
 	"""An error when EPUB content fails validation."""
 
 	def __init__(
@@ -218,15 +272,35 @@ class ValidationError(EPUBError, ValueError):
 			suggestions: List of suggestions for fixing the error
 			file_path: Path to the file with validation errors
 		"""
-		if validation_errors:
-			error_list = '\n'.join(f'  • {error}' for error in validation_errors)
-			message = f'{message}\nValidation errors:\n{error_list}'
+		self.validation_errors = validation_errors
 
 		if not suggestions:
-			suggestions = [
-				'Fix the validation errors listed above',
-				'Use an EPUB validator to check for additional issues',
-				'Consult the EPUB specification for requirements',
-			]
+			suggestions = _VALIDATION_SUGGESTIONS
 
 		super().__init__(message, suggestions, file_path)
+
+	def _format_message(self) -> str:
+		message = super()._format_message()
+		if self.validation_errors:
+			error_list = '\n'.join(f'  • {error}' for error in self.validation_errors)
+			message = f'{message}\nValidation errors:\n{error_list}'
+		return message
+
+
+# Former names, which shadowed the builtins of the same name.
+_DEPRECATED_ALIASES = {
+	'FileNotFoundError': EPUBFileNotFoundError,
+	'NotImplementedError': EPUBNotImplementedError,
+}
+
+
+def __getattr__(name: str):
+	if name in _DEPRECATED_ALIASES:
+		replacement = _DEPRECATED_ALIASES[name]
+		warnings.warn(
+			f'epub_utils.exceptions.{name} is deprecated, use {replacement.__name__} instead',
+			DeprecationWarning,
+			stacklevel=2,
+		)
+		return replacement
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
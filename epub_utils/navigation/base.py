@@ -1,9 +1,19 @@
+import json
+import sys
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
 
+# Clark-notation key of the xml:lang attribute on navigation document roots.
+XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
 
-@dataclass
+# Slotted dataclasses need Python 3.10; older versions keep a per-instance __dict__.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class NavigationItem:
 	"""Universal navigation item representation."""
 
@@ -18,20 +28,48 @@ class NavigationItem:
 	def to_dict(self) -> Dict[str, Any]:
 		"""Convert NavigationItem to dictionary format with all children recursively converted.
 
+		The tree is walked with an explicit stack, so deeply nested items do not
+		hit the recursion limit.
+
 		Returns:
 			Dictionary representation with children as nested dictionaries.
 		"""
-		result = {
-			'id': self.id,
-			'label': self.label,
-			'target': self.target,
-			'order': self.order,
-			'level': self.level,
-			'type': self.item_type,
-			'children': [child.to_dict() for child in self.children],
+		results = []
+		stack = [(self, results)]
+
+		while stack:
+			item, siblings = stack.pop()
+			result = {
+				'id': item.id,
+				'label': item.label,
+				'target': item.target,
+				'order': item.order,
+				'level': item.level,
+				'type': item.item_type,
+				'children': [],
+			}
+			siblings.append(result)
+
+			children = result['children']
+			for child in reversed(item.children):
+				stack.append((child, children))
+
+		return results[0]
+
+
+def _navigation_item_to_json(obj: Any) -> Dict[str, Any]:
+	"""JSON ``default`` hook emitting the ``to_dict`` layout one item at a time."""
+	if isinstance(obj, NavigationItem):
+		return {
+			'id': obj.id,
+			'label': obj.label,
+			'target': obj.target,
+			'order': obj.order,
+			'level': obj.level,
+			'type': obj.item_type,
+			'children': obj.children,
 		}
-
-		return result
+	raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
 
 
 class Navigation(ABC):
@@ -47,6 +85,10 @@ class Navigation(ABC):
 		self.media_type = media_type
 		self.href = href
 
+		self._id_index: Optional[Dict[str, NavigationItem]] = None
+		self._target_index: Optional[Dict[str, Tuple[NavigationItem, ...]]] = None
+		self._toc_dicts: Optional[List[Dict[str, Any]]] = None
+
 	# === Core Abstract Methods ===
 	@abstractmethod
 	def get_toc_items(self) -> List[NavigationItem]:
@@ -87,31 +129,70 @@ class Navigation(ABC):
 	# === Query Interface ===
 	def find_item_by_id(self, item_id: str) -> Optional[NavigationItem]:
 		"""Find navigation item by ID across all collections."""
-		for item in self.get_all_items():
-			if item.id == item_id:
-				return item
-		return None
+		self._ensure_indexes()
+		return self._id_index.get(item_id)
 
 	def find_items_by_target(self, target: str) -> List[NavigationItem]:
 		"""Find navigation items by target/href."""
-		return [item for item in self.get_all_items() if item.target == target]
+		self._ensure_indexes()
+		return list(self._target_index.get(target, ()))
+
+	def _ensure_indexes(self) -> None:
+		"""Build the ID and target lookup tables on first use.
+
+		Items are visited depth-first in document order, so nested items are
+		found too and the first item with a given ID wins.
+		"""
+		if self._id_index is not None:
+			return
+
+		id_index = {}
+		target_index = defaultdict(list)
+
+		for item in self._walk_all_items():
+			id_index.setdefault(item.id, item)
+			target_index[item.target].append(item)
+
+		self._id_index = id_index
+		# Buckets never change once built, so keep them as tuples without list over-allocation
+		self._target_index = {target: tuple(items) for target, items in target_index.items()}
+
+	def _invalidate_caches(self) -> None:
+		"""Drop cached lookups after the navigation structure changes."""
+		self._id_index = None
+		self._target_index = None
+		self._toc_dicts = None
 
 	def get_all_items(self) -> List[NavigationItem]:
 		"""Get all navigation items from all collections."""
-		items = []
-		items.extend(self.get_toc_items())
-		items.extend(self.get_page_list())
-		items.extend(self.get_landmarks())
-		return items
+		return list(self._iter_all_items())
+
+	def _iter_all_items(self) -> Iterator[NavigationItem]:
+		"""Iterate over the top-level items of every collection without building a list."""
+		return chain(self.get_toc_items(), self.get_page_list(), self.get_landmarks())
+
+	def _walk_all_items(self) -> Iterator[NavigationItem]:
+		"""Yield every item, nested children included, depth-first in document order."""
+		for top_item in self._iter_all_items():
+			stack = [top_item]
+			while stack:
+				item = stack.pop()
+				yield item
+				stack.extend(reversed(item.children))
 
 	def get_toc_items_as_dicts(self) -> List[Dict[str, Any]]:
 		"""Get TOC items as list of dictionaries with recursive children conversion.
 
+		The result is cached until the TOC is edited through this object, so the
+		same structure is returned on every call; copy it before modifying it.
+
 		Returns:
 			List of dictionaries representing the TOC structure, where each item
 			contains all its children recursively converted to dictionaries.
 		"""
-		return [item.to_dict() for item in self.get_toc_items()]
+		if self._toc_dicts is None:
+			self._toc_dicts = [item.to_dict() for item in self.get_toc_items()]
+		return self._toc_dicts
 
 	def get_page_list_as_dicts(self) -> List[Dict[str, Any]]:
 		"""Get page list items as list of dictionaries.
@@ -129,6 +210,18 @@ class Navigation(ABC):
 		"""
 		return [item.to_dict() for item in self.get_landmarks()]
 
+	def dump_toc_json(self, fp: IO[str], **kwargs) -> None:
+		"""Write the TOC as JSON in the same layout as ``get_toc_items_as_dicts``.
+
+		Items are serialized straight from the navigation items, so the full
+		dictionary tree is never built.
+
+		Args:
+			fp: Text stream to write the JSON to.
+			**kwargs: Extra options passed on to ``json.dump``.
+		"""
+		json.dump(self.get_toc_items(), fp, default=_navigation_item_to_json, **kwargs)
+
 	# === Format-specific Access ===
 	@property
 	@abstractmethod
@@ -1,13 +1,21 @@
-import re
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from lxml import etree
 
 from epub_utils.exceptions import ParseError, UnsupportedFormatError
-from epub_utils.navigation.base import Navigation, NavigationItem
+from epub_utils.navigation.base import XML_LANG, Navigation, NavigationItem
+from epub_utils.parser import get_parser
 from epub_utils.printers import XMLPrinter
 
-from .dom import NavDocument, NavListItem
+from .dom import EPUB_TYPE, NAV_NAMESPACES, NavDocument, NavListItem
+
+# body in any namespace or none, matching by local name like local-name()="body"
+_BODY_TAG = '{*}body'
+_LIST_ITEM_BY_ID_XPATH = etree.XPath('.//xhtml:li[@id=$id]', namespaces=NAV_NAMESPACES)
+_ANCHOR_BY_ID_XPATH = etree.XPath('.//xhtml:a[@id=$id]', namespaces=NAV_NAMESPACES)
+_ITEM_BY_ID_XPATH = etree.XPath(
+	'.//xhtml:li[@id=$id] | .//xhtml:a[@id=$id]', namespaces=NAV_NAMESPACES
+)
 
 
 class EPUBNavDocNavigation(Navigation):
@@ -16,9 +24,12 @@ class EPUBNavDocNavigation(Navigation):
 	MEDIA_TYPES = ['application/xhtml+xml']
 
 	def __init__(
-		self, xml_content: str, media_type: str = 'application/xhtml+xml', href: str = None
+		self,
+		xml_content: Union[str, bytes],
+		media_type: str = 'application/xhtml+xml',
+		href: str = None,
 	) -> None:
-		self.xml_content = xml_content
+		self._xml_content = xml_content
 
 		self._tree = None
 
@@ -40,6 +51,13 @@ class EPUBNavDocNavigation(Navigation):
 
 		self._printer = XMLPrinter(self)
 
+	@property
+	def xml_content(self) -> str:
+		"""The raw XML content, decoded on first access when given as bytes."""
+		if isinstance(self._xml_content, bytes):
+			self._xml_content = self._xml_content.decode('utf-8')
+		return self._xml_content
+
 	def __str__(self) -> str:
 		return self.xml_content
 
@@ -49,17 +67,22 @@ class EPUBNavDocNavigation(Navigation):
 	def to_xml(self, *args, **kwargs) -> str:
 		return self._printer.to_xml(*args, **kwargs)
 
+	def to_xml_stream(self, out, *args, **kwargs) -> None:
+		self._printer.to_xml_stream(out, *args, **kwargs)
+
 	def to_plain(self) -> str:
 		return self.inner_text
 
-	def _parse(self, xml_content: str) -> None:
+	def _parse(self, xml_content: Union[str, bytes]) -> None:
 		try:
-			self._tree = etree.fromstring(xml_content.encode('utf-8'))
+			if isinstance(xml_content, str):
+				xml_content = xml_content.encode('utf-8')
+			self._tree = etree.fromstring(xml_content, get_parser())
 
 			root = self._tree
 
 			self.xmlns = root.nsmap.get(None, '') if root.nsmap else ''
-			self.lang = root.get('{http://www.w3.org/XML/1998/namespace}lang', '')
+			self.lang = root.get(XML_LANG, '')
 
 		except etree.ParseError as e:
 			raise ParseError(
@@ -74,28 +97,18 @@ class EPUBNavDocNavigation(Navigation):
 
 	@property
 	def tree(self):
-		"""Lazily parse and cache the XHTML tree."""
-		if self._tree is None:
-			self._parse(self.xml_content)
+		"""The parsed XHTML tree, built when the document is constructed."""
 		return self._tree
 
 	@property
 	def inner_text(self) -> str:
 		tree = self.tree
 
-		body_elements = tree.xpath(
-			'//*[local-name()="body"]', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-		)
-
-		if body_elements:
-			inner_text = ''.join(body_elements[0].itertext())
-		else:
-			inner_text = ''.join(tree.itertext())
+		body = next(tree.iter(_BODY_TAG), None)
+		inner_text = ''.join((body if body is not None else tree).itertext())
 
 		# Normalize whitespace
-		inner_text = re.sub(r'\s+', ' ', inner_text).strip()
-
-		return inner_text
+		return ' '.join(inner_text.split())
 
 	# === Navigation Interface Implementation ===
 
@@ -142,6 +155,7 @@ class EPUBNavDocNavigation(Navigation):
 
 	def add_toc_item(self, item: NavigationItem, after_id: Optional[str] = None) -> None:
 		"""Add item to table of contents."""
+		self._invalidate_caches()
 		nav_doc = NavDocument(self.tree)
 		toc_nav = nav_doc.toc_nav
 
@@ -174,23 +188,18 @@ class EPUBNavDocNavigation(Navigation):
 
 	def remove_toc_item(self, item_id: str) -> bool:
 		"""Remove item from table of contents by ID."""
+		self._invalidate_caches()
 		nav_doc = NavDocument(self.tree)
 		toc_nav = nav_doc.toc_nav
 		if not toc_nav:
 			return False
 
 		# Find and remove the list item with the given ID
-		items_to_remove = self.tree.xpath(
-			f'.//xhtml:li[@id="{item_id}"]',
-			namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'},
-		)
+		items_to_remove = _LIST_ITEM_BY_ID_XPATH(self.tree, id=item_id)
 
 		# Also check for anchors with the ID
 		if not items_to_remove:
-			items_to_remove = self.tree.xpath(
-				f'.//xhtml:a[@id="{item_id}"]',
-				namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'},
-			)
+			items_to_remove = _ANCHOR_BY_ID_XPATH(self.tree, id=item_id)
 			# Remove the parent li element if found
 			items_to_remove = [
 				item.getparent() for item in items_to_remove if item.getparent() is not None
@@ -206,16 +215,14 @@ class EPUBNavDocNavigation(Navigation):
 
 	def update_toc_item(self, item_id: str, **kwargs) -> bool:
 		"""Update existing TOC item properties."""
+		self._invalidate_caches()
 		nav_doc = NavDocument(self.tree)
 		toc_nav = nav_doc.toc_nav
 		if not toc_nav:
 			return False
 
 		# Find the item by ID (could be on li or a element)
-		target_items = self.tree.xpath(
-			f'.//xhtml:li[@id="{item_id}"] | .//xhtml:a[@id="{item_id}"]',
-			namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'},
-		)
+		target_items = _ITEM_BY_ID_XPATH(self.tree, id=item_id)
 
 		if not target_items:
 			return False
@@ -228,32 +235,29 @@ class EPUBNavDocNavigation(Navigation):
 			li_element = target_element.getparent()
 		else:
 			li_element = target_element
-			anchors = li_element.xpath(
-				'./xhtml:a', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-			)
-			anchor_element = anchors[0] if anchors else None
+			anchor = NavListItem(li_element).anchor
+			anchor_element = anchor.element if anchor else None
 
 		# Update properties
 		if 'label' in kwargs and anchor_element is not None:
 			anchor_element.text = kwargs['label']
 		elif 'label' in kwargs:
 			# Handle span elements or create anchor
-			spans = li_element.xpath(
-				'./xhtml:span', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-			)
-			if spans:
-				spans[0].text = kwargs['label']
+			span = NavListItem(li_element).span
+			if span:
+				span.element.text = kwargs['label']
 
 		if 'target' in kwargs and anchor_element is not None:
 			anchor_element.set('href', kwargs['target'])
 
 		if 'item_type' in kwargs and anchor_element is not None:
-			anchor_element.set('{http://www.idpf.org/2007/ops}type', kwargs['item_type'])
+			anchor_element.set(EPUB_TYPE, kwargs['item_type'])
 
 		return True
 
 	def reorder_toc_items(self, new_order: List[str]) -> None:
 		"""Reorder TOC items by list of IDs."""
+		self._invalidate_caches()
 		# This is a complex operation that would require rebuilding the list structure
 		# For now, we'll implement a basic version that moves items around
 		nav_doc = NavDocument(self.tree)
@@ -294,6 +298,18 @@ class EPUBNavDocNavigation(Navigation):
 			anchor = list_item.anchor
 			span = list_item.span
 
+			if not anchor and not span:
+				# Fallback for items without anchor or span
+				continue
+
+			# Convert nested items first so each item is built complete
+			nested_list = list_item.nested_list
+			children = (
+				self._convert_list_items_recursive(nested_list.list_items, level + 1)
+				if nested_list
+				else []
+			)
+
 			if anchor:
 				item = NavigationItem(
 					id=anchor.id or list_item.id or '',
@@ -302,8 +318,9 @@ class EPUBNavDocNavigation(Navigation):
 					order=i + 1,
 					level=level,
 					item_type=anchor.epub_type,
+					children=children,
 				)
-			elif span:
+			else:
 				item = NavigationItem(
 					id=span.id or list_item.id or '',
 					label=span.element.text or '',
@@ -311,16 +328,7 @@ class EPUBNavDocNavigation(Navigation):
 					order=i + 1,
 					level=level,
 					item_type=None,
-				)
-			else:
-				# Fallback for items without anchor or span
-				continue
-
-			# Convert nested items
-			nested_list = list_item.nested_list
-			if nested_list:
-				item.children = self._convert_list_items_recursive(
-					nested_list.list_items, level + 1
+					children=children,
 				)
 
 			items.append(item)
@@ -4,9 +4,34 @@ from typing import List, Optional
 
 from lxml import etree
 
+XHTML_NAMESPACE = 'http://www.w3.org/1999/xhtml'
+EPUB_NAMESPACE = 'http://www.idpf.org/2007/ops'
+NAV_NAMESPACES = {'xhtml': XHTML_NAMESPACE, 'epub': EPUB_NAMESPACE}
+
+EPUB_TYPE = f'{{{EPUB_NAMESPACE}}}type'
+
+_A_TAG = f'{{{XHTML_NAMESPACE}}}a'
+_SPAN_TAG = f'{{{XHTML_NAMESPACE}}}span'
+_OL_TAG = f'{{{XHTML_NAMESPACE}}}ol'
+_LI_TAG = f'{{{XHTML_NAMESPACE}}}li'
+_NAV_TAG = f'{{{XHTML_NAMESPACE}}}nav'
+_BODY_TAG = f'{{{XHTML_NAMESPACE}}}body'
+# h1 to h6, in the order a nav heading is looked up
+_HEADING_TAGS = tuple(f'{{{XHTML_NAMESPACE}}}h{level}' for level in range(1, 7))
+
+_NAV_BY_TYPE_XPATH = etree.XPath('.//xhtml:nav[@epub:type=$type]', namespaces=NAV_NAMESPACES)
+_ALL_NAVS_XPATH = etree.XPath('.//xhtml:nav', namespaces=NAV_NAMESPACES)
+_TITLE_XPATH = etree.XPath('.//xhtml:title', namespaces=NAV_NAMESPACES)
+_BODY_XPATH = etree.XPath('.//xhtml:body', namespaces=NAV_NAMESPACES)
+
 
 class NavElement:
-	"""Base class for navigation document elements."""
+	"""Base class for navigation document elements.
+
+	Wrappers are slotted, since walking a large TOC creates one per list item.
+	"""
+
+	__slots__ = ('element',)
 
 	def __init__(self, element: etree.Element) -> None:
 		self.element = element
@@ -25,6 +50,8 @@ class NavElement:
 class NavAnchor(NavElement):
 	"""Represents an anchor element (a) in navigation."""
 
+	__slots__ = ()
+
 	@property
 	def href(self) -> Optional[str]:
 		"""Get the href attribute."""
@@ -48,50 +75,46 @@ class NavAnchor(NavElement):
 	@property
 	def epub_type(self) -> Optional[str]:
 		"""Get the epub:type attribute."""
-		return self.element.get('{http://www.idpf.org/2007/ops}type')
+		return self.element.get(EPUB_TYPE)
 
 	@epub_type.setter
 	def epub_type(self, value: str) -> None:
 		"""Set the epub:type attribute."""
-		self.element.set('{http://www.idpf.org/2007/ops}type', value)
+		self.element.set(EPUB_TYPE, value)
 
 
 class NavListItem(NavElement):
 	"""Represents a list item (li) in navigation."""
 
+	__slots__ = ()
+
 	@property
 	def anchor(self) -> Optional[NavAnchor]:
 		"""Get the first anchor child element."""
-		anchors = self.element.xpath(
-			'./xhtml:a', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-		)
-		if anchors:
-			return NavAnchor(anchors[0])
+		anchor = self.element.find(_A_TAG)
+		if anchor is not None:
+			return NavAnchor(anchor)
 		return None
 
 	@property
 	def nested_list(self) -> Optional['NavList']:
 		"""Get nested ordered list if present."""
-		lists = self.element.xpath(
-			'./xhtml:ol', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-		)
-		if lists:
-			return NavList(lists[0])
+		ordered_list = self.element.find(_OL_TAG)
+		if ordered_list is not None:
+			return NavList(ordered_list)
 		return None
 
 	@property
 	def span(self) -> Optional[NavElement]:
 		"""Get span element if present (for non-linked text)."""
-		spans = self.element.xpath(
-			'./xhtml:span', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-		)
-		if spans:
-			return NavElement(spans[0])
+		span = self.element.find(_SPAN_TAG)
+		if span is not None:
+			return NavElement(span)
 		return None
 
 	def add_anchor(self, href: str, text: str, epub_type: Optional[str] = None) -> NavAnchor:
 		"""Add an anchor element to this list item."""
-		anchor_element = etree.SubElement(self.element, '{http://www.w3.org/1999/xhtml}a')
+		anchor_element = etree.SubElement(self.element, _A_TAG)
 		anchor = NavAnchor(anchor_element)
 		anchor.href = href
 		anchor.text = text
@@ -101,80 +124,83 @@ class NavListItem(NavElement):
 
 	def add_span(self, text: str) -> NavElement:
 		"""Add a span element to this list item."""
-		span_element = etree.SubElement(self.element, '{http://www.w3.org/1999/xhtml}span')
+		span_element = etree.SubElement(self.element, _SPAN_TAG)
 		span = NavElement(span_element)
 		span.element.text = text
 		return span
 
 	def add_nested_list(self) -> 'NavList':
 		"""Add a nested ordered list to this list item."""
-		ol_element = etree.SubElement(self.element, '{http://www.w3.org/1999/xhtml}ol')
+		ol_element = etree.SubElement(self.element, _OL_TAG)
 		return NavList(ol_element)
 
 
 class NavList(NavElement):
 	"""Represents an ordered list (ol) in navigation."""
 
+	__slots__ = ()
+
 	@property
 	def list_items(self) -> List[NavListItem]:
 		"""Get all list item children."""
-		items = self.element.xpath(
-			'./xhtml:li', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-		)
-		return [NavListItem(item) for item in items]
+		return [NavListItem(item) for item in self.element.iterchildren(_LI_TAG)]
 
 	def add_list_item(self) -> NavListItem:
 		"""Add a new list item to this list."""
-		li_element = etree.SubElement(self.element, '{http://www.w3.org/1999/xhtml}li')
+		li_element = etree.SubElement(self.element, _LI_TAG)
 		return NavListItem(li_element)
 
 	def get_all_items_recursive(self) -> List[NavListItem]:
-		"""Get all list items recursively."""
+		"""Get all list items recursively, in document order."""
 		items = []
 
-		def collect_items(nav_list: NavList):
-			for item in nav_list.list_items:
-				items.append(item)
-				nested_list = item.nested_list
-				if nested_list:
-					collect_items(nested_list)
+		# Follows each item's first nested ol, like nested_list, with a stack of
+		# child iterators instead of recursion
+		stack = [self.element.iterchildren(_LI_TAG)]
+		while stack:
+			li_element = next(stack[-1], None)
+			if li_element is None:
+				stack.pop()
+				continue
+
+			items.append(NavListItem(li_element))
+			nested_list = li_element.find(_OL_TAG)
+			if nested_list is not None:
+				stack.append(nested_list.iterchildren(_LI_TAG))
 
-		collect_items(self)
 		return items
 
 
 class NavSection(NavElement):
 	"""Represents a nav element with specific epub:type."""
 
+	__slots__ = ()
+
 	@property
 	def epub_type(self) -> Optional[str]:
 		"""Get the epub:type attribute."""
-		return self.element.get('{http://www.idpf.org/2007/ops}type')
+		return self.element.get(EPUB_TYPE)
 
 	@epub_type.setter
 	def epub_type(self, value: str) -> None:
 		"""Set the epub:type attribute."""
-		self.element.set('{http://www.idpf.org/2007/ops}type', value)
+		self.element.set(EPUB_TYPE, value)
 
 	@property
 	def heading(self) -> Optional[str]:
 		"""Get the text of the heading element (h1-h6)."""
-		for level in range(1, 7):
-			headings = self.element.xpath(
-				f'./xhtml:h{level}', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-			)
-			if headings:
-				return headings[0].text or ''
+		for tag in _HEADING_TAGS:
+			heading = self.element.find(tag)
+			if heading is not None:
+				return heading.text or ''
 		return None
 
 	@property
 	def ordered_list(self) -> Optional[NavList]:
 		"""Get the ordered list child element."""
-		lists = self.element.xpath(
-			'./xhtml:ol', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-		)
-		if lists:
-			return NavList(lists[0])
+		ordered_list = self.element.find(_OL_TAG)
+		if ordered_list is not None:
+			return NavList(ordered_list)
 		return None
 
 	def add_heading(self, level: int, text: str) -> NavElement:
@@ -182,60 +208,40 @@ class NavSection(NavElement):
 		if not 1 <= level <= 6:
 			raise ValueError('Heading level must be between 1 and 6')
 
-		heading_element = etree.SubElement(
-			self.element, f'{{http://www.w3.org/1999/xhtml}}h{level}'
-		)
+		heading_element = etree.SubElement(self.element, _HEADING_TAGS[level - 1])
 		heading = NavElement(heading_element)
 		heading.element.text = text
 		return heading
 
 	def add_ordered_list(self) -> NavList:
 		"""Add an ordered list to this nav section."""
-		ol_element = etree.SubElement(self.element, '{http://www.w3.org/1999/xhtml}ol')
+		ol_element = etree.SubElement(self.element, _OL_TAG)
 		return NavList(ol_element)
 
 
 class NavDocument(NavElement):
 	"""Represents the root html element of a navigation document."""
 
+	__slots__ = ()
+
 	@property
 	def toc_nav(self) -> Optional[NavSection]:
 		"""Get the table of contents nav section."""
-		navs = self.element.xpath(
-			'.//xhtml:nav[@epub:type="toc"]',
-			namespaces={
-				'xhtml': 'http://www.w3.org/1999/xhtml',
-				'epub': 'http://www.idpf.org/2007/ops',
-			},
-		)
-		if navs:
-			return NavSection(navs[0])
-		return None
+		return self._nav_section('toc')
 
 	@property
 	def page_list_nav(self) -> Optional[NavSection]:
 		"""Get the page list nav section."""
-		navs = self.element.xpath(
-			'.//xhtml:nav[@epub:type="page-list"]',
-			namespaces={
-				'xhtml': 'http://www.w3.org/1999/xhtml',
-				'epub': 'http://www.idpf.org/2007/ops',
-			},
-		)
-		if navs:
-			return NavSection(navs[0])
-		return None
+		return self._nav_section('page-list')
 
 	@property
 	def landmarks_nav(self) -> Optional[NavSection]:
 		"""Get the landmarks nav section."""
-		navs = self.element.xpath(
-			'.//xhtml:nav[@epub:type="landmarks"]',
-			namespaces={
-				'xhtml': 'http://www.w3.org/1999/xhtml',
-				'epub': 'http://www.idpf.org/2007/ops',
-			},
-		)
+		return self._nav_section('landmarks')
+
+	def _nav_section(self, epub_type: str) -> Optional[NavSection]:
+		"""Get the first nav section with the given epub:type."""
+		navs = _NAV_BY_TYPE_XPATH(self.element, type=epub_type)
 		if navs:
 			return NavSection(navs[0])
 		return None
@@ -243,25 +249,18 @@ class NavDocument(NavElement):
 	@property
 	def all_nav_sections(self) -> List[NavSection]:
 		"""Get all nav sections."""
-		navs = self.element.xpath(
-			'.//xhtml:nav', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-		)
-		return [NavSection(nav) for nav in navs]
+		return [NavSection(nav) for nav in _ALL_NAVS_XPATH(self.element)]
 
 	@property
 	def title(self) -> str:
 		"""Get the document title."""
-		title_elements = self.element.xpath(
-			'.//xhtml:title', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-		)
+		title_elements = _TITLE_XPATH(self.element)
 		return title_elements[0].text if title_elements else ''
 
 	@property
 	def body(self) -> Optional[NavElement]:
 		"""Get the body element."""
-		bodies = self.element.xpath(
-			'.//xhtml:body', namespaces={'xhtml': 'http://www.w3.org/1999/xhtml'}
-		)
+		bodies = _BODY_XPATH(self.element)
 		if bodies:
 			return NavElement(bodies[0])
 		return None
@@ -271,10 +270,10 @@ class NavDocument(NavElement):
 		body = self.body
 		if not body:
 			# Create body if it doesn't exist
-			body_element = etree.SubElement(self.element, '{http://www.w3.org/1999/xhtml}body')
+			body_element = etree.SubElement(self.element, _BODY_TAG)
 			body = NavElement(body_element)
 
-		nav_element = etree.SubElement(body.element, '{http://www.w3.org/1999/xhtml}nav')
+		nav_element = etree.SubElement(body.element, _NAV_TAG)
 		nav_section = NavSection(nav_element)
 		nav_section.epub_type = epub_type
 		return nav_section
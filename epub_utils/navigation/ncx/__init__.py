@@ -1,25 +1,66 @@
-import re
-from typing import List, Optional
+import io
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 from lxml import etree
 
-from epub_utils.exceptions import FileNotFoundError as EPUBFileNotFoundError
-from epub_utils.exceptions import ParseError, UnsupportedFormatError
-from epub_utils.navigation.base import Navigation, NavigationItem
+from epub_utils.exceptions import EPUBFileNotFoundError, ParseError, UnsupportedFormatError
+from epub_utils.navigation.base import XML_LANG, Navigation, NavigationItem
+from epub_utils.parser import get_parser
 from epub_utils.printers import XMLPrinter
 
-from .dom import NCXDocument, NCXNavPoint, NCXNavTarget, NCXPageTarget
+from .dom import (
+	_CONTENT_SRC_XPATH,
+	_LABEL_TEXT_XPATH,
+	_NAV_MAP_TAG,
+	_NAV_POINT_TAG,
+	_TEXT_TAG,
+	NCX_NAMESPACES,
+	NCXDocument,
+	NCXNavPoint,
+	NCXNavTarget,
+	NCXPageTarget,
+)
+
+_ROOT_NAV_MAP_XPATH = etree.XPath('/ncx:ncx/ncx:navMap', namespaces=NCX_NAMESPACES)
+_NAV_POINT_BY_ID_XPATH = etree.XPath('.//ncx:navPoint[@id=$id]', namespaces=NCX_NAMESPACES)
+
+# Bytes handed to the pull parser per feed() when streaming inner_text.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# The hardened options, plus: the external DTD is never loaded; comments and processing
+# instructions carry nothing the navigation API reads, so they are dropped, as is
+# the indentation whitespace between elements, which leaves fewer nodes for every
+# traversal to step over.
+_PARSER_OPTIONS = {
+	'resolve_entities': 'internal',
+	'load_dtd': False,
+	'no_network': True,
+	'remove_comments': True,
+	'remove_pis': True,
+	'remove_blank_text': True,
+}
+
+
+def _get_parser() -> etree.XMLParser:
+	"""Return this thread's reusable XMLParser for NCX documents."""
+	return get_parser(**_PARSER_OPTIONS)
 
 
 class NCXNavigation(Navigation):
 	MEDIA_TYPES = ['application/x-dtbncx+xml']
 
 	def __init__(
-		self, xml_content: str, media_type: str = 'application/x-dtbncx+xml', href: str = None
+		self,
+		xml_content: Union[str, bytes],
+		media_type: str = 'application/x-dtbncx+xml',
+		href: str = None,
 	) -> None:
-		self.xml_content = xml_content
+		self._xml_content = xml_content
 
 		self._tree = None
+		self._document: Optional[NCXDocument] = None
+		self._xml_bytes: bytes = None
+		self._inner_text: Optional[str] = None
 
 		self.xmlns = None
 		self.version = None
@@ -40,6 +81,13 @@ class NCXNavigation(Navigation):
 
 		self._printer = XMLPrinter(self)
 
+	@property
+	def xml_content(self) -> str:
+		"""The raw XML content, decoded on first access when given as bytes."""
+		if isinstance(self._xml_content, bytes):
+			self._xml_content = self._xml_content.decode('utf-8')
+		return self._xml_content
+
 	def __str__(self) -> str:
 		return self.xml_content
 
@@ -49,88 +97,202 @@ class NCXNavigation(Navigation):
 	def to_xml(self, *args, **kwargs) -> str:
 		return self._printer.to_xml(*args, **kwargs)
 
+	def to_xml_stream(self, out, *args, **kwargs) -> None:
+		self._printer.to_xml_stream(out, *args, **kwargs)
+
 	def to_plain(self) -> str:
 		return self.inner_text
 
-	def _parse(self, xml_content: str) -> None:
-		try:
-			self._tree = etree.fromstring(xml_content.encode('utf-8'))
+	def _parse(self, xml_content: Union[str, bytes]) -> None:
+		"""
+		Read the root attributes without building the full tree.
+
+		Only the opening tag of the root element is parsed here; the complete
+		document is parsed by ``_parse_full`` the first time ``tree`` is used.
+		"""
+		if isinstance(xml_content, str):
+			xml_content = xml_content.encode('utf-8')
+		self._xml_bytes = xml_content
 
-			root = self._tree
+		try:
+			context = etree.iterparse(
+				io.BytesIO(self._xml_bytes), events=('start',), resolve_entities=False
+			)
+			_, root = next(context)
 
 			self.xmlns = root.nsmap.get(None, '') if root.nsmap else ''
 			self.version = root.get('version', '')
-			self.lang = root.get('{http://www.w3.org/XML/1998/namespace}lang', '')
+			self.lang = root.get(XML_LANG, '')
 
-		except etree.ParseError as e:
-			raise ParseError(
-				f'Invalid XML in NCX navigation file: {str(e)}',
-				suggestions=[
-					'Check that the NCX file contains valid XML',
-					'Verify the file is not corrupted',
-					'Ensure all XML tags are properly closed',
-					'Check for invalid characters in the XML',
-				],
-			) from e
+		except etree.XMLSyntaxError as e:
+			raise self._parse_error(e) from e
+
+	def _parse_full(self) -> None:
+		try:
+			self._tree = etree.fromstring(self._xml_bytes, _get_parser())
+		except etree.XMLSyntaxError as e:
+			raise self._parse_error(e) from e
+
+	@staticmethod
+	def _parse_error(error: Exception) -> ParseError:
+		return ParseError(
+			f'Invalid XML in NCX navigation file: {str(error)}',
+			suggestions=[
+				'Check that the NCX file contains valid XML',
+				'Verify the file is not corrupted',
+				'Ensure all XML tags are properly closed',
+				'Check for invalid characters in the XML',
+			],
+		)
 
 	@property
 	def tree(self):
-		"""Lazily parse and cache the XHTML tree."""
+		"""Lazily parse and cache the NCX tree."""
 		if self._tree is None:
-			self._parse(self.xml_content)
+			self._parse_full()
 		return self._tree
 
 	@property
-	def inner_text(self) -> str:
-		tree = self.tree
-
-		body_elements = tree.xpath('//*[local-name()="body"]')
+	def document(self) -> NCXDocument:
+		"""
+		The DOM wrapper around the tree, built once and shared by every lookup.
+
+		Its navMap, pageList and head metadata lookups are cached along with it.
+		Edits made through this object only add or change entries inside those
+		sections, so the cached lookups stay valid.
+		"""
+		if self._document is None:
+			self._document = NCXDocument(self.tree)
+		return self._document
 
-		if body_elements:
-			inner_text = ''.join(body_elements[0].itertext())
-		else:
-			inner_text = ''.join(tree.itertext())
-
-		# Normalize whitespace
-		inner_text = re.sub(r'\s+', ' ', inner_text).strip()
+	@property
+	def inner_text(self) -> str:
+		"""
+		The whitespace-normalized label text of the navMap, cached until it is edited.
+
+		While the tree has not been built, the text is streamed from the raw
+		bytes instead of parsing the whole document. Falls back to the text of
+		the whole document when there is no navMap.
+		"""
+		if self._inner_text is None:
+			if self._tree is None:
+				self._inner_text = self._stream_inner_text()
+
+			if self._inner_text is None:
+				tree = self.tree
+				nav_maps = _ROOT_NAV_MAP_XPATH(tree)
+				if nav_maps:
+					text = ' '.join(
+						''.join(element.itertext()) for element in nav_maps[0].iter(_TEXT_TAG)
+					)
+				else:
+					text = ' '.join(tree.itertext())
+
+				self._inner_text = ' '.join(text.split())
+		return self._inner_text
+
+	def _stream_inner_text(self) -> Optional[str]:
+		"""
+		Collect the navMap text with a pull parser, stopping at the end of the navMap.
+
+		Returns:
+		    Optional[str]: The normalized text, or None when there is no navMap.
+		"""
+		parser = etree.XMLPullParser(
+			events=('start', 'end'),
+			tag=(_NAV_MAP_TAG, _TEXT_TAG),
+			resolve_entities='internal',
+			load_dtd=False,
+			no_network=True,
+		)
+		data = self._xml_bytes
+		parts = []
+		in_nav_map = False
 
-		return inner_text
+		try:
+			for offset in range(0, len(data), _STREAM_CHUNK_SIZE):
+				parser.feed(data[offset : offset + _STREAM_CHUNK_SIZE])
+
+				for event, element in parser.read_events():
+					if element.tag == _NAV_MAP_TAG:
+						if event == 'end':
+							return ' '.join(' '.join(parts).split())
+						in_nav_map = True
+					elif event == 'end' and in_nav_map:
+						parts.append(''.join(element.itertext()))
+						element.clear()
+		except etree.XMLSyntaxError as e:
+			raise self._parse_error(e) from e
+
+		return None
+
+	def _invalidate_caches(self) -> None:
+		super()._invalidate_caches()
+		self._inner_text = None
 
 	# === Navigation Interface Implementation ===
 
 	def get_toc_items(self) -> List[NavigationItem]:
 		"""Get table of contents as normalized items."""
-		ncx_doc = NCXDocument(self.tree)
+		ncx_doc = self.document
 		nav_map = ncx_doc.nav_map
 		if not nav_map:
 			return []
 
-		return self._convert_nav_points_recursive(nav_map.nav_points, level=0)
+		return self._convert_nav_points_recursive(nav_map.iter_nav_points(), level=0)
+
+	def iter_toc_entries(self) -> Iterator[Tuple[str, str]]:
+		"""
+		Iterate over every TOC entry, nested ones included, in document order.
+
+		Unlike ``get_toc_items``, nothing is collected up front and no wrappers or
+		NavigationItems are built, so memory stays flat however long the TOC is.
+		While the tree has not been built, entries are streamed from the raw
+		bytes instead of parsing the whole document.
+
+		Yields:
+		    Tuple[str, str]: The label and target of each navPoint, '' when missing.
+		"""
+		if self._tree is None:
+			try:
+				for label, target, _, _ in NCXDocument.stream_toc_entries(
+					io.BytesIO(self._xml_bytes)
+				):
+					yield label, target
+			except etree.XMLSyntaxError as e:
+				raise self._parse_error(e) from e
+			return
+
+		nav_map = self.document.nav_map
+		if not nav_map:
+			return
+
+		for element in nav_map.element.iter(_NAV_POINT_TAG):
+			yield _LABEL_TEXT_XPATH(element), _CONTENT_SRC_XPATH(element)
 
 	def get_page_list(self) -> List[NavigationItem]:
 		"""Get page list/breaks as normalized items."""
-		ncx_doc = NCXDocument(self.tree)
+		ncx_doc = self.document
 		page_list = ncx_doc.page_list
 		if not page_list:
 			return []
 
-		return self._convert_page_targets(page_list.page_targets)
+		return self._convert_page_targets(page_list.iter_page_targets())
 
 	def get_landmarks(self) -> List[NavigationItem]:
 		"""Get landmarks/guide references as normalized items."""
-		ncx_doc = NCXDocument(self.tree)
-		nav_lists = ncx_doc.nav_lists
-
+		ncx_doc = self.document
 		items = []
-		for nav_list in nav_lists:
-			for nav_target in nav_list.nav_targets:
+		for nav_list in ncx_doc.iter_nav_lists():
+			for nav_target in nav_list.iter_nav_targets():
 				items.append(self._convert_nav_target(nav_target))
 
 		return items
 
 	def add_toc_item(self, item: NavigationItem, after_id: Optional[str] = None) -> None:
 		"""Add item to table of contents."""
-		ncx_doc = NCXDocument(self.tree)
+		self._invalidate_caches()
+		ncx_doc = self.document
 		nav_map = ncx_doc.nav_map
 		if not nav_map:
 			raise ParseError(
@@ -181,16 +343,14 @@ class NCXNavigation(Navigation):
 
 	def remove_toc_item(self, item_id: str) -> bool:
 		"""Remove item from table of contents by ID."""
-		ncx_doc = NCXDocument(self.tree)
+		self._invalidate_caches()
+		ncx_doc = self.document
 		nav_map = ncx_doc.nav_map
 		if not nav_map:
 			return False
 
 		# Find and remove the navPoint
-		nav_points = nav_map.element.xpath(
-			f'.//ncx:navPoint[@id="{item_id}"]',
-			namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'},
-		)
+		nav_points = _NAV_POINT_BY_ID_XPATH(nav_map.element, id=item_id)
 
 		if nav_points:
 			nav_points[0].getparent().remove(nav_points[0])
@@ -200,16 +360,14 @@ class NCXNavigation(Navigation):
 
 	def update_toc_item(self, item_id: str, **kwargs) -> bool:
 		"""Update existing TOC item properties."""
-		ncx_doc = NCXDocument(self.tree)
+		self._invalidate_caches()
+		ncx_doc = self.document
 		nav_map = ncx_doc.nav_map
 		if not nav_map:
 			return False
 
 		# Find the navPoint
-		nav_points = nav_map.element.xpath(
-			f'.//ncx:navPoint[@id="{item_id}"]',
-			namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'},
-		)
+		nav_points = _NAV_POINT_BY_ID_XPATH(nav_map.element, id=item_id)
 
 		if not nav_points:
 			return False
@@ -237,18 +395,16 @@ class NCXNavigation(Navigation):
 
 	def reorder_toc_items(self, new_order: List[str]) -> None:
 		"""Reorder TOC items by list of IDs."""
+		self._invalidate_caches()
 		# This is a complex operation that would require rebuilding the navMap
 		# For now, we'll update the playOrder attributes
-		ncx_doc = NCXDocument(self.tree)
+		ncx_doc = self.document
 		nav_map = ncx_doc.nav_map
 		if not nav_map:
 			return
 
 		for i, item_id in enumerate(new_order):
-			nav_points = nav_map.element.xpath(
-				f'.//ncx:navPoint[@id="{item_id}"]',
-				namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'},
-			)
+			nav_points = _NAV_POINT_BY_ID_XPATH(nav_map.element, id=item_id)
 			if nav_points:
 				nav_point = NCXNavPoint(nav_points[0])
 				nav_point.play_order = i + 1
@@ -256,39 +412,37 @@ class NCXNavigation(Navigation):
 	# === Helper Methods ===
 
 	def _convert_nav_points_recursive(
-		self, nav_points: List[NCXNavPoint], level: int = 0
+		self, nav_points: Iterable[NCXNavPoint], level: int = 0
 	) -> List[NavigationItem]:
 		"""Convert NCX navPoints to NavigationItems recursively."""
 		items = []
 
 		for nav_point in nav_points:
+			# Convert child nav points first so each item is built complete
+			children = self._convert_nav_points_recursive(nav_point.iter_nav_points(), level + 1)
+
 			item = NavigationItem(
 				id=nav_point.id or '',
-				label=nav_point.label_text,
-				target=nav_point.content_src,
+				label=_LABEL_TEXT_XPATH(nav_point.element),
+				target=_CONTENT_SRC_XPATH(nav_point.element),
 				order=nav_point.play_order,
 				level=level,
 				item_type=nav_point.class_attr,
+				children=children,
 			)
-
-			# Convert child nav points
-			child_nav_points = nav_point.nav_points
-			if child_nav_points:
-				item.children = self._convert_nav_points_recursive(child_nav_points, level + 1)
-
 			items.append(item)
 
 		return items
 
-	def _convert_page_targets(self, page_targets: List[NCXPageTarget]) -> List[NavigationItem]:
+	def _convert_page_targets(self, page_targets: Iterable[NCXPageTarget]) -> List[NavigationItem]:
 		"""Convert NCX pageTargets to NavigationItems."""
 		items = []
 
 		for page_target in page_targets:
 			item = NavigationItem(
 				id=page_target.id or '',
-				label=page_target.label_text,
-				target=page_target.content_src,
+				label=_LABEL_TEXT_XPATH(page_target.element),
+				target=_CONTENT_SRC_XPATH(page_target.element),
 				order=page_target.play_order,
 				level=0,
 				item_type=page_target.type_attr,
@@ -301,8 +455,8 @@ class NCXNavigation(Navigation):
 		"""Convert NCX navTarget to NavigationItem."""
 		return NavigationItem(
 			id=nav_target.id or '',
-			label=nav_target.nav_label.text if nav_target.nav_label else '',
-			target=nav_target.content.src if nav_target.content else '',
+			label=_LABEL_TEXT_XPATH(nav_target.element),
+			target=_CONTENT_SRC_XPATH(nav_target.element),
 			order=nav_target.play_order,
 			level=0,
 			item_type=nav_target.class_attr,
@@ -1,16 +1,99 @@
 """NCX DOM classes for structured access to NCX navigation documents."""
 
-from typing import List, Optional
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
 
 from lxml import etree
+from lxml.builder import ElementMaker
+
+NCX_NAMESPACE = 'http://www.daisy.org/z3986/2005/ncx/'
+NCX_NAMESPACES = {'ncx': NCX_NAMESPACE}
+
+_TEXT_TAG = f'{{{NCX_NAMESPACE}}}text'
+_NAV_LABEL_TAG = f'{{{NCX_NAMESPACE}}}navLabel'
+_CONTENT_TAG = f'{{{NCX_NAMESPACE}}}content'
+_NAV_POINT_TAG = f'{{{NCX_NAMESPACE}}}navPoint'
+_PAGE_TARGET_TAG = f'{{{NCX_NAMESPACE}}}pageTarget'
+_NAV_TARGET_TAG = f'{{{NCX_NAMESPACE}}}navTarget'
+_NAV_MAP_TAG = f'{{{NCX_NAMESPACE}}}navMap'
+_PAGE_LIST_TAG = f'{{{NCX_NAMESPACE}}}pageList'
+_NAV_LIST_TAG = f'{{{NCX_NAMESPACE}}}navList'
+_HEAD_TAG = f'{{{NCX_NAMESPACE}}}head'
+_META_TAG = f'{{{NCX_NAMESPACE}}}meta'
+_DOC_TITLE_TAG = f'{{{NCX_NAMESPACE}}}docTitle'
+_DOC_AUTHOR_TAG = f'{{{NCX_NAMESPACE}}}docAuthor'
+
+_DOC_TITLE_TEXT_PATH = f'.//{_DOC_TITLE_TAG}/{_TEXT_TAG}'
+_DOC_AUTHOR_TEXT_PATH = f'.//{_DOC_AUTHOR_TAG}/{_TEXT_TAG}'
+_LABEL_TEXT_PATH = f'{_NAV_LABEL_TAG}/{_TEXT_TAG}'
+
+# Label and target of a navPoint, pageTarget or navTarget, returned as strings
+# without wrapping the intermediate elements. Both are '' when missing.
+_LABEL_TEXT_XPATH = etree.XPath('string(ncx:navLabel/ncx:text)', namespaces=NCX_NAMESPACES)
+_CONTENT_SRC_XPATH = etree.XPath('string(ncx:content/@src)', namespaces=NCX_NAMESPACES)
+
+_E = ElementMaker(namespace=NCX_NAMESPACE, nsmap={None: NCX_NAMESPACE})
+
+
+def _build_labelled_element(tag: str, attrib: Dict[str, str], label_text: str, src: str):
+	"""Build a navPoint, pageTarget or navTarget with its navLabel and content in one call."""
+	return _E(tag, attrib, _E.navLabel(_E.text(label_text)), _E.content(src=src))
+
+
+def _int_or_none(value: Optional[str]) -> Optional[int]:
+	"""Convert an attribute value to int, treating a missing or empty value as None."""
+	return int(value) if value else None
 
 
 class NCXElement:
-	"""Base class for NCX DOM elements."""
+	"""Base class for NCX DOM elements.
+
+	Wrappers are slotted, since a large TOC creates one per node. Single-child
+	accessors are cached in a slot after the first lookup, so a wrapper
+	reflects the tree as it was when each child was first requested.
+	"""
+
+	__slots__ = ('element',)
 
 	def __init__(self, element: etree.Element):
 		self.element = element
 
+	def _cached_child(self, slot: str, tag: str, wrapper_class: type):
+		"""Return the wrapped first child with ``tag``, looking it up once per wrapper."""
+		try:
+			return getattr(self, slot)
+		except AttributeError:
+			pass
+
+		child = self.element.find(tag)
+		wrapped = wrapper_class(child) if child is not None else None
+		setattr(self, slot, wrapped)
+		return wrapped
+
+	def get_attribute(self, name: str) -> Optional[str]:
+		"""
+		Get an attribute of the element.
+
+		NCX attributes live in the null namespace, so this is a plain lookup; any
+		coercion, such as ``play_order`` to int, belongs to the property that needs it.
+
+		Args:
+		    name: Name of the attribute, e.g. ``class``
+
+		Returns:
+		    The attribute value, or None if it is not set
+		"""
+		return self.element.get(name)
+
+	def set_attribute(self, name: str, value: str) -> None:
+		"""
+		Set an attribute of the element.
+
+		Args:
+		    name: Name of the attribute, e.g. ``class``
+		    value: Value to set
+		"""
+		self.element.set(name, value)
+
 	@property
 	def id(self) -> Optional[str]:
 		"""Get the id attribute."""
@@ -25,6 +108,8 @@ class NCXElement:
 class NCXText(NCXElement):
 	"""Represents a text element."""
 
+	__slots__ = ()
+
 	@property
 	def text(self) -> str:
 		"""Get the text content."""
@@ -39,6 +124,8 @@ class NCXText(NCXElement):
 class NCXContent(NCXElement):
 	"""Represents a content element."""
 
+	__slots__ = ()
+
 	@property
 	def src(self) -> Optional[str]:
 		"""Get the src attribute."""
@@ -53,21 +140,17 @@ class NCXContent(NCXElement):
 class NCXNavLabel(NCXElement):
 	"""Represents a navLabel element."""
 
+	__slots__ = ('_text_element',)
+
 	@property
 	def text_element(self) -> Optional[NCXText]:
 		"""Get the text child element."""
-		text_elements = self.element.xpath(
-			'./ncx:text', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		if text_elements:
-			return NCXText(text_elements[0])
-		return None
+		return self._cached_child('_text_element', _TEXT_TAG, NCXText)
 
 	@property
 	def text(self) -> str:
 		"""Get the text content."""
-		text_elem = self.text_element
-		return text_elem.text if text_elem else ''
+		return self.element.findtext(_TEXT_TAG, '')
 
 	@text.setter
 	def text(self, value: str) -> None:
@@ -77,15 +160,16 @@ class NCXNavLabel(NCXElement):
 			text_elem.text = value
 		else:
 			# Create text element if it doesn't exist
-			text_element = etree.SubElement(
-				self.element, '{http://www.daisy.org/z3986/2005/ncx/}text'
-			)
+			text_element = etree.SubElement(self.element, _TEXT_TAG)
 			text_element.text = value
+			self._text_element = NCXText(text_element)
 
 
 class NCXNavPoint(NCXElement):
 	"""Represents a navPoint element in the navigation hierarchy."""
 
+	__slots__ = ('_content', '_nav_label')
+
 	@property
 	def class_attr(self) -> Optional[str]:
 		"""Get the class attribute."""
@@ -99,8 +183,7 @@ class NCXNavPoint(NCXElement):
 	@property
 	def play_order(self) -> Optional[int]:
 		"""Get the playOrder attribute."""
-		play_order = self.element.get('playOrder')
-		return int(play_order) if play_order else None
+		return _int_or_none(self.element.get('playOrder'))
 
 	@play_order.setter
 	def play_order(self, value: int) -> None:
@@ -110,30 +193,22 @@ class NCXNavPoint(NCXElement):
 	@property
 	def nav_label(self) -> Optional[NCXNavLabel]:
 		"""Get the navLabel child element."""
-		nav_labels = self.element.xpath(
-			'./ncx:navLabel', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		if nav_labels:
-			return NCXNavLabel(nav_labels[0])
-		return None
+		return self._cached_child('_nav_label', _NAV_LABEL_TAG, NCXNavLabel)
 
 	@property
 	def content(self) -> Optional[NCXContent]:
 		"""Get the content child element."""
-		content_elements = self.element.xpath(
-			'./ncx:content', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		if content_elements:
-			return NCXContent(content_elements[0])
-		return None
+		return self._cached_child('_content', _CONTENT_TAG, NCXContent)
 
 	@property
 	def nav_points(self) -> List['NCXNavPoint']:
 		"""Get child navPoint elements."""
-		nav_point_elements = self.element.xpath(
-			'./ncx:navPoint', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		return [NCXNavPoint(point) for point in nav_point_elements]
+		return list(self.iter_nav_points())
+
+	def iter_nav_points(self) -> Iterator['NCXNavPoint']:
+		"""Iterate over child navPoint elements, wrapping each one as it is reached."""
+		for point in self.element.iterchildren(_NAV_POINT_TAG):
+			yield NCXNavPoint(point)
 
 	def add_nav_point(
 		self,
@@ -144,56 +219,41 @@ class NCXNavPoint(NCXElement):
 		play_order: Optional[int] = None,
 	) -> 'NCXNavPoint':
 		"""Add a child navPoint element."""
-		nav_point_element = etree.SubElement(
-			self.element, '{http://www.daisy.org/z3986/2005/ncx/}navPoint'
-		)
-		nav_point = NCXNavPoint(nav_point_element)
-		nav_point.id = id
-
+		attrib = {'id': id}
 		if class_attr:
-			nav_point.class_attr = class_attr
+			attrib['class'] = class_attr
 		if play_order is not None:
-			nav_point.play_order = play_order
-
-		# Add navLabel
-		nav_label_element = etree.SubElement(
-			nav_point_element, '{http://www.daisy.org/z3986/2005/ncx/}navLabel'
-		)
-		nav_label = NCXNavLabel(nav_label_element)
-		nav_label.text = label_text
+			attrib['playOrder'] = str(play_order)
 
-		# Add content
-		content_element = etree.SubElement(
-			nav_point_element, '{http://www.daisy.org/z3986/2005/ncx/}content'
-		)
-		content = NCXContent(content_element)
-		content.src = src
-
-		return nav_point
+		nav_point_element = _build_labelled_element('navPoint', attrib, label_text, src)
+		self.element.append(nav_point_element)
+		return NCXNavPoint(nav_point_element)
 
 	@property
 	def label_text(self) -> str:
 		"""Get the text of the navLabel."""
-		nav_label = self.nav_label
-		return nav_label.text if nav_label else ''
+		return self.element.findtext(_LABEL_TEXT_PATH, '')
 
 	@property
 	def content_src(self) -> str:
 		"""Get the src of the content element."""
-		content = self.content
-		return content.src if content else ''
+		return _CONTENT_SRC_XPATH(self.element)
 
 
 class NCXNavMap(NCXElement):
 	"""Represents the navMap element."""
 
+	__slots__ = ()
+
 	@property
 	def nav_points(self) -> List[NCXNavPoint]:
 		"""Get all direct child navPoint elements."""
-		nav_point_elements = self.element.xpath(
-			'./ncx:navPoint', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		return [NCXNavPoint(point) for point in nav_point_elements]
+		return list(self.iter_nav_points())
+
+	def iter_nav_points(self) -> Iterator[NCXNavPoint]:
+		"""Iterate over direct child navPoint elements, wrapping each one as it is reached."""
+		for point in self.element.iterchildren(_NAV_POINT_TAG):
+			yield NCXNavPoint(point)
 
 	def add_nav_point(
 		self,
@@ -204,44 +264,31 @@ class NCXNavMap(NCXElement):
 		play_order: Optional[int] = None,
 	) -> NCXNavPoint:
 		"""Add a navPoint element."""
-		nav_point_element = etree.SubElement(
-			self.element, '{http://www.daisy.org/z3986/2005/ncx/}navPoint'
-		)
-		nav_point = NCXNavPoint(nav_point_element)
-		nav_point.id = id
-
+		attrib = {'id': id}
 		if class_attr:
-			nav_point.class_attr = class_attr
+			attrib['class'] = class_attr
 		if play_order is not None:
-			nav_point.play_order = play_order
-
-		# Add navLabel
-		nav_label_element = etree.SubElement(
-			nav_point_element, '{http://www.daisy.org/z3986/2005/ncx/}navLabel'
-		)
-		nav_label = NCXNavLabel(nav_label_element)
-		nav_label.text = label_text
-
-		# Add content
-		content_element = etree.SubElement(
-			nav_point_element, '{http://www.daisy.org/z3986/2005/ncx/}content'
-		)
-		content = NCXContent(content_element)
-		content.src = src
+			attrib['playOrder'] = str(play_order)
 
-		return nav_point
+		nav_point_element = _build_labelled_element('navPoint', attrib, label_text, src)
+		self.element.append(nav_point_element)
+		return NCXNavPoint(nav_point_element)
 
 	def get_all_nav_points(self) -> List[NCXNavPoint]:
 		"""Get all navPoint elements recursively."""
-		nav_point_elements = self.element.xpath(
-			'.//ncx:navPoint', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		return [NCXNavPoint(point) for point in nav_point_elements]
+		return list(self.iter_all_nav_points())
+
+	def iter_all_nav_points(self) -> Iterator[NCXNavPoint]:
+		"""Iterate over all descendant navPoint elements in document order."""
+		for point in self.element.iter(_NAV_POINT_TAG):
+			yield NCXNavPoint(point)
 
 
 class NCXPageTarget(NCXElement):
 	"""Represents a pageTarget element."""
 
+	__slots__ = ('_content', '_nav_label')
+
 	@property
 	def type_attr(self) -> Optional[str]:
 		"""Get the type attribute."""
@@ -265,8 +312,7 @@ class NCXPageTarget(NCXElement):
 	@property
 	def play_order(self) -> Optional[int]:
 		"""Get the playOrder attribute."""
-		play_order = self.element.get('playOrder')
-		return int(play_order) if play_order else None
+		return _int_or_none(self.element.get('playOrder'))
 
 	@play_order.setter
 	def play_order(self, value: int) -> None:
@@ -276,46 +322,38 @@ class NCXPageTarget(NCXElement):
 	@property
 	def nav_label(self) -> Optional[NCXNavLabel]:
 		"""Get the navLabel child element."""
-		nav_labels = self.element.xpath(
-			'./ncx:navLabel', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		if nav_labels:
-			return NCXNavLabel(nav_labels[0])
-		return None
+		return self._cached_child('_nav_label', _NAV_LABEL_TAG, NCXNavLabel)
 
 	@property
 	def content(self) -> Optional[NCXContent]:
 		"""Get the content child element."""
-		content_elements = self.element.xpath(
-			'./ncx:content', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		if content_elements:
-			return NCXContent(content_elements[0])
-		return None
+		return self._cached_child('_content', _CONTENT_TAG, NCXContent)
 
 	@property
 	def label_text(self) -> str:
 		"""Get the text of the navLabel."""
-		nav_label = self.nav_label
-		return nav_label.text if nav_label else ''
+		return self.element.findtext(_LABEL_TEXT_PATH, '')
 
 	@property
 	def content_src(self) -> str:
 		"""Get the src of the content element."""
-		content = self.content
-		return content.src if content else ''
+		return _CONTENT_SRC_XPATH(self.element)
 
 
 class NCXPageList(NCXElement):
 	"""Represents the pageList element."""
 
+	__slots__ = ()
+
 	@property
 	def page_targets(self) -> List[NCXPageTarget]:
 		"""Get all pageTarget elements."""
-		page_target_elements = self.element.xpath(
-			'./ncx:pageTarget', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		return [NCXPageTarget(target) for target in page_target_elements]
+		return list(self.iter_page_targets())
+
+	def iter_page_targets(self) -> Iterator[NCXPageTarget]:
+		"""Iterate over pageTarget elements, wrapping each one as it is reached."""
+		for target in self.element.iterchildren(_PAGE_TARGET_TAG):
+			yield NCXPageTarget(target)
 
 	def add_page_target(
 		self,
@@ -327,37 +365,20 @@ class NCXPageList(NCXElement):
 		play_order: Optional[int] = None,
 	) -> NCXPageTarget:
 		"""Add a pageTarget element."""
-		page_target_element = etree.SubElement(
-			self.element, '{http://www.daisy.org/z3986/2005/ncx/}pageTarget'
-		)
-		page_target = NCXPageTarget(page_target_element)
-		page_target.id = id
-		page_target.type_attr = type_attr
-		page_target.value = value
-
+		attrib = {'id': id, 'type': type_attr, 'value': value}
 		if play_order is not None:
-			page_target.play_order = play_order
-
-		# Add navLabel
-		nav_label_element = etree.SubElement(
-			page_target_element, '{http://www.daisy.org/z3986/2005/ncx/}navLabel'
-		)
-		nav_label = NCXNavLabel(nav_label_element)
-		nav_label.text = label_text
-
-		# Add content
-		content_element = etree.SubElement(
-			page_target_element, '{http://www.daisy.org/z3986/2005/ncx/}content'
-		)
-		content = NCXContent(content_element)
-		content.src = src
+			attrib['playOrder'] = str(play_order)
 
-		return page_target
+		page_target_element = _build_labelled_element('pageTarget', attrib, label_text, src)
+		self.element.append(page_target_element)
+		return NCXPageTarget(page_target_element)
 
 
 class NCXNavTarget(NCXElement):
 	"""Represents a navTarget element."""
 
+	__slots__ = ('_content', '_nav_label')
+
 	@property
 	def value(self) -> Optional[str]:
 		"""Get the value attribute."""
@@ -381,8 +402,7 @@ class NCXNavTarget(NCXElement):
 	@property
 	def play_order(self) -> Optional[int]:
 		"""Get the playOrder attribute."""
-		play_order = self.element.get('playOrder')
-		return int(play_order) if play_order else None
+		return _int_or_none(self.element.get('playOrder'))
 
 	@play_order.setter
 	def play_order(self, value: int) -> None:
@@ -392,156 +412,189 @@ class NCXNavTarget(NCXElement):
 	@property
 	def nav_label(self) -> Optional[NCXNavLabel]:
 		"""Get the navLabel child element."""
-		nav_labels = self.element.xpath(
-			'./ncx:navLabel', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		if nav_labels:
-			return NCXNavLabel(nav_labels[0])
-		return None
+		return self._cached_child('_nav_label', _NAV_LABEL_TAG, NCXNavLabel)
 
 	@property
 	def content(self) -> Optional[NCXContent]:
 		"""Get the content child element."""
-		content_elements = self.element.xpath(
-			'./ncx:content', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		if content_elements:
-			return NCXContent(content_elements[0])
-		return None
+		return self._cached_child('_content', _CONTENT_TAG, NCXContent)
 
 
 class NCXNavList(NCXElement):
 	"""Represents the navList element."""
 
+	__slots__ = ('_nav_label',)
+
 	@property
 	def nav_label(self) -> Optional[NCXNavLabel]:
 		"""Get the navLabel child element."""
-		nav_labels = self.element.xpath(
-			'./ncx:navLabel', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		if nav_labels:
-			return NCXNavLabel(nav_labels[0])
-		return None
+		return self._cached_child('_nav_label', _NAV_LABEL_TAG, NCXNavLabel)
 
 	@property
 	def nav_targets(self) -> List[NCXNavTarget]:
 		"""Get all navTarget elements."""
-		nav_target_elements = self.element.xpath(
-			'./ncx:navTarget', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		return [NCXNavTarget(target) for target in nav_target_elements]
+		return list(self.iter_nav_targets())
+
+	def iter_nav_targets(self) -> Iterator[NCXNavTarget]:
+		"""Iterate over navTarget elements, wrapping each one as it is reached."""
+		for target in self.element.iterchildren(_NAV_TARGET_TAG):
+			yield NCXNavTarget(target)
 
 	def add_nav_target(
 		self, id: str, label_text: str, src: str, play_order: Optional[int] = None
 	) -> NCXNavTarget:
 		"""Add a navTarget element."""
-		nav_target_element = etree.SubElement(
-			self.element, '{http://www.daisy.org/z3986/2005/ncx/}navTarget'
-		)
-		nav_target = NCXNavTarget(nav_target_element)
-		nav_target.id = id
-
+		attrib = {'id': id}
 		if play_order is not None:
-			nav_target.play_order = play_order
-
-		# Add navLabel
-		nav_label_element = etree.SubElement(
-			nav_target_element, '{http://www.daisy.org/z3986/2005/ncx/}navLabel'
-		)
-		nav_label = NCXNavLabel(nav_label_element)
-		nav_label.text = label_text
+			attrib['playOrder'] = str(play_order)
 
-		# Add content
-		content_element = etree.SubElement(
-			nav_target_element, '{http://www.daisy.org/z3986/2005/ncx/}content'
-		)
-		content = NCXContent(content_element)
-		content.src = src
-
-		return nav_target
+		nav_target_element = _build_labelled_element('navTarget', attrib, label_text, src)
+		self.element.append(nav_target_element)
+		return NCXNavTarget(nav_target_element)
 
 	@property
 	def label_text(self) -> str:
 		"""Get the text of the navLabel."""
-		nav_label = self.nav_label
-		return nav_label.text if nav_label else ''
+		return self.element.findtext(_LABEL_TEXT_PATH, '')
 
 
 class NCXDocument(NCXElement):
 	"""Represents the root ncx element."""
 
+	__slots__ = ('_meta_map', '_nav_map', '_page_list')
+
 	@property
 	def nav_map(self) -> Optional[NCXNavMap]:
 		"""Get the navMap element."""
-		nav_map_elements = self.element.xpath(
-			'./ncx:navMap', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		if nav_map_elements:
-			return NCXNavMap(nav_map_elements[0])
-		return None
+		return self._cached_child('_nav_map', _NAV_MAP_TAG, NCXNavMap)
 
 	@property
 	def page_list(self) -> Optional[NCXPageList]:
 		"""Get the pageList element."""
-		page_list_elements = self.element.xpath(
-			'./ncx:pageList', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		if page_list_elements:
-			return NCXPageList(page_list_elements[0])
-		return None
+		return self._cached_child('_page_list', _PAGE_LIST_TAG, NCXPageList)
 
 	@property
 	def nav_lists(self) -> List[NCXNavList]:
 		"""Get all navList elements."""
-		nav_list_elements = self.element.xpath(
-			'./ncx:navList', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		return [NCXNavList(nav_list) for nav_list in nav_list_elements]
+		return list(self.iter_nav_lists())
+
+	def iter_nav_lists(self) -> Iterator[NCXNavList]:
+		"""Iterate over navList elements, wrapping each one as it is reached."""
+		for nav_list in self.element.iterchildren(_NAV_LIST_TAG):
+			yield NCXNavList(nav_list)
+
+	@classmethod
+	def stream_toc_entries(
+		cls, source: Union[str, IO[bytes]]
+	) -> Iterator[Tuple[str, str, Optional[int], int]]:
+		"""
+		Stream the navMap entries of an NCX file without keeping its tree in memory.
+
+		Entries come in document order, as from ``NCXNavMap.iter_all_nav_points``.
+		Each navPoint is cleared once it ends and parsing stops at the end of the
+		navMap, so memory stays bounded however many entries the file holds.
+
+		Args:
+		    source: A file path or a binary file object holding the NCX document.
+
+		Yields:
+		    Tuple[str, str, Optional[int], int]: The label, content src, playOrder
+		    and nesting depth (0 for top level) of each navPoint. Missing labels
+		    and sources are ''.
+		"""
+		context = etree.iterparse(
+			source,
+			events=('start', 'end'),
+			tag=(_NAV_MAP_TAG, _NAV_POINT_TAG, _CONTENT_TAG),
+			resolve_entities='internal',
+			load_dtd=False,
+			no_network=True,
+		)
+		# One [element, yielded] pair per open navPoint
+		open_points = []
+
+		def entry(element):
+			# Read as the tree path does, so both give the same label and src
+			return (
+				_LABEL_TEXT_XPATH(element),
+				_CONTENT_SRC_XPATH(element),
+				_int_or_none(element.get('playOrder')),
+				len(open_points) - 1,
+			)
+
+		for event, element in context:
+			tag = element.tag
+			if tag == _NAV_MAP_TAG:
+				if event == 'end':
+					return
+			elif tag == _CONTENT_TAG:
+				# The label precedes the content, so the entry is complete here
+				if event == 'end' and open_points:
+					current = open_points[-1]
+					if not current[1] and element.getparent() is current[0]:
+						current[1] = True
+						yield entry(current[0])
+			elif event == 'start':
+				if open_points and not open_points[-1][1]:
+					# A child begins before any content: emit the parent first
+					open_points[-1][1] = True
+					yield entry(open_points[-1][0])
+				open_points.append([element, False])
+			else:
+				if not open_points[-1][1]:
+					yield entry(element)
+				open_points.pop()
+				element.clear()
+				while element.getprevious() is not None:
+					del element.getparent()[0]
 
 	@property
 	def title(self) -> str:
 		"""Get the document title text."""
-		title_elements = self.element.xpath(
-			'.//ncx:docTitle/ncx:text', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		return title_elements[0].text if title_elements else ''
+		return self.element.findtext(_DOC_TITLE_TEXT_PATH, '')
 
 	@property
 	def author(self) -> str:
 		"""Get the document author text."""
-		author_elements = self.element.xpath(
-			'.//ncx:docAuthor/ncx:text', namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'}
-		)
-		return author_elements[0].text if author_elements else ''
+		return self.element.findtext(_DOC_AUTHOR_TEXT_PATH, '')
+
+	@property
+	def meta_map(self) -> Dict[str, str]:
+		"""Map each head meta name to its content, read in a single pass.
+
+		When a name appears more than once, the first meta wins.
+		"""
+		try:
+			return self._meta_map
+		except AttributeError:
+			pass
+
+		meta_map = {}
+		head = self.element.find(_HEAD_TAG)
+		if head is not None:
+			for meta in head.iterchildren(_META_TAG):
+				name = meta.get('name')
+				if name is not None:
+					meta_map.setdefault(name, meta.get('content'))
+		self._meta_map = meta_map
+		return meta_map
+
+	def _get_int_meta(self, name: str) -> Optional[int]:
+		"""Get a meta content parsed as an integer, or None when it is missing or empty."""
+		return _int_or_none(self.meta_map.get(name))
 
 	def get_uid(self) -> Optional[str]:
 		"""Get the dtb:uid meta content."""
-		uid_elements = self.element.xpath(
-			'.//ncx:meta[@name="dtb:uid"]/@content',
-			namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'},
-		)
-		return uid_elements[0] if uid_elements else None
+		return self.meta_map.get('dtb:uid')
 
 	def get_depth(self) -> Optional[int]:
 		"""Get the dtb:depth meta content."""
-		depth_elements = self.element.xpath(
-			'.//ncx:meta[@name="dtb:depth"]/@content',
-			namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'},
-		)
-		return int(depth_elements[0]) if depth_elements else None
+		return self._get_int_meta('dtb:depth')
 
 	def get_total_page_count(self) -> Optional[int]:
 		"""Get the dtb:totalPageCount meta content."""
-		count_elements = self.element.xpath(
-			'.//ncx:meta[@name="dtb:totalPageCount"]/@content',
-			namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'},
-		)
-		return int(count_elements[0]) if count_elements else None
+		return self._get_int_meta('dtb:totalPageCount')
 
 	def get_max_page_number(self) -> Optional[int]:
 		"""Get the dtb:maxPageNumber meta content."""
-		max_elements = self.element.xpath(
-			'.//ncx:meta[@name="dtb:maxPageNumber"]/@content',
-			namespaces={'ncx': 'http://www.daisy.org/z3986/2005/ncx/'},
-		)
-		return int(max_elements[0]) if max_elements else None
+		return self._get_int_meta('dtb:maxPageNumber')
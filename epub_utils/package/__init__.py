@@ -12,19 +12,30 @@ For more details on the structure and requirements of the OPF file, refer to the
 EPUB specification: https://www.w3.org/TR/epub/#sec-package-doc
 """
 
-try:
-	from lxml import etree
-except ImportError:
-	import xml.etree.ElementTree as etree
+import re
+from functools import lru_cache
+from typing import Union
 
 import packaging.version
+from lxml import etree
 
 from epub_utils.exceptions import InvalidEPUBError, ParseError, UnsupportedFormatError
 from epub_utils.package.manifest import Manifest
 from epub_utils.package.metadata import Metadata
 from epub_utils.package.spine import Spine
+from epub_utils.parser import get_parser
 from epub_utils.printers import XMLPrinter
 
+# The package start tag is near the top of an OPF file, so only its head is searched.
+_VERSION_SNIFF_BYTES = 4096
+_PACKAGE_VERSION_RE = re.compile(rb'<(?:\w+:)?package\b[^>]*?\sversion\s*=\s*["\']([^"\']*)["\']')
+
+
+@lru_cache(maxsize=16)
+def _cached_version(version: str) -> packaging.version.Version:
+	"""Parse a version string, reusing the result for strings seen before."""
+	return packaging.version.Version(version)
+
 
 class Package:
 	"""
@@ -42,24 +53,27 @@ class Package:
 	"""
 
 	NAMESPACE = 'http://www.idpf.org/2007/opf'
+	TAG_PREFIX = f'{{{NAMESPACE}}}'
 	DC_NAMESPACE = 'http://purl.org/dc/elements/1.1/'
 	METADATA_XPATH = f'.//{{{NAMESPACE}}}metadata'
 	SPINE_XPATH = f'.//{{{NAMESPACE}}}spine'
 	MANIFEST_XPATH = f'.//{{{NAMESPACE}}}manifest'
 	ITEM_XPATH = f'.//{{{NAMESPACE}}}item'
 	NCX_MEDIA_TYPE = 'application/x-dtbncx+xml'
+	TOC_REFERENCE_XPATH = f".//{{{NAMESPACE}}}reference[@type='toc']"
 	TITLE_XPATH = f'.//{{{DC_NAMESPACE}}}title'
 	CREATOR_XPATH = f'.//{{{DC_NAMESPACE}}}creator'
 	IDENTIFIER_XPATH = f'.//{{{DC_NAMESPACE}}}identifier'
 
-	def __init__(self, xml_content: str) -> None:
+	def __init__(self, xml_content: Union[str, bytes]) -> None:
 		"""
 		Initialize the Package by parsing the OPF package file.
 
 		Args:
-		    xml_content (str): The raw XML content of the OPF package file.
+		    xml_content (Union[str, bytes]): The raw XML content of the OPF package file.
+		        Bytes are parsed as they are and only decoded if the text is requested.
 		"""
-		self.xml_content = xml_content
+		self._xml_content = xml_content
 
 		self.metadata = None
 		self.manifest = None
@@ -74,6 +88,13 @@ class Package:
 
 		self._printer = XMLPrinter(self)
 
+	@property
+	def xml_content(self) -> str:
+		"""The raw XML content, decoded on first access when given as bytes."""
+		if isinstance(self._xml_content, bytes):
+			self._xml_content = self._xml_content.decode('utf-8')
+		return self._xml_content
+
 	def __str__(self) -> str:
 		return self.xml_content
 
@@ -83,12 +104,15 @@ class Package:
 	def to_xml(self, *args, **kwargs) -> str:
 		return self._printer.to_xml(*args, **kwargs)
 
-	def _parse(self, xml_content: str) -> None:
+	def to_xml_stream(self, out, *args, **kwargs) -> None:
+		self._printer.to_xml_stream(out, *args, **kwargs)
+
+	def _parse(self, xml_content: Union[str, bytes]) -> None:
 		"""
 		Parses the OPF package file to extract metadata.
 
 		Args:
-		    xml_content (str): The raw XML content of the OPF package file.
+		    xml_content (Union[str, bytes]): The raw XML content of the OPF package file.
 
 		Raises:
 		    ParseError: If the XML is invalid or cannot be parsed.
@@ -97,23 +121,33 @@ class Package:
 		try:
 			if isinstance(xml_content, str):
 				xml_content = xml_content.encode('utf-8')
-			root = etree.fromstring(xml_content)
 
-			# Check for version attribute
-			if 'version' not in root.attrib:
-				raise InvalidEPUBError(
-					"OPF file missing required 'version' attribute",
-					suggestions=[
-						'Ensure the package element has a version attribute',
-						'Check that this is a valid EPUB OPF file',
-						'Verify the EPUB was created with compliant tools',
-					],
+			# Reject an unsupported version before paying for the parse
+			version_match = _PACKAGE_VERSION_RE.search(xml_content, 0, _VERSION_SNIFF_BYTES)
+			if version_match:
+				self.version = self._parse_version(
+					version_match.group(1).decode('utf-8', 'replace')
 				)
 
-			self.version = self._parse_version(root.attrib['version'])
+			root = etree.fromstring(xml_content, get_parser())
+
+			# The sniff only reads the head of the file, so fall back to the parsed root
+			if not version_match:
+				if 'version' not in root.attrib:
+					raise InvalidEPUBError(
+						"OPF file missing required 'version' attribute",
+						suggestions=[
+							'Ensure the package element has a version attribute',
+							'Check that this is a valid EPUB OPF file',
+							'Verify the EPUB was created with compliant tools',
+						],
+					)
+				self.version = self._parse_version(root.attrib['version'])
+
+			sections = self._find_sections(root)
 
 			# Parse metadata
-			metadata_el = root.find(self.METADATA_XPATH)
+			metadata_el = sections.get('metadata')
 			if metadata_el is None:
 				raise InvalidEPUBError(
 					'OPF file missing required metadata element',
@@ -123,14 +157,12 @@ class Package:
 						'Verify all required OPF elements are present',
 					],
 				)
-			metadata_xml = etree.tostring(metadata_el, encoding='unicode')
-			self.metadata = Metadata(metadata_xml)
+			self.metadata = Metadata.from_element(metadata_el)
 
 			# Parse manifest
-			manifest_el = root.find(self.MANIFEST_XPATH)
+			manifest_el = sections.get('manifest')
 			if manifest_el is not None:
-				manifest_xml = etree.tostring(manifest_el, encoding='unicode')
-				self.manifest = Manifest(manifest_xml)
+				self.manifest = Manifest.from_element(manifest_el)
 			else:
 				raise InvalidEPUBError(
 					'OPF file missing required manifest element',
@@ -142,10 +174,9 @@ class Package:
 				)
 
 			# Parse spine
-			spine_el = root.find(self.SPINE_XPATH)
+			spine_el = sections.get('spine')
 			if spine_el is not None:
-				spine_xml = etree.tostring(spine_el, encoding='unicode')
-				self.spine = Spine(spine_xml)
+				self.spine = Spine.from_element(spine_el)
 			else:
 				raise InvalidEPUBError(
 					'OPF file missing required spine element',
@@ -158,9 +189,9 @@ class Package:
 
 			# Parse TOC references
 			if self.version.major == 3:
-				self.nav_href = self._find_nav_href(root)
+				self.nav_href = self._find_nav_href(sections.get('guide'))
 			else:
-				self.toc_href = self._find_toc_href(root)
+				self.toc_href = self._find_toc_href()
 
 		except etree.ParseError as e:
 			raise ParseError(
@@ -187,60 +218,74 @@ class Package:
 		element = root.find(xpath)
 		return element.text.strip() if element is not None and element.text else None
 
-	def _find_toc_href(self, root: etree.Element) -> str:
+	def _find_sections(self, root: etree.Element) -> dict:
 		"""
-		Find the publication navigation control file.
+		Collect the top-level package sections in a single pass over the root's children.
 
 		Args:
 		    root (etree.Element): The root element of the OPF document.
 
+		Returns:
+		    dict: The first element of each section, keyed by local name
+		    (``metadata``, ``manifest``, ``spine``, ``guide``).
+		"""
+		prefix = self.TAG_PREFIX
+		sections = {}
+		for child in root:
+			tag = child.tag
+			if isinstance(tag, str) and tag.startswith(prefix):
+				sections.setdefault(tag[len(prefix) :], child)
+		return sections
+
+	def _find_toc_href(self) -> str:
+		"""
+		Find the publication navigation control file.
+
+		The manifest items already read from the tree are searched, so the
+		manifest element is not walked again.
+
 		Returns:
 		    str: The href to the NCX document, or None if not found.
 		"""
 		# First check for NCX media-type in manifest
-		for item in root.findall(self.ITEM_XPATH):
-			if item.get('media-type') == self.NCX_MEDIA_TYPE:
-				return item.get('href')
-
-		# Then check spine toc attribute
-		spine = root.find(self.SPINE_XPATH)
-		if spine is not None:
-			toc_id = spine.get('toc')
-			if toc_id:
-				for item in root.findall(self.ITEM_XPATH):
-					if item.get('id') == toc_id:
-						href = item.get('href')
-						if href:
-							# Remove fragment identifier if present
-							return href.split('#')[0]
+		for item in self.manifest.items:
+			if item['media_type'] == self.NCX_MEDIA_TYPE:
+				return item['href']
+
+		# Then check spine toc attribute, using the manifest already read from the tree
+		toc_id = self.spine.toc
+		if toc_id:
+			item = self.manifest.find_by_id(toc_id)
+			if item is not None:
+				# Remove fragment identifier if present
+				return item['href'].split('#')[0]
 
 		return None
 
-	def _find_nav_href(self, root: etree.Element) -> str:
+	def _find_nav_href(self, guide_el: etree.Element = None) -> str:
 		"""
 		Find the publication navigation file.
 
+		The manifest items already read from the tree are searched, so the
+		manifest element is not walked again.
+
 		Args:
-		    root (etree.Element): The root element of the OPF document.
+		    guide_el (etree.Element): The guide element of the OPF document, if any.
 
 		Returns:
 		    str: The href to navigation file, or None if not found.
 		"""
-		# Check for item with nav properties
-		for item in root.findall(self.ITEM_XPATH):
-			if item.get('properties') == 'nav':
-				href = item.get('href')
-				if href:
-					return href.split('#')[0]
+		# Check for item with nav among its properties
+		for item in self.manifest.items:
+			if 'nav' in item['properties'] and item['href']:
+				return item['href'].split('#')[0]
 
 		# Fall back to guide TOC reference
-		guide = root.find(f'.//{{{self.NAMESPACE}}}guide')
-		if guide is not None:
-			for reference in guide.findall(f'.//{{{self.NAMESPACE}}}reference'):
-				if reference.get('type') == 'toc':
-					href = reference.get('href')
-					if href:
-						return href.split('#')[0]
+		if guide_el is not None:
+			for reference in guide_el.iterfind(self.TOC_REFERENCE_XPATH):
+				href = reference.get('href')
+				if href:
+					return href.split('#')[0]
 
 		return None
 
@@ -258,7 +303,7 @@ class Package:
 		    UnsupportedFormatError: If the EPUB version is not supported.
 		"""
 		try:
-			version_obj = packaging.version.Version(version)
+			version_obj = _cached_version(version)
 		except packaging.version.InvalidVersion as e:
 			raise InvalidEPUBError(
 				f"Invalid version format in OPF file: '{version}'",
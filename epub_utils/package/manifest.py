@@ -1,9 +1,9 @@
-try:
-	from lxml import etree
-except ImportError:
-	import xml.etree.ElementTree as etree
+from typing import List, Union
+
+from lxml import etree
 
 from epub_utils.exceptions import ParseError
+from epub_utils.parser import get_parser
 from epub_utils.printers import XMLPrinter
 
 
@@ -16,14 +16,53 @@ class Manifest:
 	NAMESPACE = 'http://www.idpf.org/2007/opf'
 	ITEM_XPATH = f'.//{{{NAMESPACE}}}item'
 
-	def __init__(self, xml_content: str):
-		self.xml_content = xml_content
+	def __init__(self, xml_content: Union[str, bytes]):
+		self._xml_content = xml_content
+		self._element = None
+		self._by_id = None
 		self.items = []
 
 		self._parse(xml_content)
 
 		self._printer = XMLPrinter(self)
 
+	@classmethod
+	def from_element(cls, element: etree.Element) -> 'Manifest':
+		"""
+		Build a Manifest from an already parsed manifest element.
+
+		The element is read in place instead of being serialized and parsed again.
+
+		Args:
+		    element (etree.Element): The manifest element of a parsed OPF document.
+
+		Returns:
+		    Manifest: The manifest read from the element.
+		"""
+		manifest = cls.__new__(cls)
+		manifest._xml_content = None
+		manifest._element = element
+		manifest._by_id = None
+		manifest.items = []
+
+		manifest._parse_element(element)
+
+		manifest._printer = XMLPrinter(manifest)
+		return manifest
+
+	@property
+	def xml_content(self) -> str:
+		"""
+		The raw XML of the manifest element, serialized on first use when built from an element
+		or decoded on first use when given as bytes.
+		"""
+		if self._xml_content is None:
+			self._xml_content = etree.tostring(self._element, encoding='unicode')
+			self._element = None
+		elif isinstance(self._xml_content, bytes):
+			self._xml_content = self._xml_content.decode('utf-8')
+		return self._xml_content
+
 	def __str__(self) -> str:
 		return self.xml_content
 
@@ -33,27 +72,19 @@ class Manifest:
 	def to_xml(self, *args, **kwargs) -> str:
 		return self._printer.to_xml(*args, **kwargs)
 
-	def _parse(self, xml_content: str) -> None:
+	def to_xml_stream(self, out, *args, **kwargs) -> None:
+		self._printer.to_xml_stream(out, *args, **kwargs)
+
+	def _parse(self, xml_content: Union[str, bytes]) -> None:
 		"""
 		Parses the manifest XML content.
 		"""
 		try:
 			if isinstance(xml_content, str):
 				xml_content = xml_content.encode('utf-8')
-			root = etree.fromstring(xml_content)
-
-			for item in root.findall(self.ITEM_XPATH):
-				item_data = {
-					'id': item.get('id'),
-					'href': item.get('href'),
-					'media_type': item.get('media-type'),
-					'properties': item.get('properties', '').split(),
-				}
-				if all(
-					v is not None
-					for v in [item_data['id'], item_data['href'], item_data['media_type']]
-				):
-					self.items.append(item_data)
+			root = etree.fromstring(xml_content, get_parser())
+
+			self._parse_element(root)
 
 		except etree.ParseError as e:
 			raise ParseError(
@@ -67,6 +98,22 @@ class Manifest:
 				],
 			) from e
 
+	def _parse_element(self, root: etree.Element) -> None:
+		"""
+		Reads the manifest items from a parsed manifest element.
+		"""
+		for item in _ITEMS_XPATH(root):
+			item_data = {
+				'id': item.get('id'),
+				'href': item.get('href'),
+				'media_type': item.get('media-type'),
+				'properties': item.get('properties', '').split(),
+			}
+			if all(
+				v is not None for v in [item_data['id'], item_data['href'], item_data['media_type']]
+			):
+				self.items.append(item_data)
+
 	def find_by_property(self, property_name: str) -> dict:
 		"""Find the first item with the given property."""
 		for item in self.items:
@@ -74,13 +121,36 @@ class Manifest:
 				return item
 		return None
 
+	@property
+	def _items_by_id(self) -> dict:
+		"""
+		Index of items by ID, keeping the first item for duplicated IDs.
+
+		Built on first use and not rebuilt if ``items`` is mutated afterwards.
+		"""
+		if self._by_id is None:
+			items_by_id = {}
+			for item in self.items:
+				items_by_id.setdefault(item['id'], item)
+			self._by_id = items_by_id
+		return self._by_id
+
 	def find_by_id(self, item_id: str) -> dict:
 		"""Find an item by its ID."""
-		for item in self.items:
-			if item['id'] == item_id:
-				return item
-		return None
+		return self._items_by_id.get(item_id)
+
+	def ids(self) -> List[str]:
+		"""
+		Get the distinct item IDs, in document order.
+
+		Read from the same index as ``find_by_id``, so mutations of ``items`` after
+		the first lookup are not reflected.
+		"""
+		return list(self._items_by_id)
 
 	def find_by_media_type(self, media_type: str) -> list:
 		"""Find all items with the given media type."""
 		return [item for item in self.items if item['media_type'] == media_type]
+
+
+_ITEMS_XPATH = etree.XPath('.//opf:item', namespaces={'opf': Manifest.NAMESPACE})
@@ -1,9 +1,9 @@
-try:
-	from lxml import etree
-except ImportError:
-	import xml.etree.ElementTree as etree
+from typing import List, Optional, Union
+
+from lxml import etree
 
 from epub_utils.exceptions import ParseError, ValidationError
+from epub_utils.parser import get_parser
 from epub_utils.printers import XMLPrinter
 
 
@@ -11,6 +11,9 @@ class Metadata:
 	"""
 	Represents the metadata section of an EPUB package document.
 	Handles Dublin Core (DC) and Dublin Core Terms (DCTERMS) metadata elements.
+
+	``fields`` maps each field name to the list of its values in document order.
+	Attribute access such as ``metadata.title`` returns a lone value as a string.
 	"""
 
 	DC_NAMESPACE = 'http://purl.org/dc/elements/1.1/'
@@ -18,37 +21,68 @@ class Metadata:
 	REQUIRED_FIELDS = ['identifier', 'title', 'creator']
 
 	NSMAP = {'dc': DC_NAMESPACE, 'dcterms': DCTERMS_NAMESPACE}
+	DCTERMS_PROPERTY_PREFIX = 'dcterms:'
+	NAMESPACE_PREFIXES = tuple(f'{{{ns_uri}}}' for ns_uri in NSMAP.values())
+
+	# Slotted: one Metadata is kept per package, often for many books at once.
+	# Unset slots still fall through to __getattr__ and so to fields.
+	__slots__ = ('_element', '_kv', '_printer', '_xml_content', 'fields')
 
-	def __init__(self, xml_content: str):
-		self.xml_content = xml_content
+	def __init__(self, xml_content: Union[str, bytes]):
 		self.fields = {}
+		self._kv = None
+		self._xml_content = xml_content
+		self._element = None
 
 		self._parse(xml_content)
 
 		self._printer = XMLPrinter(self)
 
-	def _parse(self, xml_content: str) -> None:
+	@classmethod
+	def from_element(cls, element: etree.Element) -> 'Metadata':
+		"""
+		Build a Metadata from an already parsed metadata element.
+
+		The element is read in place instead of being serialized and parsed again.
+
+		Args:
+		    element (etree.Element): The metadata element of a parsed OPF document.
+
+		Returns:
+		    Metadata: The metadata read from the element.
+		"""
+		metadata = cls.__new__(cls)
+		# Set first: __getattr__ falls back to fields for any missing attribute.
+		metadata.fields = {}
+		metadata._kv = None
+		metadata._xml_content = None
+		metadata._element = element
+
+		metadata._parse_element(element)
+
+		metadata._printer = XMLPrinter(metadata)
+		return metadata
+
+	@property
+	def xml_content(self) -> str:
+		"""
+		The raw XML of the metadata element, serialized on first use when built from an element
+		or decoded on first use when given as bytes.
+		"""
+		if self._xml_content is None:
+			self._xml_content = etree.tostring(self._element, encoding='unicode')
+			self._element = None
+		elif isinstance(self._xml_content, bytes):
+			self._xml_content = self._xml_content.decode('utf-8')
+		return self._xml_content
+
+	def _parse(self, xml_content: Union[str, bytes]) -> None:
 		try:
 			if isinstance(xml_content, str):
 				xml_content = xml_content.encode('utf-8')
-			root = etree.fromstring(xml_content)
-
-			for ns_prefix, ns_uri in self.NSMAP.items():
-				for element in root.findall(f'.//{{{ns_uri}}}*'):
-					name = element.tag.split('}')[-1]
-					text = element.text.strip() if element.text else None
-					if text:
-						self._add_field(name, text)
+			root = etree.fromstring(xml_content, get_parser())
 
-			for meta in root.findall('.//meta[@property]'):
-				prop = meta.get('property', '')
-				if prop.startswith('dcterms:'):
-					name = prop.split(':')[1]
-					text = meta.text.strip() if meta.text else None
-					if text:
-						self._add_field(name, text)
-
-			self._validate()
+			self._parse_element(root)
 
 		except etree.ParseError as e:
 			raise ParseError(
@@ -62,30 +96,41 @@ class Metadata:
 				],
 			) from e
 
-	def _add_field(self, name: str, value: str) -> None:
-		if name in self.fields:
-			if isinstance(self.fields[name], list):
-				self.fields[name].append(value)
+	def _parse_element(self, root: etree.Element) -> None:
+		# One pass in document order over DC/DCTERMS elements and dcterms: property metas
+		for element in root.iter():
+			tag = element.tag
+			if not isinstance(tag, str):
+				continue
+
+			if tag.startswith(self.NAMESPACE_PREFIXES):
+				name = tag.rpartition('}')[2]
+			elif tag == 'meta':
+				prop = element.get('property', '')
+				if not prop.startswith(self.DCTERMS_PROPERTY_PREFIX):
+					continue
+				name = prop[len(self.DCTERMS_PROPERTY_PREFIX) :].partition(':')[0]
 			else:
-				self.fields[name] = [self.fields[name], value]
-		else:
-			self.fields[name] = value
+				continue
+
+			text = element.text.strip() if element.text else None
+			if text:
+				self._add_field(name, text)
+
+		self._validate()
+
+	def _add_field(self, name: str, value: str) -> None:
+		self._kv = None
+		self.fields.setdefault(name, []).append(value)
 
 	def _validate(self, raise_exception=False) -> None:
 		"""
 		Validate all required fields and raise ValidationError if validation fails.
 		"""
-		errors = {}
-
-		for field in self.REQUIRED_FIELDS:
-			try:
-				self._validate_field(field)
-			except ValueError as e:
-				errors[field] = str(e)
+		missing = [field for field in self.REQUIRED_FIELDS if self._is_missing(field)]
 
-		if errors and raise_exception:
-			error_messages = [f'{field}: {msg}' for field, msg in errors.items()]
-			validation_errors = [f"Missing or invalid '{field}' element" for field in errors.keys()]
+		if missing and raise_exception:
+			validation_errors = [f"Missing or invalid '{field}' element" for field in missing]
 
 			raise ValidationError(
 				'EPUB metadata validation failed',
@@ -98,6 +143,10 @@ class Metadata:
 				],
 			)
 
+	def _is_missing(self, field_name: str) -> bool:
+		"""Whether a field has no values; only non-blank text is ever stored."""
+		return not self.fields.get(field_name)
+
 	def _validate_field(self, field_name: str) -> None:
 		"""
 		Validate an individual field.
@@ -108,8 +157,7 @@ class Metadata:
 		Raises:
 		    ValueError: If the field validation fails
 		"""
-		value = self.fields.get(field_name)
-		if value is None or (isinstance(value, str) and not value.strip()):
+		if self._is_missing(field_name):
 			raise ValueError('This field is required')
 
 	def __str__(self) -> str:
@@ -121,19 +169,58 @@ class Metadata:
 	def to_xml(self, *args, **kwargs) -> str:
 		return self._printer.to_xml(*args, **kwargs)
 
+	def to_xml_stream(self, out, *args, **kwargs) -> None:
+		self._printer.to_xml_stream(out, *args, **kwargs)
+
 	def _get_text(self, root: etree.Element, xpath: str) -> str:
 		element = root.find(xpath)
 		return element.text.strip() if element is not None and element.text else None
 
-	def __getattr__(self, name: str) -> str:
-		return self.fields.get(name)
+	def __getattr__(self, name: str) -> Union[str, List[str], None]:
+		# A single value is returned as it is, repeated ones as the list
+		return self._single_or_list(self.fields.get(name))
+
+	@staticmethod
+	def _single_or_list(values: Optional[List[str]]) -> Union[str, List[str], None]:
+		if values is not None and len(values) == 1:
+			return values[0]
+		return values
+
+	def get(self, name: str) -> Optional[str]:
+		"""
+		Get the first value of a field.
+
+		Args:
+		    name: Name of the field, e.g. ``title``
+
+		Returns:
+		    The first value, or None if the field is absent
+		"""
+		values = self.fields.get(name)
+		return values[0] if values else None
+
+	def get_all(self, name: str) -> List[str]:
+		"""
+		Get every value of a field, in document order.
+
+		Args:
+		    name: Name of the field, e.g. ``creator``
+
+		Returns:
+		    The values, or an empty list if the field is absent
+		"""
+		return list(self.fields.get(name, ()))
 
 	def to_kv(self) -> str:
+		"""Render the fields as right-aligned ``key: value`` lines, built once per parse."""
+		if self._kv is None:
+			self._kv = self._build_kv()
+		return self._kv
+
+	def _build_kv(self) -> str:
 		if not self.fields:
 			return ''
 
-		max_key_length = max(len(k) for k in self.fields.keys())
-
-		lines = [f'{k.rjust(max_key_length)}: {str(v)}' for k, v in self.fields.items()]
-
-		return '\n'.join(lines)
+		width = max(map(len, self.fields))
+		single_or_list = self._single_or_list
+		return '\n'.join(f'{k:>{width}}: {single_or_list(v)}' for k, v in self.fields.items())
@@ -1,9 +1,10 @@
-try:
-	from lxml import etree
-except ImportError:
-	import xml.etree.ElementTree as etree
+import sys
+from typing import List, Union
+
+from lxml import etree
 
 from epub_utils.exceptions import ParseError
+from epub_utils.parser import get_parser
 from epub_utils.printers import XMLPrinter
 
 
@@ -16,8 +17,20 @@ class Spine:
 	NAMESPACE = 'http://www.idpf.org/2007/opf'
 	ITEMREF_XPATH = f'.//{{{NAMESPACE}}}itemref'
 
-	def __init__(self, xml_content: str):
-		self.xml_content = xml_content
+	__slots__ = (
+		'_by_idref',
+		'_element',
+		'_printer',
+		'_xml_content',
+		'itemrefs',
+		'page_progression_direction',
+		'toc',
+	)
+
+	def __init__(self, xml_content: Union[str, bytes]):
+		self._xml_content = xml_content
+		self._element = None
+		self._by_idref = None
 
 		self.itemrefs = []
 		self.toc = None
@@ -27,6 +40,46 @@ class Spine:
 
 		self._printer = XMLPrinter(self)
 
+	@classmethod
+	def from_element(cls, element: etree.Element) -> 'Spine':
+		"""
+		Build a Spine from an already parsed spine element.
+
+		The element is read in place instead of being serialized and parsed again.
+
+		Args:
+		    element (etree.Element): The spine element of a parsed OPF document.
+
+		Returns:
+		    Spine: The spine read from the element.
+		"""
+		spine = cls.__new__(cls)
+		spine._xml_content = None
+		spine._element = element
+		spine._by_idref = None
+
+		spine.itemrefs = []
+		spine.toc = None
+		spine.page_progression_direction = None
+
+		spine._parse_element(element)
+
+		spine._printer = XMLPrinter(spine)
+		return spine
+
+	@property
+	def xml_content(self) -> str:
+		"""
+		The raw XML of the spine element, serialized on first use when built from an element
+		or decoded on first use when given as bytes.
+		"""
+		if self._xml_content is None:
+			self._xml_content = etree.tostring(self._element, encoding='unicode')
+			self._element = None
+		elif isinstance(self._xml_content, bytes):
+			self._xml_content = self._xml_content.decode('utf-8')
+		return self._xml_content
+
 	def __str__(self) -> str:
 		return self.xml_content
 
@@ -36,27 +89,19 @@ class Spine:
 	def to_xml(self, *args, **kwargs) -> str:
 		return self._printer.to_xml(*args, **kwargs)
 
-	def _parse(self, xml_content: str) -> None:
+	def to_xml_stream(self, out, *args, **kwargs) -> None:
+		self._printer.to_xml_stream(out, *args, **kwargs)
+
+	def _parse(self, xml_content: Union[str, bytes]) -> None:
 		"""
 		Parses the spine XML content.
 		"""
 		try:
 			if isinstance(xml_content, str):
 				xml_content = xml_content.encode('utf-8')
-			root = etree.fromstring(xml_content)
+			root = etree.fromstring(xml_content, get_parser())
 
-			self.toc = root.get('toc')
-			self.page_progression_direction = root.get('page-progression-direction', 'default')
-
-			for itemref in root.findall(self.ITEMREF_XPATH):
-				idref = itemref.get('idref')
-				linear = itemref.get('linear', 'yes')
-				properties = itemref.get('properties', '').split()
-
-				if idref:
-					self.itemrefs.append(
-						{'idref': idref, 'linear': linear == 'yes', 'properties': properties}
-					)
+			self._parse_element(root)
 
 		except etree.ParseError as e:
 			raise ParseError(
@@ -70,9 +115,54 @@ class Spine:
 				],
 			) from e
 
+	def _parse_element(self, root: etree.Element) -> None:
+		"""
+		Reads the reading order from a parsed spine element.
+		"""
+		self.toc = root.get('toc')
+		self.page_progression_direction = root.get('page-progression-direction', 'default')
+
+		for itemref in _ITEMREFS_XPATH(root):
+			idref = itemref.get('idref')
+			if not idref:
+				continue
+
+			properties = itemref.get('properties')
+			self.itemrefs.append(
+				{
+					# idrefs repeat as manifest IDs, so interning shares one string per ID
+					'idref': sys.intern(idref),
+					'linear': itemref.get('linear', 'yes') == 'yes',
+					'properties': properties.split() if properties else [],
+				}
+			)
+
+	@property
+	def _itemrefs_by_idref(self) -> dict:
+		"""
+		Index of itemrefs by idref, keeping the first itemref for duplicated idrefs.
+
+		Built on first use and not rebuilt if ``itemrefs`` is mutated afterwards.
+		"""
+		if self._by_idref is None:
+			itemrefs_by_idref = {}
+			for item in self.itemrefs:
+				itemrefs_by_idref.setdefault(item['idref'], item)
+			self._by_idref = itemrefs_by_idref
+		return self._by_idref
+
 	def find_by_idref(self, itemref_idref: str) -> dict:
 		"""Find an itemref by its idref."""
-		for item in self.itemrefs:
-			if item['idref'] == itemref_idref:
-				return item
-		return None
+		return self._itemrefs_by_idref.get(itemref_idref)
+
+	def idrefs(self) -> List[str]:
+		"""
+		Get the distinct itemref idrefs, in reading order.
+
+		Read from the same index as ``find_by_idref``, so mutations of ``itemrefs``
+		after the first lookup are not reflected.
+		"""
+		return list(self._itemrefs_by_idref)
+
+
+_ITEMREFS_XPATH = etree.XPath('.//opf:itemref', namespaces={'opf': Spine.NAMESPACE})
@@ -0,0 +1,44 @@
+"""Per-thread XML parsers shared by the EPUB document classes."""
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from lxml import etree
+
+# Entities declared in the document itself are expanded, but external ones are refused
+# and nothing is fetched over the network, so untrusted content cannot pull in external
+# resources. IDs are still collected: with ``collect_ids=False`` lxml tries to fetch the
+# DTD named in an OPF 2 or NCX DOCTYPE.
+_HARDENED_OPTIONS = {'resolve_entities': 'internal', 'no_network': True}
+
+_parser_local = threading.local()
+
+
+def get_parser(**options) -> 'etree.XMLParser':
+	"""
+	Return this thread's reusable XMLParser.
+
+	lxml parsers are not safe to share between threads, so one is kept per thread
+	for each set of options. lxml is imported on first use, so importing this module
+	stays cheap for the CLI.
+
+	Args:
+	    **options: XMLParser keyword arguments. Without any, the parser is the
+	        hardened one used for EPUB documents.
+
+	Returns:
+	    etree.XMLParser: The parser for this thread and these options.
+	"""
+	key = tuple(sorted(options.items()))
+	parsers = getattr(_parser_local, 'parsers', None)
+	if parsers is None:
+		parsers = _parser_local.parsers = {}
+
+	parser = parsers.get(key)
+	if parser is None:
+		from lxml import etree
+
+		parser = etree.XMLParser(**(options or _HARDENED_OPTIONS))
+		parsers[key] = parser
+	return parser
@@ -1,18 +1,37 @@
+import re
+from functools import lru_cache
+
+from epub_utils.parser import get_parser
+
 try:
-	from lxml import etree
-except ImportError:
-	import xml.etree.ElementTree as etree
+	from functools import cache
+except ImportError:  # Python 3.8
+	cache = lru_cache(maxsize=None)
+
+_XML_DECLARATION_RE = re.compile(r'\A\s*<\?xml.*?\?>', re.DOTALL)
+_DOCTYPE_RE = re.compile(r'<!DOCTYPE[^>]*>')
+
+
+@cache
+def _get_highlighter():
+	"""Import pygments and build the XML lexer and terminal formatter once, on first use."""
+	from pygments.formatters import TerminalFormatter
+	from pygments.lexers import XmlLexer
+
+	return XmlLexer(), TerminalFormatter()
 
-from pygments import highlight
-from pygments.formatters import TerminalFormatter
-from pygments.lexers import XmlLexer
 
+def highlight_xml(xml_content: str, outfile=None) -> str:
+	"""Highlight XML, returning a string or writing token by token to ``outfile``."""
+	from pygments import highlight
 
-def highlight_xml(xml_content: str) -> str:
-	return highlight(xml_content, XmlLexer(), TerminalFormatter())
+	lexer, formatter = _get_highlighter()
+	return highlight(xml_content, lexer, formatter, outfile)
 
 
 def pretty_print_xml(xml_content: str) -> str:
+	from lxml import etree
+
 	try:
 		original_content = xml_content
 		if isinstance(xml_content, str):
@@ -23,20 +42,13 @@ def pretty_print_xml(xml_content: str) -> str:
 				xml_content.decode('utf-8') if isinstance(xml_content, bytes) else xml_content
 			)
 
-		xml_declaration = ''
-		doctype_declaration = ''
+		xml_declaration_match = _XML_DECLARATION_RE.match(original_content)
+		xml_declaration = xml_declaration_match.group() if xml_declaration_match else ''
 
-		if original_content.strip().startswith('<?xml'):
-			xml_decl_end = original_content.find('?>') + 2
-			xml_declaration = original_content[:xml_decl_end]
+		doctype_match = _DOCTYPE_RE.search(original_content)
+		doctype_declaration = doctype_match.group() if doctype_match else ''
 
-		doctype_start = original_content.find('<!DOCTYPE')
-		if doctype_start != -1:
-			doctype_end = original_content.find('>', doctype_start) + 1
-			doctype_declaration = original_content[doctype_start:doctype_end]
-
-		parser = etree.XMLParser(remove_blank_text=True)
-		root = etree.fromstring(xml_content_bytes, parser)
+		root = etree.fromstring(xml_content_bytes, get_parser(remove_blank_text=True))
 		pretty_xml = etree.tostring(root, pretty_print=True, encoding='unicode')
 
 		result = ''
@@ -68,8 +80,23 @@ def print_to_xml(xml_content: str, pretty_print: bool, highlight_syntax: bool) -
 	return xml_content
 
 
+def write_xml(out, xml_content: str, pretty_print: bool, highlight_syntax: bool) -> None:
+	if pretty_print:
+		xml_content = pretty_print_xml(xml_content)
+
+	if highlight_syntax:
+		highlight_xml(xml_content, out)
+	else:
+		out.write(xml_content)
+
+
 class XMLPrinter:
-	"""Handles XML printing operations for objects with xml_content."""
+	"""
+	Handles XML printing operations for objects with xml_content.
+
+	Rendered output is cached per set of options and reused for as long as the
+	provider returns the same xml_content object.
+	"""
 
 	def __init__(self, xml_content_provider):
 		"""
@@ -79,6 +106,18 @@ class XMLPrinter:
 			xml_content_provider: Object that has an xml_content attribute
 		"""
 		self._xml_content_provider = xml_content_provider
+		self._cache = {}
+
+	def _render(self, key: tuple, render) -> str:
+		"""Return the cached rendering for ``key``, calling ``render`` on a miss."""
+		xml_content = self._xml_content_provider.xml_content
+		cached = self._cache.get(key)
+		if cached is not None and cached[0] is xml_content:
+			return cached[1]
+
+		result = render(xml_content)
+		self._cache[key] = (xml_content, result)
+		return result
 
 	def to_str(self, pretty_print: bool = False) -> str:
 		"""
@@ -90,7 +129,9 @@ class XMLPrinter:
 		Returns:
 			String representation of the XML content
 		"""
-		return print_to_str(self._xml_content_provider.xml_content, pretty_print)
+		if not pretty_print:
+			return self._xml_content_provider.xml_content
+		return self._render(('str', True), lambda xml_content: print_to_str(xml_content, True))
 
 	def to_xml(self, pretty_print: bool = False, highlight_syntax: bool = True) -> str:
 		"""
@@ -103,4 +144,21 @@ class XMLPrinter:
 		Returns:
 			Formatted XML string with optional syntax highlighting
 		"""
-		return print_to_xml(self._xml_content_provider.xml_content, pretty_print, highlight_syntax)
+		return self._render(
+			('xml', pretty_print, highlight_syntax),
+			lambda xml_content: print_to_xml(xml_content, pretty_print, highlight_syntax),
+		)
+
+	def to_xml_stream(self, out, pretty_print: bool = False, highlight_syntax: bool = True) -> None:
+		"""
+		Write the formatted XML representation to a text stream.
+
+		Unlike ``to_xml``, the highlighted output is written as it is produced
+		rather than being collected into a single string first.
+
+		Args:
+			out: Writable text stream
+			pretty_print: Whether to format the XML with proper indentation
+			highlight_syntax: Whether to apply syntax highlighting
+		"""
+		write_xml(out, self._xml_content_provider.xml_content, pretty_print, highlight_syntax)
@@ -36,7 +36,7 @@ setup(
 	},
 	install_requires=[
 		'click',
-		'lxml',
+		'lxml>=5.0',
 		'packaging',
 		'pygments',
 		'PyYAML',
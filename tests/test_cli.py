@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 from click.testing import CliRunner
 
@@ -31,6 +34,38 @@ def test_version(options):
 	assert result.output.strip() == cli.VERSION
 
 
+def test_version_does_not_validate_path():
+	"""--version is eager, so it exits before the EPUB path is checked."""
+	result = CliRunner().invoke(cli.main, ['--version', 'nonexistent.epub'])
+	assert result.exit_code == 0
+	assert result.output.strip() == cli.VERSION
+
+
+def test_cli_import_does_not_load_parsing_stack():
+	"""Importing the CLI must not import lxml or the document module."""
+	code = (
+		'import sys, epub_utils.cli; '
+		"print('lxml' in sys.modules or 'epub_utils.doc' in sys.modules)"
+	)
+	result = subprocess.run(
+		[sys.executable, '-c', code], capture_output=True, text=True, check=True
+	)
+	assert result.stdout.strip() == 'False'
+
+
+def test_reading_metadata_does_not_load_pygments(doc_path):
+	"""Reading package metadata must not import pygments, which is only needed to highlight."""
+	code = (
+		'import sys; from epub_utils.doc import Document; '
+		f'Document({str(doc_path)!r}).package.metadata.title; '
+		"print('pygments' in sys.modules)"
+	)
+	result = subprocess.run(
+		[sys.executable, '-c', code], capture_output=True, text=True, check=True
+	)
+	assert result.stdout.strip() == 'False'
+
+
 def test_files_command_with_file_path_xhtml_xml(doc_path):
 	"""Test the files command with XHTML file path in XML format."""
 	result = CliRunner().invoke(
@@ -1,3 +1,5 @@
+import io
+
 import pytest
 
 from epub_utils.container import Container
@@ -30,6 +32,22 @@ def test_invalid_container_xml():
 		Container(invalid_xml)
 
 
+def test_container_parse_is_cached_by_content():
+	"""
+	Test that identical container.xml content is parsed once and errors are not cached.
+	"""
+	from epub_utils.container import _parse_rootfile_path
+
+	_parse_rootfile_path.cache_clear()
+	Container(CONTAINER_XML)
+	Container(CONTAINER_XML.encode('utf-8'))
+	assert _parse_rootfile_path.cache_info().hits == 1
+
+	for _ in range(2):
+		with pytest.raises(InvalidEPUBError):
+			Container('<invalid></invalid>')
+
+
 @pytest.mark.parametrize(
 	'xml_content,pretty_print,expected',
 	[
@@ -50,3 +68,14 @@ def test_container_to_str_pretty_print_parameter(xml_content, pretty_print, expe
 	container = Container(xml_content)
 
 	assert container.to_str(pretty_print=pretty_print) == expected
+
+
+@pytest.mark.parametrize('pretty_print', [False, True])
+def test_container_to_xml_stream_matches_to_xml(pretty_print):
+	"""Test that streaming XML output writes the same text as to_xml."""
+	container = Container(CONTAINER_XML)
+	out = io.StringIO()
+
+	container.to_xml_stream(out, pretty_print=pretty_print)
+
+	assert out.getvalue() == container.to_xml(pretty_print=pretty_print)
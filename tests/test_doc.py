@@ -1,7 +1,10 @@
 import unittest
 
+import pytest
+
 from epub_utils.container import Container
 from epub_utils.doc import Document
+from epub_utils.exceptions import InvalidEPUBError
 from epub_utils.navigation import EPUBNavDocNavigation, Navigation
 from epub_utils.package import Manifest, Package
 
@@ -96,3 +99,123 @@ def test_document_nav_property(doc_path):
 
 	assert nav is not None
 	assert isinstance(nav, EPUBNavDocNavigation)
+
+
+def test_document_get_file_by_path_unnormalized(doc_path):
+	"""
+	Test that the Document class resolves paths that need normalization.
+	"""
+	doc = Document(doc_path)
+	content = doc.get_file_by_path('GoogleDoc/./Roads.xhtml')
+
+	assert 'xhtml' in content.to_str().lower()
+
+
+def test_document_context_manager_closes_archive(doc_path):
+	"""
+	Test that the Document keeps one archive handle open and closes it on exit.
+	"""
+	with Document(doc_path) as doc:
+		assert doc.package is not None
+		epub_zip = doc._zip
+		assert doc.nav is not None
+		assert doc._zip is epub_zip
+
+	assert epub_zip.fp is None
+
+
+def test_document_toc_dispatches_on_version(doc_path):
+	"""
+	Test that an EPUB 3 table of contents comes from the nav document without touching the NCX.
+	"""
+	doc = Document(doc_path)
+
+	assert doc.package.version.major == 3
+	assert isinstance(doc.toc, EPUBNavDocNavigation)
+	assert 'ncx' not in doc.__dict__
+
+
+def test_document_missing_ncx_is_cached(doc_path):
+	"""
+	Test that an absent NCX is resolved once and remembered.
+	"""
+	doc = Document(doc_path)
+
+	assert doc.ncx is None
+	assert 'ncx' in doc.__dict__
+	assert doc.toc is doc.nav
+
+
+def test_document_get_files_info_order(doc_path):
+	"""
+	Test that file information keeps archive order unless sorting is requested.
+	"""
+	doc = Document(doc_path)
+
+	paths = [file_info['path'] for file_info in doc.get_files_info()]
+	assert paths[0] == 'mimetype'
+	assert [file_info['path'] for file_info in doc.get_files_info(sort=True)] == sorted(paths)
+	assert doc.get_files_info()[0]['modified'] == '2023-11-28 06:50:12'
+
+
+def test_document_get_file_names(doc_path):
+	"""
+	Test that file names match the entries reported by list_files.
+	"""
+	doc = Document(doc_path)
+
+	names = doc.get_file_names()
+
+	assert names[0] == 'mimetype'
+	assert names == [file_info['filename'] for file_info in doc.list_files()]
+	assert names == [file_info['filename'] for file_info in doc.iter_files()]
+	assert doc.list_files()[0]['last_modified'].year == 2023
+
+
+def test_document_get_file_by_path_uses_manifest_media_type(doc_path):
+	"""
+	Test that XHTML files retrieved by path take their media type from the manifest.
+	"""
+	doc = Document(doc_path)
+	doc.package.manifest.items[1]['media_type'] = 'text/html'
+
+	content = doc.get_file_by_path('GoogleDoc/Roads.xhtml')
+
+	assert content.media_type == 'text/html'
+
+
+def test_document_open_file_streams_content(doc_path):
+	"""
+	Test that files can be read from the archive as a binary stream.
+	"""
+	doc = Document(doc_path)
+
+	with doc.open_file('GoogleDoc/Roads.xhtml') as epub_file:
+		first_chunk = epub_file.read(5)
+		rest = epub_file.read()
+
+	assert first_chunk + rest == doc._read_bytes_from_epub('GoogleDoc/Roads.xhtml')
+
+
+def test_document_rejects_non_zip_file(tmp_path):
+	"""
+	Test that files without a ZIP structure are rejected as invalid EPUBs.
+	"""
+	not_a_zip = tmp_path / 'book.epub'
+	not_a_zip.write_bytes(b'<?xml version="1.0"?><package/>')
+
+	with pytest.raises(InvalidEPUBError, match='not a valid ZIP archive'):
+		Document(not_a_zip)
+
+
+def test_document_rejects_truncated_zip(tmp_path, doc_path):
+	"""
+	Test that an archive with a ZIP signature but no central directory is rejected.
+	"""
+	with open(doc_path, 'rb') as f:
+		truncated = tmp_path / 'truncated.epub'
+		truncated.write_bytes(f.read(100))
+
+	doc = Document(truncated)
+	with pytest.raises(InvalidEPUBError, match='not a valid ZIP archive'):
+		_ = doc.container
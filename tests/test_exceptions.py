@@ -0,0 +1,59 @@
+import pytest
+
+from epub_utils import exceptions
+from epub_utils.exceptions import (
+	EPUBFileNotFoundError,
+	EPUBNotImplementedError,
+	InvalidEPUBError,
+	ParseError,
+	ValidationError,
+)
+
+
+def test_parse_error_formats_details_on_str():
+	"""Test that element and line details are only added when formatting."""
+	error = ParseError('Unexpected tag', element_name='navMap', line_number=12)
+
+	assert error.args == ('Unexpected tag',)
+	assert str(error).splitlines()[0] == 'Error parsing navMap: Unexpected tag (line 12)'
+
+
+def test_invalid_epub_error_lists_missing_files():
+	"""Test that missing files are appended to the message."""
+	error = InvalidEPUBError('Broken EPUB', missing_files=['mimetype', 'META-INF/container.xml'])
+
+	assert str(error).startswith(
+		'Broken EPUB. Missing required files: mimetype, META-INF/container.xml'
+	)
+
+
+def test_validation_error_lists_errors():
+	"""Test that validation errors are listed under the message."""
+	error = ValidationError('Invalid metadata', validation_errors=['title missing'])
+
+	assert str(error).startswith('Invalid metadata\nValidation errors:\n  • title missing')
+	assert isinstance(error, ValueError)
+
+
+def test_default_suggestions_are_shared():
+	"""Test that default suggestions are reused rather than rebuilt per instance."""
+	first = ParseError('one')
+	second = ParseError('two')
+
+	assert first.suggestions is second.suggestions
+	assert 'Check that the XML is well-formed' in str(first)
+
+
+@pytest.mark.parametrize(
+	'old_name,replacement',
+	[
+		('FileNotFoundError', EPUBFileNotFoundError),
+		('NotImplementedError', EPUBNotImplementedError),
+	],
+)
+def test_builtin_shadowing_names_are_deprecated(old_name, replacement):
+	"""Test that the former names still resolve but warn."""
+	with pytest.warns(DeprecationWarning, match=replacement.__name__):
+		assert getattr(exceptions, old_name) is replacement
+
+	assert not issubclass(EPUBFileNotFoundError, FileNotFoundError)
@@ -1,4 +1,5 @@
 import pytest
+from lxml import etree
 
 from epub_utils.package.manifest import Manifest
 
@@ -34,6 +35,13 @@ def test_manifest_initialization():
 	assert manifest.items[2]['properties'] == []
 
 
+def test_manifest_from_element():
+	manifest = Manifest.from_element(etree.fromstring(VALID_MANIFEST_XML.encode('utf-8')))
+
+	assert manifest.items == Manifest(VALID_MANIFEST_XML).items
+	assert manifest.xml_content.startswith('<manifest xmlns="http://www.idpf.org/2007/opf">')
+
+
 def test_minimal_manifest():
 	manifest = Manifest(MINIMAL_MANIFEST_XML)
 
@@ -58,6 +66,11 @@ def test_find_by_id():
 	assert chapter['media_type'] == 'application/xhtml+xml'
 
 
+def test_ids():
+	manifest = Manifest(VALID_MANIFEST_XML)
+	assert manifest.ids() == ['nav', 'chapter1', 'style', 'image1']
+
+
 def test_find_by_media_type():
 	manifest = Manifest(VALID_MANIFEST_XML)
 	xhtml_items = manifest.find_by_media_type('application/xhtml+xml')
@@ -1,6 +1,6 @@
 import pytest
 
-from epub_utils.exceptions import ValidationError
+from epub_utils.exceptions import ParseError, ValidationError
 from epub_utils.package.metadata import Metadata
 
 VALID_METADATA_XML = """
@@ -69,3 +69,86 @@ def test_metadata_to_str_pretty_print_parameter(xml_content, pretty_print, expec
 	metadata = Metadata(xml_content)
 
 	assert metadata.to_str(pretty_print=pretty_print) == expected
+
+
+def test_metadata_fields_in_document_order():
+	"""Test that DC, DCTERMS and property metas are read in one pass, in document order."""
+	xml_content = """
+<metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/">
+    <!-- generated -->
+    <dcterms:created>2020-01-01</dcterms:created>
+    <dc:title>Test Book</dc:title>
+    <meta property="dcterms:modified">2023-11-28T14:50:13Z</meta>
+    <meta property="other:ignored">Ignored</meta>
+    <dc:creator>Test Author</dc:creator>
+</metadata>
+"""
+	metadata = Metadata(xml_content)
+
+	assert list(metadata.fields) == ['created', 'title', 'modified', 'creator']
+
+
+def test_metadata_does_not_resolve_external_entities(tmp_path):
+	"""Test that external entities in a metadata fragment are never resolved."""
+	secret = tmp_path / 'secret.txt'
+	secret.write_text('secret-value')
+	xml_content = (
+		f'<!DOCTYPE metadata [<!ENTITY x SYSTEM "{secret.as_uri()}">]>'
+		'<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">'
+		'<dc:title>&x;</dc:title></metadata>'
+	)
+	try:
+		metadata = Metadata(xml_content)
+	except ParseError as e:
+		# Recent libxml2 refuses the reference instead of leaving it unresolved
+		assert 'secret-value' not in str(e)
+	else:
+		assert metadata.title != 'secret-value'
+
+
+def test_metadata_is_slotted():
+	"""Test that metadata does not carry a per-instance __dict__ and still exposes fields."""
+	metadata = Metadata(VALID_METADATA_XML)
+
+	# hasattr would go through __getattr__, so look the attribute up directly
+	with pytest.raises(AttributeError):
+		object.__getattribute__(metadata, '__dict__')
+	assert metadata.fields['title'] == [metadata.title]
+	assert metadata.not_a_field is None
+
+
+def test_metadata_to_kv():
+	"""Test that key-value output right-aligns keys and is built once."""
+	xml_content = (
+		'<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">'
+		'<dc:identifier>id-1</dc:identifier><dc:title>Book</dc:title>'
+		'<dc:creator>A</dc:creator><dc:creator>B</dc:creator></metadata>'
+	)
+	metadata = Metadata(xml_content)
+
+	kv = metadata.to_kv()
+	assert kv == "identifier: id-1\n     title: Book\n   creator: ['A', 'B']"
+	assert metadata.to_kv() is kv
+
+
+def test_metadata_fields_are_lists():
+	"""Test that every field stores a list while attribute access unwraps single values."""
+	metadata = Metadata(VALID_METADATA_XML)
+
+	assert all(isinstance(values, list) for values in metadata.fields.values())
+	assert metadata.get('subject') == 'Fiction'
+	assert metadata.get_all('subject') == ['Fiction', 'Science Fiction']
+	assert metadata.get_all('title') == [metadata.title]
+	assert metadata.get('missing') is None
+	assert metadata.get_all('missing') == []
+
+
+def test_metadata_expands_internal_entities():
+	"""Test that entities declared in a metadata fragment are expanded."""
+	xml_content = (
+		'<!DOCTYPE metadata [<!ENTITY foo "FOO">]>'
+		'<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">'
+		'<dc:title>A &foo; B</dc:title></metadata>'
+	)
+
+	assert Metadata(xml_content).title == 'A FOO B'
@@ -1,6 +1,11 @@
+import sys
+
 import pytest
 
+from epub_utils.exceptions import ParseError
+from epub_utils.navigation import NavigationItem
 from epub_utils.navigation.nav import EPUBNavDocNavigation
+from epub_utils.navigation.nav.dom import NavDocument
 
 NAV_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" xml:lang="en">
@@ -97,6 +102,9 @@ def test_nav_doc_navigation_toc_items_as_dicts():
 
 	toc_items = nav.get_toc_items_as_dicts()
 
+	assert nav.find_item_by_id('ch1-1').label == 'Section 1.1'
+	assert [item.id for item in nav.find_items_by_target('chapter1.xhtml#section1')] == ['ch1-1']
+
 	assert toc_items == [
 		{
 			'id': 'ch1',
@@ -463,3 +471,135 @@ def test_nav_doc_navigation_empty_document():
 	# find methods should return None/empty
 	assert nav.find_item_by_id('nonexistent') is None
 	assert len(nav.find_items_by_target('nonexistent.xhtml')) == 0
+
+
+def test_navigation_item_to_dict_handles_deep_nesting():
+	"""Test that to_dict keeps child order and does not recurse per level."""
+	root = NavigationItem(id='root', label='Root', target='root.xhtml')
+	root.children = [
+		NavigationItem(id='a', label='A', target='a.xhtml', level=1),
+		NavigationItem(id='b', label='B', target='b.xhtml', level=1),
+	]
+
+	node = root.children[1]
+	for depth in range(2, 2000):
+		child = NavigationItem(id=f'n{depth}', label='Deep', target='deep.xhtml', level=depth)
+		node.children.append(child)
+		node = child
+
+	result = root.to_dict()
+
+	assert [child['id'] for child in result['children']] == ['a', 'b']
+	assert result['children'][1]['children'][0]['id'] == 'n2'
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason='slotted dataclasses need Python 3.10')
+def test_navigation_item_uses_slots():
+	"""Test that navigation items do not carry a per-instance __dict__."""
+	item = NavigationItem(id='ch1', label='Chapter 1', target='chapter1.xhtml')
+
+	assert not hasattr(item, '__dict__')
+
+
+def test_nav_dom_headings_and_epub_type():
+	"""Test reading and adding nav headings and epub:type through the DOM wrappers."""
+	nav = EPUBNavDocNavigation(NAV_XML, 'application/xhtml+xml', 'nav.xhtml')
+	nav_doc = NavDocument(nav.tree)
+
+	toc_nav = nav_doc.toc_nav
+	assert toc_nav.epub_type == 'toc'
+	assert toc_nav.heading == 'Table of Contents'
+
+	landmarks = nav_doc.add_nav_section('landmarks')
+	landmarks.add_heading(2, 'Guide')
+	assert nav_doc.landmarks_nav.heading == 'Guide'
+	assert landmarks.element[0].tag == '{http://www.w3.org/1999/xhtml}h2'
+
+
+def test_nav_doc_navigation_does_not_resolve_external_entities(tmp_path):
+	"""Test that external entities in a navigation document are never resolved."""
+	secret = tmp_path / 'secret.txt'
+	secret.write_text('secret-value')
+	xml_content = NAV_XML.replace(
+		'<html ', f'<!DOCTYPE html [<!ENTITY x SYSTEM "{secret.as_uri()}">]>\n<html ', 1
+	).replace('Chapter 1</a>', '&x;</a>')
+	try:
+		nav = EPUBNavDocNavigation(xml_content, 'application/xhtml+xml', 'nav.xhtml')
+	except ParseError as e:
+		# Recent libxml2 refuses the reference instead of leaving it unresolved
+		assert 'secret-value' not in str(e)
+	else:
+		assert 'secret-value' not in nav.inner_text
+
+
+def test_nav_doc_navigation_expands_internal_entities():
+	"""Test that entities declared in the document are expanded in labels and text."""
+	xml_content = NAV_XML.replace(
+		'<html ', '<!DOCTYPE html [<!ENTITY foo "FOO">]>\n<html ', 1
+	).replace('Chapter 1</a>', 'Ch &foo; one</a>')
+	nav = EPUBNavDocNavigation(xml_content, 'application/xhtml+xml', 'nav.xhtml')
+
+	assert nav.get_toc_items()[0].label == 'Ch FOO one'
+	assert 'Ch FOO one' in nav.inner_text
+
+
+def test_nav_doc_navigation_ids_with_quotes():
+	"""Test that item IDs are passed to XPath as variables, not spliced into the expression."""
+	nav = EPUBNavDocNavigation(
+		NAV_XML.replace('id="ch1"', 'id="say-&quot;hi&quot;"'), 'application/xhtml+xml'
+	)
+
+	assert nav.update_toc_item('say-"hi"', label='Quoted')
+	assert nav.get_toc_items()[0].label == 'Quoted'
+	assert nav.remove_toc_item('say-"hi"')
+	assert nav.get_toc_items() == []
+
+
+def test_nav_dom_get_all_items_recursive():
+	"""Test that nested list items are collected in document order."""
+	nav = EPUBNavDocNavigation(NAV_XML, 'application/xhtml+xml', 'nav.xhtml')
+	ordered_list = NavDocument(nav.tree).toc_nav.ordered_list
+	chapter = ordered_list.list_items[0]
+	nested = chapter.add_nested_list()
+	nested.add_list_item().add_anchor('chapter1.xhtml#s1', 'Section 1')
+	ordered_list.add_list_item().add_anchor('chapter2.xhtml', 'Chapter 2')
+
+	labels = [item.anchor.text for item in ordered_list.get_all_items_recursive()]
+	assert labels == ['Chapter 1', 'Section 1', 'Chapter 2']
+
+
+def test_nav_doc_navigation_accepts_bytes():
+	"""Test that a navigation document parses bytes as they are and decodes them for output."""
+	nav = EPUBNavDocNavigation(NAV_XML.encode('utf-8'), 'application/xhtml+xml', 'nav.xhtml')
+
+	assert [item.label for item in nav.get_toc_items()] == ['Chapter 1']
+	assert nav.xml_content == NAV_XML
+
+
+def test_nav_dom_wrappers_are_slotted():
+	"""Test that navigation document wrappers do not carry a per-instance __dict__."""
+	nav = EPUBNavDocNavigation(NAV_XML, 'application/xhtml+xml', 'nav.xhtml')
+	nav_doc = NavDocument(nav.tree)
+	toc_nav = nav_doc.toc_nav
+	list_item = toc_nav.ordered_list.list_items[0]
+
+	for wrapper in (nav_doc, toc_nav, toc_nav.ordered_list, list_item, list_item.anchor):
+		assert not hasattr(wrapper, '__dict__')
+
+
+def test_nav_dom_get_all_items_recursive_follows_nested_lists_only():
+	"""Test that only items reached through each item's first nested ol are collected."""
+	nav_xml = """<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
+<body><nav epub:type="toc"><ol>
+	<li><a href="1.xhtml">One</a>
+		<ol><li><a href="1.xhtml#a">One A</a></li></ol>
+		<ol><li><a href="1.xhtml#b">Second list</a></li></ol>
+		<ul><li><a href="1.xhtml#c">Unordered</a></li></ul>
+	</li>
+	<li><a href="2.xhtml">Two</a></li>
+</ol></nav></body></html>"""
+	nav = EPUBNavDocNavigation(nav_xml, 'application/xhtml+xml', 'nav.xhtml')
+	ordered_list = NavDocument(nav.tree).toc_nav.ordered_list
+
+	labels = [item.anchor.text for item in ordered_list.get_all_items_recursive()]
+	assert labels == ['One', 'One A', 'Two']
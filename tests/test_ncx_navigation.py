@@ -1,4 +1,14 @@
+import copy
+import io
+import json
+
+import pytest
+from lxml import etree
+
+from epub_utils.exceptions import ParseError
+from epub_utils.navigation.base import NavigationItem
 from epub_utils.navigation.ncx import NCXNavigation
+from epub_utils.navigation.ncx.dom import NCXDocument, NCXNavLabel
 
 NCX_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1" xml:lang="en">
@@ -22,6 +32,18 @@ NCX_XML = """<?xml version="1.0" encoding="UTF-8"?>
 </ncx>"""
 
 
+@pytest.fixture(scope='module')
+def ncx_tree():
+	"""NCX_XML parsed once per module, as NCXNavigation parses it; never modified."""
+	return NCXNavigation(NCX_XML, 'application/x-dtbncx+xml').tree
+
+
+@pytest.fixture
+def ncx_document(ncx_tree):
+	"""An NCXDocument over a private copy of the parsed NCX_XML, free to edit."""
+	return NCXDocument(copy.deepcopy(ncx_tree))
+
+
 def test_ncx_navigation_initialization():
 	"""Test that the NCXNavigation class initializes correctly."""
 	ncx = NCXNavigation(NCX_XML, 'application/x-dtbncx+xml', 'toc.ncx')
@@ -35,6 +57,98 @@ def test_ncx_navigation_initialization():
 	assert ncx.lang == 'en'
 
 
+def test_ncx_navigation_defers_full_parse():
+	"""Test that only the root attributes are read until the tree is needed."""
+	broken_xml = NCX_XML.replace('</navMap>', '')
+	ncx = NCXNavigation(broken_xml, 'application/x-dtbncx+xml', 'toc.ncx')
+
+	assert ncx.version == '2005-1'
+	assert ncx._tree is None
+
+	with pytest.raises(ParseError):
+		_ = ncx.tree
+
+
+def test_ncx_navigation_invalid_root():
+	"""Test that content without a root element is rejected up front."""
+	with pytest.raises(ParseError):
+		NCXNavigation('not xml', 'application/x-dtbncx+xml', 'toc.ncx')
+
+
+def test_ncx_navigation_with_doctype():
+	"""Test that the standard NCX DOCTYPE parses without fetching the DTD."""
+	doctype = (
+		'<!DOCTYPE ncx PUBLIC "-//NISO//DTD ncx 2005-1//EN" '
+		'"http://www.daisy.org/z3986/2005/ncx-2005-1.dtd">\n'
+	)
+	xml_content = NCX_XML.replace('?>\n', '?>\n' + doctype, 1)
+	ncx = NCXNavigation(xml_content, 'application/x-dtbncx+xml', 'toc.ncx')
+
+	assert [item.label for item in ncx.get_toc_items()] == ['Chapter 1']
+	assert ncx.to_str(pretty_print=True).startswith(
+		'<?xml version="1.0" encoding="UTF-8"?>\n' + doctype + '<ncx '
+	)
+
+
+def test_ncx_navigation_inner_text_refreshes_after_edit():
+	"""Test that cached inner text is rebuilt after the TOC changes."""
+	ncx = NCXNavigation(NCX_XML, 'application/x-dtbncx+xml', 'toc.ncx')
+
+	assert ncx.inner_text == 'Chapter 1'
+	assert ncx.to_plain() is ncx.inner_text
+
+	ncx.update_toc_item('navpoint-1', label='Prologue')
+
+	assert ncx.inner_text == 'Prologue'
+
+
+def test_ncx_navigation_tree_drops_comments():
+	"""Test that comments are left out of the parsed tree but kept in the source."""
+	xml_content = NCX_XML.replace('<navMap>', '<navMap><!-- generated -->', 1)
+	ncx = NCXNavigation(xml_content, 'application/x-dtbncx+xml', 'toc.ncx')
+
+	assert not any(isinstance(node, etree._Comment) for node in ncx.tree.iter())
+	assert '<!-- generated -->' in ncx.to_str()
+
+
+def test_ncx_navigation_tree_drops_indentation():
+	"""Test that whitespace between elements is left out of the parsed tree."""
+	ncx = NCXNavigation(NCX_XML, 'application/x-dtbncx+xml', 'toc.ncx')
+
+	assert all(element.tail is None for element in ncx.tree.iter())
+	assert ncx.tree.text is None
+
+
+def test_ncx_navigation_inner_text_streams_without_tree():
+	"""Test that inner text is read without building the tree, matching the tree path."""
+	minified = (
+		'<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">'
+		'<docTitle><text>Book</text></docTitle><navMap>'
+		'<navPoint id="a"><navLabel><text>One</text></navLabel><content src="1.xhtml"/>'
+		'<navPoint id="b"><navLabel><text>Two</text></navLabel><content src="2.xhtml"/>'
+		'</navPoint></navPoint></navMap></ncx>'
+	)
+	streamed = NCXNavigation(minified, 'application/x-dtbncx+xml', 'toc.ncx')
+	from_tree = NCXNavigation(minified, 'application/x-dtbncx+xml', 'toc.ncx')
+	assert from_tree.tree is not None
+
+	assert streamed.inner_text == 'One Two'
+	assert streamed._tree is None
+	assert from_tree.inner_text == streamed.inner_text
+
+
+def test_ncx_navigation_inner_text_without_nav_map():
+	"""Test that the whole document is used when there is no navMap."""
+	xml_content = (
+		'<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">'
+		'<docTitle><text>Only a title</text></docTitle>'
+		'<docAuthor><text>Someone</text></docAuthor></ncx>'
+	)
+	ncx = NCXNavigation(xml_content, 'application/x-dtbncx+xml', 'toc.ncx')
+
+	assert ncx.inner_text == 'Only a title Someone'
+
+
 def test_ncx_navigation_interface():
 	"""Test the new navigation interface methods."""
 	ncx = NCXNavigation(NCX_XML, 'application/x-dtbncx+xml', 'toc.ncx')
@@ -140,6 +254,28 @@ def test_ncx_navigation_hierarchy():
 	]
 
 
+def test_ncx_navigation_toc_dicts_cached_until_edit():
+	"""Test that the TOC dictionaries are reused until the TOC is edited."""
+	ncx = NCXNavigation(NCX_XML, 'application/x-dtbncx+xml', 'toc.ncx')
+
+	toc_dicts = ncx.get_toc_items_as_dicts()
+	assert ncx.get_toc_items_as_dicts() is toc_dicts
+
+	ncx.update_toc_item('navpoint-1', label='Prologue')
+
+	assert ncx.get_toc_items_as_dicts()[0]['label'] == 'Prologue'
+
+
+def test_ncx_navigation_dump_toc_json():
+	"""Test that the streamed JSON matches the dictionary representation."""
+	ncx = NCXNavigation(NCX_XML, 'application/x-dtbncx+xml', 'toc.ncx')
+	out = io.StringIO()
+
+	ncx.dump_toc_json(out)
+
+	assert json.loads(out.getvalue()) == ncx.get_toc_items_as_dicts()
+
+
 def test_ncx_navigation_editing():
 	"""Test the editing capabilities of the navigation interface."""
 	from epub_utils.navigation.base import NavigationItem
@@ -177,3 +313,244 @@ def test_ncx_navigation_editing():
 	toc_items = ncx.get_toc_items()
 	assert len(toc_items) == 1
 	assert ncx.find_item_by_id('ch2') is None
+
+
+def test_ncx_navigation_accepts_bytes():
+	"""Test that raw bytes are parsed directly and decoded only for output."""
+	ncx = NCXNavigation(NCX_XML.encode('utf-8'), 'application/x-dtbncx+xml', 'toc.ncx')
+
+	assert ncx.version == '2005-1'
+	assert [item.label for item in ncx.get_toc_items()] == ['Chapter 1']
+	assert str(ncx) == NCX_XML
+
+
+def test_ncx_navigation_ids_with_quotes():
+	"""Test that item IDs are passed to XPath as variables, not spliced into the expression."""
+	ncx = NCXNavigation(
+		NCX_XML.replace('navpoint-1', 'say-&quot;hi&quot;'), 'application/x-dtbncx+xml'
+	)
+
+	assert ncx.update_toc_item('say-"hi"', label='Quoted')
+	assert ncx.remove_toc_item('say-"hi"')
+	assert ncx.get_toc_items() == []
+
+
+def test_ncx_navigation_toc_items_without_label_or_content():
+	"""Test that a navPoint missing its label or content converts to empty strings."""
+	xml_content = (
+		'<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1"><navMap>'
+		'<navPoint id="bare" playOrder="1"/>'
+		'</navMap></ncx>'
+	)
+	ncx = NCXNavigation(xml_content, 'application/x-dtbncx+xml', 'toc.ncx')
+
+	(item,) = ncx.get_toc_items()
+	assert item.label == ''
+	assert item.target == ''
+	assert item.order == 1
+
+
+def test_ncx_dom_caches_child_lookups(ncx_document):
+	"""Test that child wrappers are looked up once and refreshed when the setter adds one."""
+	nav_point = ncx_document.nav_map.nav_points[0]
+
+	assert nav_point.nav_label is nav_point.nav_label
+	assert nav_point.label_text == 'Chapter 1'
+
+	label = nav_point.nav_label
+	label.element.remove(label.element[0])
+	label = NCXNavLabel(label.element)
+	assert label.text_element is None
+
+	label.text = 'Prologue'
+
+	assert label.text_element is not None
+	assert nav_point.label_text == 'Prologue'
+
+
+def test_ncx_dom_wrappers_are_slotted(ncx_document):
+	"""Test that NCX wrappers do not carry a per-instance __dict__."""
+	nav_point = ncx_document.nav_map.nav_points[0]
+
+	for wrapper in (
+		ncx_document,
+		ncx_document.nav_map,
+		nav_point,
+		nav_point.nav_label,
+		nav_point.content,
+	):
+		assert not hasattr(wrapper, '__dict__')
+
+
+def test_ncx_dom_iter_nav_points(ncx_document):
+	"""Test that nav points can be iterated lazily and match the list accessor."""
+	nav_map = ncx_document.nav_map
+
+	first = next(nav_map.iter_nav_points())
+
+	assert first.id == 'navpoint-1'
+	assert [p.id for p in nav_map.iter_nav_points()] == [p.id for p in nav_map.nav_points]
+
+
+def test_ncx_dom_meta_map(ncx_document):
+	"""Test that head metadata is read into a single map."""
+	assert ncx_document.meta_map['dtb:uid'] == 'urn:uuid:12345'
+	assert ncx_document.get_uid() == 'urn:uuid:12345'
+	assert ncx_document.get_depth() == 1
+	assert ncx_document.get_total_page_count() == 0
+	assert ncx_document.get_max_page_number() == 0
+
+
+def test_ncx_dom_add_nav_point_builds_subtree(ncx_document):
+	"""Test that an added navPoint carries its label and content and no extra namespace."""
+	nav_map = ncx_document.nav_map
+
+	nav_point = nav_map.add_nav_point('navpoint-2', 'Chapter 2', 'chapter2.xhtml', play_order=2)
+
+	assert nav_point.label_text == 'Chapter 2'
+	assert nav_point.content_src == 'chapter2.xhtml'
+	assert nav_point.play_order == 2
+	assert etree.tostring(nav_point.element, encoding='unicode') == (
+		'<navPoint xmlns="http://www.daisy.org/z3986/2005/ncx/" id="navpoint-2" playOrder="2">'
+		'<navLabel><text>Chapter 2</text></navLabel><content src="chapter2.xhtml"/></navPoint>'
+	)
+	assert 'xmlns' not in etree.tostring(nav_map.element, encoding='unicode').split('>', 1)[1]
+
+
+def test_ncx_dom_iter_all_nav_points():
+	"""Test that all nested navPoints are found in document order."""
+	nested = NCX_XML.replace(
+		'<content src="chapter1.xhtml"/>',
+		'<content src="chapter1.xhtml"/>'
+		'<navPoint id="navpoint-1-1"><navLabel><text>Section</text></navLabel>'
+		'<content src="chapter1.xhtml#s1"/></navPoint>',
+	)
+	ncx = NCXNavigation(nested, 'application/x-dtbncx+xml')
+	nav_map = NCXDocument(ncx.tree).nav_map
+
+	assert next(nav_map.iter_all_nav_points()).id == 'navpoint-1'
+	assert [p.id for p in nav_map.get_all_nav_points()] == ['navpoint-1', 'navpoint-1-1']
+
+
+def test_ncx_navigation_document_is_shared():
+	"""Test that lookups share one DOM wrapper and its cached sections."""
+	ncx = NCXNavigation(NCX_XML, 'application/x-dtbncx+xml', 'toc.ncx')
+
+	document = ncx.document
+	assert ncx.document is document
+	assert document.nav_map is document.nav_map
+
+	ncx.add_toc_item(NavigationItem(id='extra', label='Extra', target='extra.xhtml'))
+	assert ncx.document is document
+	assert [item.id for item in ncx.get_toc_items()][-1] == 'extra'
+
+
+def test_ncx_dom_text_accessors(ncx_document):
+	"""Test that title, author and label text read as strings, empty when missing."""
+	nav_point = ncx_document.nav_map.nav_points[0]
+
+	assert ncx_document.title == 'Sample Book'
+	assert ncx_document.author == ''
+	assert nav_point.label_text == 'Chapter 1'
+	assert nav_point.nav_label.text == 'Chapter 1'
+
+	nav_point.nav_label.text_element.element.text = None
+	assert nav_point.label_text == ''
+	assert nav_point.nav_label.text == ''
+
+
+def test_ncx_dom_empty_int_meta():
+	"""Test that an empty numeric meta reads as None instead of failing to convert."""
+	xml_content = NCX_XML.replace('name="dtb:depth" content="1"', 'name="dtb:depth" content=""')
+	document = NCXDocument(etree.fromstring(xml_content.encode('utf-8')))
+
+	assert document.get_depth() is None
+	assert document.get_total_page_count() == 0
+
+
+def test_ncx_navigation_iter_toc_entries():
+	"""Test that TOC entries stream flat in document order, matching the item tree."""
+	nested = NCX_XML.replace(
+		'<content src="chapter1.xhtml"/>',
+		'<content src="chapter1.xhtml"/>'
+		'<navPoint id="navpoint-1-1"><navLabel><text>Section</text></navLabel>'
+		'<content src="chapter1.xhtml#s1"/></navPoint>',
+	)
+	ncx = NCXNavigation(nested, 'application/x-dtbncx+xml', 'toc.ncx')
+
+	entries = ncx.iter_toc_entries()
+	assert next(entries) == ('Chapter 1', 'chapter1.xhtml')
+	assert list(entries) == [('Section', 'chapter1.xhtml#s1')]
+	assert list(NCXNavigation('<ncx/>', 'application/x-dtbncx+xml').iter_toc_entries()) == []
+
+
+def test_ncx_dom_stream_toc_entries():
+	"""Test that streamed entries carry depth and playOrder, in document order."""
+	xml_content = (
+		'<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1"><navMap>'
+		'<navPoint id="a" playOrder="1"><navLabel><text>A</text></navLabel><content src="a.xhtml"/>'
+		'<navPoint id="a1"><navLabel><text>A.1</text></navLabel></navPoint></navPoint>'
+		'<navPoint id="b" playOrder="3"><navLabel><text>B</text></navLabel><content src="b.xhtml"/>'
+		'</navPoint></navMap><pageList><pageTarget><content src="p.xhtml"/></pageTarget>'
+		'</pageList></ncx>'
+	)
+
+	entries = list(NCXDocument.stream_toc_entries(io.BytesIO(xml_content.encode('utf-8'))))
+
+	assert entries == [('A', 'a.xhtml', 1, 0), ('A.1', '', None, 1), ('B', 'b.xhtml', 3, 0)]
+
+
+def test_ncx_navigation_iter_toc_entries_streams_without_tree():
+	"""Test that TOC entries are streamed before the tree is built and match the tree path."""
+	streamed = NCXNavigation(NCX_XML, 'application/x-dtbncx+xml', 'toc.ncx')
+	from_tree = NCXNavigation(NCX_XML, 'application/x-dtbncx+xml', 'toc.ncx')
+	assert from_tree.tree is not None
+
+	assert list(streamed.iter_toc_entries()) == [('Chapter 1', 'chapter1.xhtml')]
+	assert streamed._tree is None
+	assert list(from_tree.iter_toc_entries()) == list(streamed.iter_toc_entries())
+
+
+def test_ncx_navigation_iter_toc_entries_expands_internal_entities():
+	"""Test that streamed and tree-built TOC entries both expand internal entities."""
+	entity_xml = (
+		'<!DOCTYPE ncx [<!ENTITY foo "FOO">]>'
+		'<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1"><navMap>'
+		'<navPoint id="a"><navLabel><text>A &foo; B</text></navLabel><content src="a.xhtml"/>'
+		'</navPoint></navMap></ncx>'
+	)
+	streamed = NCXNavigation(entity_xml, 'application/x-dtbncx+xml', 'toc.ncx')
+	from_tree = NCXNavigation(entity_xml, 'application/x-dtbncx+xml', 'toc.ncx')
+	assert from_tree.tree is not None
+
+	assert list(streamed.iter_toc_entries()) == [('A FOO B', 'a.xhtml')]
+	assert list(from_tree.iter_toc_entries()) == [('A FOO B', 'a.xhtml')]
+
+
+def test_ncx_navigation_inner_text_expands_internal_entities():
+	"""Test that streamed and tree-built inner text both expand internal entities."""
+	entity_xml = (
+		'<!DOCTYPE ncx [<!ENTITY foo "FOO">]>'
+		'<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1"><navMap>'
+		'<navPoint id="a"><navLabel><text>A &foo; B</text></navLabel><content src="a.xhtml"/>'
+		'</navPoint></navMap></ncx>'
+	)
+	streamed = NCXNavigation(entity_xml, 'application/x-dtbncx+xml', 'toc.ncx')
+	from_tree = NCXNavigation(entity_xml, 'application/x-dtbncx+xml', 'toc.ncx')
+	assert from_tree.tree is not None
+
+	assert streamed.inner_text == 'A FOO B'
+	assert from_tree.inner_text == 'A FOO B'
+	assert from_tree.get_toc_items()[0].label == 'A FOO B'
+
+
+def test_ncx_element_attribute_access(ncx_document):
+	"""Test generic attribute access on NCX wrappers."""
+	nav_point = ncx_document.nav_map.nav_points[0]
+
+	assert nav_point.get_attribute('id') == nav_point.id
+	assert nav_point.get_attribute('missing') is None
+
+	nav_point.set_attribute('class', 'h1')
+	assert nav_point.get_attribute('class') == 'h1'
+	assert nav_point.class_attr == 'h1'
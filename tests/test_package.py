@@ -99,6 +99,18 @@ def test_package_initialization():
 	assert package.metadata.identifier == '12345'
 
 
+def test_package_sections_serialized_on_demand():
+	"""
+	Test that the metadata, manifest and spine XML is still available when read from the tree.
+	"""
+	package = Package(VALID_OPF_XML)
+	assert package.manifest.find_by_id('nav')['href'] == 'nav.xhtml'
+	assert package.spine.find_by_idref('nav') is not None
+	assert '<dc:title>Sample EPUB</dc:title>' in str(package.metadata)
+	assert str(package.manifest).startswith('<manifest xmlns="http://www.idpf.org/2007/opf">')
+	assert '<itemref idref="nav"/>' in str(package.spine)
+
+
 def test_package_invalid_xml():
 	with pytest.raises(InvalidEPUBError) as excinfo:
 		Package(INVALID_OPF_XML_MISSING_METADATA)
@@ -112,6 +124,12 @@ def test_epub3():
 	assert package.nav_href == 'nav.xhtml'
 
 
+def test_epub3_nav_among_several_properties():
+	xml_content = VALID_OPF_XML.replace('properties="nav"', 'properties="scripted nav"')
+	package = Package(xml_content)
+	assert package.nav_href == 'nav.xhtml'
+
+
 def test_epub3_without_toc():
 	package = Package(VALID_EPUB3_XML_WITHOUT_TOC)
 	assert package.version.public == '3.0'
@@ -119,6 +137,16 @@ def test_epub3_without_toc():
 	assert not package.nav_href
 
 
+def test_epub3_guide_toc_fallback():
+	xml_content = VALID_EPUB3_XML_WITHOUT_TOC.replace(
+		'</package>',
+		'<guide><reference type="cover" href="cover.xhtml"/>'
+		'<reference type="toc" href="toc.xhtml#start"/></guide></package>',
+	)
+	package = Package(xml_content)
+	assert package.nav_href == 'toc.xhtml'
+
+
 def test_epub2():
 	package = Package(VALID_EPUB2_XML)
 	assert package.version.public == '2.0'
@@ -126,6 +154,14 @@ def test_epub2():
 	assert package.toc_href == 'toc.ncx'
 
 
+def test_epub2_spine_toc_fallback():
+	xml_content = VALID_EPUB2_XML.replace(
+		'media-type="application/x-dtbncx+xml"', 'media-type="application/xml"'
+	)
+	package = Package(xml_content)
+	assert package.toc_href == 'toc.ncx'
+
+
 def test_epub2_without_toc():
 	package = Package(VALID_EPUB2_XML_WITHOUT_TOC)
 	assert package.version.public == '2.0'
@@ -146,6 +182,12 @@ def test_invalid_version():
 	assert 'EPUB version 4.x is not supported (EPUB 4.0 format)' in str(excinfo.value)
 
 
+def test_invalid_version_rejected_before_parse():
+	truncated = INVALID_VERSION.replace('</package>', '<unclosed>')
+	with pytest.raises(UnsupportedFormatError):
+		Package(truncated)
+
+
 @pytest.mark.parametrize(
 	'xml_content,pretty_print,expected',
 	[
@@ -166,3 +208,37 @@ def test_package_to_str_pretty_print_parameter(xml_content, pretty_print, expect
 	package = Package(xml_content)
 
 	assert package.to_str(pretty_print=pretty_print) == expected
+
+
+def test_version_parse_is_shared():
+	first = Package(VALID_OPF_XML)
+	second = Package(VALID_OPF_XML)
+	assert first.version is second.version
+
+
+def test_package_accepts_bytes():
+	package = Package(VALID_OPF_XML.encode('utf-8'))
+	assert package.nav_href == 'nav.xhtml'
+	assert package.metadata.title == 'Sample EPUB'
+	assert str(package) == VALID_OPF_XML
+
+
+def test_package_with_doctype():
+	xml_content = VALID_EPUB2_XML.replace(
+		'<package',
+		'<!DOCTYPE package PUBLIC "+//ISBN 0-9673008-1-9//DTD OEB 1.2 Package//EN" '
+		'"http://openebook.org/dtds/oeb-1.2/oebpkg12.dtd">\n<package',
+		1,
+	)
+	package = Package(xml_content)
+	assert package.toc_href == 'toc.ncx'
+
+
+def test_package_expands_internal_entities():
+	"""Test that entities declared in the OPF file are expanded in metadata values."""
+	xml_content = VALID_OPF_XML.replace(
+		'<?xml version="1.0"?>', '<?xml version="1.0"?>\n<!DOCTYPE package [<!ENTITY foo "FOO">]>'
+	).replace('Sample EPUB', 'A &foo; B')
+	package = Package(xml_content)
+
+	assert package.metadata.title == 'A FOO B'
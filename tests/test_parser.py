@@ -0,0 +1,20 @@
+import threading
+
+from epub_utils.parser import get_parser
+
+
+def test_parser_is_reused_within_a_thread():
+	"""Test that a parser is built once per thread and set of options."""
+	assert get_parser() is get_parser()
+	assert get_parser(remove_blank_text=True) is get_parser(remove_blank_text=True)
+	assert get_parser(remove_blank_text=True) is not get_parser()
+
+
+def test_parser_is_not_shared_between_threads():
+	"""Test that each thread gets its own parser."""
+	parsers = []
+	thread = threading.Thread(target=lambda: parsers.append(get_parser()))
+	thread.start()
+	thread.join()
+
+	assert parsers[0] is not get_parser()
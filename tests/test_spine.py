@@ -47,6 +47,18 @@ def test_minimal_spine():
 	assert spine.itemrefs[0]['properties'] == []
 
 
+def test_find_by_idref():
+	spine = Spine(VALID_SPINE_XML)
+
+	assert spine.find_by_idref('chapter1')['properties'] == ['page-spread-left']
+	assert spine.find_by_idref('missing') is None
+
+
+def test_idrefs():
+	spine = Spine(VALID_SPINE_XML)
+	assert spine.idrefs() == ['cover', 'nav', 'chapter1', 'chapter2']
+
+
 @pytest.mark.parametrize(
 	'xml_content,pretty_print,expected',
 	[
@@ -67,3 +79,28 @@ def test_spine_to_str_pretty_print_parameter(xml_content, pretty_print, expected
 	spine = Spine(xml_content)
 
 	assert spine.to_str(pretty_print=pretty_print) == expected
+
+
+def test_spine_to_xml_is_cached():
+	"""Test that rendered XML is reused while the XML content stays the same."""
+	spine = Spine(VALID_SPINE_XML)
+
+	highlighted = spine.to_xml(pretty_print=True)
+	assert spine.to_xml(pretty_print=True) is highlighted
+	assert spine.to_xml(pretty_print=True, highlight_syntax=False) is not highlighted
+
+
+def test_spine_is_slotted():
+	"""Test that a spine does not carry a per-instance __dict__."""
+	spine = Spine(VALID_SPINE_XML)
+
+	assert not hasattr(spine, '__dict__')
+	assert spine.find_by_idref('chapter2')['idref'] == 'chapter2'
+
+
+def test_spine_accepts_bytes():
+	"""Test that a spine parses bytes as they are and decodes them only for output."""
+	spine = Spine(VALID_SPINE_XML.encode('utf-8'))
+
+	assert [itemref['idref'] for itemref in spine.itemrefs][:2] == ['cover', 'nav']
+	assert spine.xml_content == VALID_SPINE_XML
@@ -1,6 +1,7 @@
 import pytest
 
 from epub_utils.content.xhtml import XHTMLContent
+from epub_utils.exceptions import ParseError
 
 
 def test_simple_paragraph():
@@ -58,3 +59,82 @@ def test_to_str_pretty_print_parameter(xml_content, pretty_print, expected):
 	content = XHTMLContent(xml_content, 'application/xhtml+xml', 'test.xhtml')
 
 	assert content.to_str(pretty_print=pretty_print) == expected
+
+
+def test_bytes_content_is_decoded_on_demand():
+	"""Test that raw bytes are parsed directly and decoded only for output."""
+	xml_content = '<html xmlns="http://www.w3.org/1999/xhtml"><body><p>Café</p></body></html>'
+
+	content = XHTMLContent(xml_content.encode('utf-8'), 'application/xhtml+xml', 'test.xhtml')
+
+	assert content.inner_text == 'Café'
+	assert content.to_str() == xml_content
+
+
+def test_inner_text_collapses_whitespace_across_elements():
+	"""Test whitespace normalization across inline elements and text nodes."""
+	xml_content = """<html xmlns="http://www.w3.org/1999/xhtml">
+    <head><title>Ignored</title></head>
+    <body>
+        <p>Split<em>word</em> and   <b> spaced </b>words.</p>
+        <p>
+            Next paragraph.
+        </p>
+    </body>
+</html>"""
+
+	content = XHTMLContent(xml_content, 'application/xhtml+xml', 'test.xhtml')
+
+	assert content.inner_text == 'Splitword and spaced words. Next paragraph.'
+
+
+def test_external_entities_are_not_resolved(tmp_path):
+	"""Test that content documents cannot pull in external entities."""
+	secret = tmp_path / 'secret.txt'
+	secret.write_text('leaked')
+	xml_content = f"""<?xml version="1.0"?>
+<!DOCTYPE html [<!ENTITY ext SYSTEM "{secret.as_uri()}">]>
+<html xmlns="http://www.w3.org/1999/xhtml"><body><p>Hello &ext;</p></body></html>"""
+
+	try:
+		content = XHTMLContent(xml_content, 'application/xhtml+xml', 'test.xhtml')
+	except ParseError as e:
+		# Recent libxml2 refuses the reference instead of leaving it unresolved
+		assert 'leaked' not in str(e)
+	else:
+		assert 'leaked' not in content.inner_text
+		assert content.inner_text.startswith('Hello')
+
+
+@pytest.mark.parametrize(
+	'html_open',
+	['<html xmlns="http://www.w3.org/1999/xhtml">', '<html>'],
+)
+def test_inner_text_reads_body_with_or_without_namespace(html_open):
+	"""Test that only the body text is used, whether or not the XHTML namespace is declared."""
+	xml_content = (
+		f'{html_open}<head><title>Skipped</title></head>'
+		'<body><p>Kept <em>text</em></p></body></html>'
+	)
+	content = XHTMLContent(xml_content, 'application/xhtml+xml', 'test.xhtml')
+
+	assert content.inner_text == 'Kept text'
+
+
+def test_internal_entities_are_expanded():
+	"""Test that entities declared in the internal DTD subset are expanded in the text."""
+	xml_content = """<?xml version="1.0"?>
+<!DOCTYPE html [<!ENTITY foo "FOO">]>
+<html xmlns="http://www.w3.org/1999/xhtml"><body><p>x &foo; y</p></body></html>"""
+
+	content = XHTMLContent(xml_content, 'application/xhtml+xml', 'test.xhtml')
+
+	assert content.inner_text == 'x FOO y'
+
+
+def test_inner_text_reads_prefixed_body_in_other_namespace():
+	"""Test that a body is found by local name whatever namespace it is in."""
+	xml_content = '<h:html xmlns:h="urn:other"><h:body>other ns</h:body><x>outside</x></h:html>'
+	content = XHTMLContent(xml_content, 'application/xhtml+xml', 'test.xhtml')
+
+	assert content.inner_text == 'other ns'